@@ -1,8 +1,11 @@
+import copy
 from collections.abc import Mapping
 from cuemsutils.log import Logger
 from ..helpers import ensure_items
 from .Cue import Cue, CuemsDict
 from .CueOutput import DmxCueOutput
+from ..tools.DmxBuffer import DEFAULT_REFRESH_RATE, DMX_CHANNELS, DmxBuffer
+from ..tools.DmxCompiler import CompiledDmx, compile_dmx_cue
 
 REQ_ITEMS = {
     'fadein_time': 0.0,
@@ -224,22 +227,86 @@ class DmxCue(Cue):
             Logger.warning(f'DmxCue {self.id}: No node UUID found in settings')
             return True
         
-        # Check each output
-        if self.outputs:
-            for output in self.outputs:
-                # For DMX cues, output_name is just the node UUID (not {node_uuid}_{output_name})
-                output_name = output.get('output_name', '')
-                
-                # Compare entire output_name with current node UUID
-                if output_name == current_node_uuid:
-                    self._local = True
-                    Logger.debug(
-                        f'DmxCue {self.id} output_name {output_name} matches current node, setting _local=True'
-                    )
-                    break  # Found a match, no need to check other outputs
+        if self.local_outputs(current_node_uuid):
+            self._local = True
+            Logger.debug(
+                f'DmxCue {self.id} output_name {current_node_uuid} matches current node, setting _local=True'
+            )
         
         return True
     
+    def local_outputs(self, node_uuid):
+        """Get the outputs that target a node.
+
+        For DMX cues the output_name is just the node UUID (not
+        {node_uuid}_{output_name}), so an output is local when its whole
+        output_name equals ``node_uuid``.
+
+        Args:
+            node_uuid (str): The node UUID.
+
+        Returns:
+            list: The matching DmxCueOutput items.
+        """
+        if not node_uuid or not self.outputs:
+            return []
+        return [o for o in self.outputs if o.get('output_name', '') == node_uuid]
+
+    def localize_cue(self, node_id: str) -> None:
+        """Set the _local attribute to True if any output targets the given node UUID.
+
+        Args:
+            node_id: The ID of the node to localize the cue to.
+        """
+        self._local = bool(self.local_outputs(node_id))
+
+    def precompile(self, node_uuid, refresh_rate=DEFAULT_REFRESH_RATE, curve='linear', from_frames=None):
+        """Compile the cue into the frames to send from a node.
+
+        The result is kept in ``compiled_output`` until the scene, the
+        outputs or the fade times change, including edits to the
+        universe's channels.
+
+        Args:
+            node_uuid (str): The node to compile for.
+            refresh_rate (float): Frames per second during fades.
+            curve: Fade curve of the channel crossfades.
+            from_frames (dict, optional): ``{universe_num: frame}`` the fade-in starts from.
+
+        Returns:
+            CompiledDmx: Timed ``(timestamp, universe, frame)`` entries for
+                the fade-in and the fade-out; empty when no output is local.
+
+        Raises:
+            ValueError: If a fade time, the refresh rate or the curve is invalid.
+        """
+        compiled = compile_dmx_cue(self, node_uuid, refresh_rate, curve, from_frames)
+        self._compiled_output = (self.DmxScene.DmxUniverse, self._output_fingerprint(), compiled)
+        return compiled
+
+    @property
+    def compiled_output(self) -> CompiledDmx | None:
+        """Output compiled by ``precompile``, or ``None`` if not compiled since the last change."""
+        cached = getattr(self, '_compiled_output', None)
+        if cached is None:
+            return None
+        universe, fingerprint, compiled = cached
+        if universe is not self.DmxScene.DmxUniverse or fingerprint != self._output_fingerprint():
+            return None
+        return compiled
+
+    def _output_fingerprint(self):
+        """What ``precompile`` read, besides the universe object itself."""
+        universe = self.DmxScene.DmxUniverse
+        outputs = tuple(o.get('output_name', '') for o in self.outputs or ())
+        return (
+            self.fadein_time,
+            self.fadeout_time,
+            outputs,
+            universe.universe_num,
+            universe.buffer.version,
+        )
+
     def items(self):
         """Get all items in the cue as a dictionary.
         
@@ -321,7 +388,17 @@ class DmxScene(CuemsDict):
     #     super().__getitem__(num).update(universe)
 
 class DmxUniverse(CuemsDict):
-    """A class representing a DMX universe containing multiple channels."""
+    """A class representing a DMX universe containing multiple channels.
+
+    Channel levels live in a :class:`~cuemsutils.tools.DmxBuffer.DmxBuffer`
+    (``buffer``): 512 bytes plus a mask of the channels the scene sets.
+    ``dmx_channels`` is the ``DmxChannel`` list of the set channels, the
+    form the XML script uses; every read of the universe as a dict rebuilds
+    it if the buffer changed since. Write levels through the buffer,
+    :meth:`set_slice` or the ``dmx_channels`` setter; editing a
+    ``DmxChannel`` of the list does not change the buffer. Copies get
+    their own buffer.
+    """
     
     def __init__(self, init_dict=None):
         """Initialize a DMX universe.
@@ -330,6 +407,8 @@ class DmxUniverse(CuemsDict):
             init_dict (dict, optional): Dictionary containing initialization values.
                 If provided, will be used to create DMX channels.
         """
+        self._buffer = DmxBuffer()
+        self._channels_version = -1
         if not init_dict:
             init_dict = UNIVERSE_REQ_ITEMS
         else:
@@ -355,42 +434,129 @@ class DmxUniverse(CuemsDict):
     universe_num = property(get_universe_num, set_universe_num)
 
     def get_dmx_channels(self):
-        """Get the dmx channel for the scene.
+        """Get the dmx channels set in the universe.
         
         Returns:
-            list: The list of dmx channels.
+            list: The ``DmxChannel`` items of the set channels, in channel order.
         """
+        self._sync_channels()
         return super().__getitem__('dmx_channels')
 
     def set_dmx_channels(self, channels):
-        """Set the output routing configuration.
+        """Set the universe channels, replacing the current ones.
         
         Args:
-            channels (list): The list of output configurations.
-        """
-        Logger.info("DmxUniverse set_channels called with channels: {}".format(channels))
-        if not isinstance(channels, list):
-            channels = [channels]
-        channel_list = []
-        Logger.debug(f'Channels to process: {channels} Type: {type(channels)}')
-        try:
-            for r in channels:
-                    if r is not None:
-                        Logger.debug(f'Processing channel: {r}')
-                        if not isinstance(r, DmxChannel):
-                            Logger.debug(f"Converting to DmxChannel: {r['DmxChannel']}")
-                            new_dmxchannel = DmxChannel(r['DmxChannel'])
-                            channel_list.append(new_dmxchannel)
-                            super().__setitem__('dmx_channels', channel_list)
-                        else:
-                            super().__setitem__('dmx_channels', channels)
-        except Exception as e:
-            Logger.error(f"Error converting channels to DmxChannel: {e}")
-            super().__setitem__('dmx_channels', channels)
-        
+            channels (list): ``DmxChannel`` items, ``{'channel', 'value'}``
+                dicts or ``{'DmxChannel': {...}}`` dicts as read from XML.
+                ``None`` clears the universe.
+
+        Raises:
+            IndexError: If a channel number is outside 0-511.
+            ValueError: If a value is outside 0-255.
+        """
+        self._buffer.clear()
+        self._buffer.update(_channel_pairs(channels))
+        self._sync_channels()
 
     dmx_channels = property(get_dmx_channels, set_dmx_channels)
 
+    @property
+    def buffer(self):
+        """The universe's :class:`~cuemsutils.tools.DmxBuffer.DmxBuffer`."""
+        return self._buffer
+
+    def get_slice(self, start=0, stop=DMX_CHANNELS):
+        """Get the levels of channels ``start`` to ``stop - 1``.
+
+        Returns:
+            bytes: One level per channel, unset channels as 0.
+        """
+        return self._buffer[start:stop]
+
+    def set_slice(self, start, values):
+        """Set consecutive channels from ``start`` to the given levels.
+
+        Args:
+            start (int): First channel number.
+            values (bytes or list): One level (0-255) per channel.
+        """
+        self._buffer[start:start + len(values)] = values
+        self._sync_channels()
+
+    def frame(self):
+        """Get the 512 channel levels ready to send.
+
+        Returns:
+            bytes: The universe frame, unset channels as 0.
+        """
+        return self._buffer.frame()
+
+    def _sync_channels(self):
+        """Rebuild ``dmx_channels`` if the buffer changed since it was built."""
+        if self._channels_version != self._buffer.version:
+            super().__setitem__('dmx_channels', [
+                DmxChannel({'channel': channel, 'value': value})
+                for channel, value in self._buffer.items()
+            ])
+            self._channels_version = self._buffer.version
+
+    # dict reads go through these, so they never see a stale channel list;
+    # overriding __iter__ also makes dict(universe) use keys() and __getitem__
+    def __getitem__(self, key):
+        self._sync_channels()
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self._sync_channels()
+        return super().get(key, default)
+
+    def __iter__(self):
+        self._sync_channels()
+        return super().__iter__()
+
+    def items(self):
+        """Get all items in the universe, with ``dmx_channels`` up to date."""
+        self._sync_channels()
+        return super().items()
+
+    def values(self):
+        self._sync_channels()
+        return super().values()
+
+    def copy(self):
+        return self.__copy__()
+
+    def __copy__(self):
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._buffer = self._buffer.copy()
+        new._channels_version = -1
+        dict.update(new, dict.items(self))
+        new._sync_channels()
+        return new
+
+    def __deepcopy__(self, memo):
+        # The channel list of the copy is already built from its own buffer
+        new = self.__copy__()
+        memo[id(self)] = new
+        for key, value in dict.items(new):
+            if key != 'dmx_channels':
+                dict.__setitem__(new, key, copy.deepcopy(value, memo))
+        return new
+
+    def __eq__(self, other):
+        if isinstance(other, DmxUniverse):
+            return self.universe_num == other.universe_num and self._buffer == other._buffer
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
 
     # def setall(self, value):
     #     """Set all channels in the universe to the same value.
@@ -478,3 +644,21 @@ class DmxChannel(CuemsDict):
             dict: A dictionary representation of the region.
         """
         return {type(self).__name__: dict(self.items())}
+
+
+def _channel_pairs(channels):
+    """Yield ``(channel, value)`` from the forms ``dmx_channels`` accepts."""
+    if channels is None:
+        return
+    if not isinstance(channels, list):
+        channels = [channels]
+    for item in channels:
+        if item is None:
+            continue
+        if 'DmxChannel' in item:
+            # XML converter may produce a list of dicts for the inner value
+            inner = item['DmxChannel']
+            for channel in inner if isinstance(inner, list) else [inner]:
+                yield int(channel['channel']), int(channel['value'])
+        else:
+            yield int(item['channel']), int(item['value'])
@@ -4,6 +4,8 @@ from .Cue import Cue
 from .FadeProfile import FadeProfile
 from ..helpers import CuemsDict, ensure_items, format_timecode
 from ..tools.CTimecode import CTimecode
+from ..tools.FadeCompiler import CompiledFades, compile_media_fades
+from ..tools.TimecodeCache import parse_timecode
 from ..tools.Uuid import Uuid
 
 REQ_ITEMS = {
@@ -201,7 +203,7 @@ class Media(CuemsDict):
             return
         if isinstance(duration, str):
             try:
-                canonical = str(CTimecode(duration))
+                canonical = str(parse_timecode(duration))
             except Exception as e:
                 raise ValueError(f"Invalid media duration {duration!r}: {e}")
             super().__setitem__('duration', canonical)
@@ -289,6 +291,7 @@ class MediaCue(Cue):
         if not isinstance(value, Media):
             value = Media(value)
         super().__setitem__('Media', value)
+        self._compiled_fades = None
 
     media: Media = property(get_Media, set_Media)
 
@@ -314,6 +317,7 @@ class MediaCue(Cue):
         return super().__getitem__('fade_profiles')
 
     def set_fade_profiles(self, value):
+        self._compiled_fades = None
         if value is None:
             super().__setitem__('fade_profiles', None)
             return
@@ -360,6 +364,30 @@ class MediaCue(Cue):
                 return fp
         return None
 
+    def arm_fades(self, fade_in=None, fade_out=None, framerate='ms') -> CompiledFades:
+        """Compile the fade profiles into ready-to-play envelopes.
+
+        Resolves ``function_id`` and parameters once and places the fades on
+        the playback window (region in/out, else ``Media.duration``). The
+        result is kept in ``compiled_fades`` until the fade profiles or the
+        media are replaced; call again after editing them in place.
+
+        Args:
+            fade_in: Fade-in length in ms or as a timecode.
+            fade_out: Fade-out length in ms or as a timecode.
+            framerate: Framerate the envelope steps are snapped to.
+
+        Raises:
+            ValueError: See ``compile_media_fades``.
+        """
+        self._compiled_fades = compile_media_fades(self, fade_in, fade_out, framerate)
+        return self._compiled_fades
+
+    @property
+    def compiled_fades(self) -> CompiledFades | None:
+        """Fades compiled by ``arm_fades``, or ``None`` if not armed since the last change."""
+        return getattr(self, '_compiled_fades', None)
+
     def get_all_output_names(self) -> list[Tuple[str, str]]:
         """Get all output names splitted into node and output ids for the media cue.
         Returns:
@@ -6,13 +6,25 @@ from typing import Any
 from collections.abc import ItemsView, KeysView
 from xml.etree.ElementTree import Element, SubElement
 
+from .registry import CLASS_REGISTRY, auto_register
 from .tools.CTimecode import CTimecode
+from .tools.TimecodeCache import parse_timecode
 from .tools.Uuid import Uuid
 
 DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+_register_class = auto_register(CLASS_REGISTRY)
+
 class CuemsDict(dict):
-    """Custom dictionary class to handle cuemsutils specific items."""
+    """Custom dictionary class to handle cuemsutils specific items.
+
+    Subclasses register themselves in ``CLASS_REGISTRY`` under their class
+    name, which is how the xml parsers resolve a tag to a class.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _register_class(cls)
 
     def build(self, parent: Element):
         build_xml_dict(self, parent)
@@ -117,13 +129,15 @@ def format_timecode(value):
         elif isinstance(value, (int, float)):
             return CTimecode(start_seconds=value)
         elif isinstance(value, str):
-            return CTimecode(value)
+            return parse_timecode(value)
         elif isinstance(value, dict):
             dict_timecode = value.pop('CTimecode', None)
             if dict_timecode is None:
                 return CTimecode()
             elif isinstance(dict_timecode, int):
                 return CTimecode(start_seconds = dict_timecode)
+            elif isinstance(dict_timecode, str):
+                return parse_timecode(dict_timecode)
             else:
                 return CTimecode(dict_timecode)
         else:
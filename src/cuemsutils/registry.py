@@ -0,0 +1,129 @@
+"""Type registries used to dispatch XML tags and objects to classes.
+
+Three registries replace the old ``globals()`` lookups:
+
+- ``CLASS_REGISTRY``: tag name -> object class (``AudioCue``, ``Media``,
+  ``CTimecode``...). Every ``CuemsDict`` subclass registers itself.
+- ``PARSER_REGISTRY``: tag name -> parser class. Every ``CuemsParser``
+  subclass named ``<tag>Parser`` registers itself.
+- ``BUILDER_REGISTRY``: class name -> xml builder class. Every
+  ``XmlBuilder`` subclass named ``<Class>XmlBuilder`` registers itself.
+
+Plugin cue types only need to subclass ``Cue`` (or any cue class) to be
+parsed and built; ``register_cue_type`` attaches a dedicated parser or
+builder without touching ``Parsers.py`` or ``XmlBuilder.py``.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+
+class TypeRegistry:
+    """Name to class mapping with constant-time lookup.
+
+    Automatic self-registration (``replace=False``) never overrides an
+    existing entry, so a same-named subclass defined elsewhere does not
+    silently take over dispatch. Explicit registration replaces by default.
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._types: dict[str, type] = {}
+        self._resolved: dict[type, type | None] = {}
+
+    def register(self, name: str, cls: type | None = None, replace: bool = True):
+        """Register ``cls`` under ``name``. Usable as a decorator when ``cls`` is omitted."""
+        if cls is None:
+            def decorator(c: type) -> type:
+                self.register(name, c, replace=replace)
+                return c
+            return decorator
+        if not replace and name in self._types:
+            return cls
+        self._types[name] = cls
+        self._resolved.clear()
+        return cls
+
+    def unregister(self, name: str) -> None:
+        self._types.pop(name, None)
+        self._resolved.clear()
+
+    def get(self, name: str, default: type | None = None) -> type | None:
+        return self._types.get(name, default)
+
+    def resolve(self, cls: type, default: type | None = None) -> type | None:
+        """Return the entry for ``cls`` or its nearest registered ancestor.
+
+        Lookups walk the MRO by class name once per type and are cached
+        until the registry changes.
+        """
+        try:
+            found = self._resolved[cls]
+        except KeyError:
+            found = None
+            for base in cls.__mro__:
+                found = self._types.get(base.__name__)
+                if found is not None:
+                    break
+            self._resolved[cls] = found
+        return default if found is None else found
+
+    def names(self) -> list[str]:
+        return sorted(self._types)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._types
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __repr__(self) -> str:
+        return f"<TypeRegistry {self.kind}: {len(self._types)} entries>"
+
+
+CLASS_REGISTRY = TypeRegistry('class')
+PARSER_REGISTRY = TypeRegistry('parser')
+BUILDER_REGISTRY = TypeRegistry('builder')
+
+
+def register_cue_type(
+    cue_class: type,
+    name: str | None = None,
+    parser: type | None = None,
+    builder: type | None = None,
+) -> type:
+    """Register a plugin cue type, and optionally its parser and builder.
+
+    ``Cue`` subclasses are already registered under their class name; use
+    this to register them under a different tag, or to attach a dedicated
+    parser/builder. Without one, the cue is parsed by ``GenericParser`` and
+    built by the builder of its nearest registered ancestor.
+
+    Args:
+        cue_class: The cue class to register.
+        name: The XML tag to register it under. Defaults to the class name.
+        parser: Parser class to use for that tag.
+        builder: Builder class to use for instances of ``cue_class``.
+
+    Returns:
+        The registered class, so it can be used as a decorator.
+    """
+    name = name or cue_class.__name__
+    CLASS_REGISTRY.register(name, cue_class)
+    if parser is not None:
+        PARSER_REGISTRY.register(name, parser)
+    if builder is not None:
+        BUILDER_REGISTRY.register(cue_class.__name__, builder)
+    return cue_class
+
+
+def auto_register(registry: TypeRegistry, suffix: str = '') -> Callable[[type], None]:
+    """Build an ``__init_subclass__`` body registering ``<name><suffix>`` classes."""
+    def _register(cls: type) -> None:
+        name = cls.__name__
+        if suffix:
+            if not name.endswith(suffix) or name == suffix:
+                return
+            name = name[:-len(suffix)]
+        registry.register(name, cls, replace=False)
+    return _register
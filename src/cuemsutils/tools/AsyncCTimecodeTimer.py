@@ -0,0 +1,148 @@
+"""asyncio variant of the quarter-frame timer.
+
+``CTimecodeTimer`` ticks on its own thread, so a callback that wants to put a
+message on the bus (``NngBusHub``, ``NngRequestResponse``) has to hop back
+onto the event loop. ``AsyncCTimecodeTimer`` runs its ticks as a task on the
+running loop instead, and accepts plain or ``async def`` callbacks.
+
+It is a ``CTimecodeTimer``: params, ``start_timecode`` lookup, deadline
+scheduling, catch-up policy, seek handling and the
+``IDLE → RUNNING → STOPPED/EXHAUSTED`` state machine are shared; only where
+ticks run differs.
+
+Coroutine callbacks are started as tasks so a slow send never delays the
+next tick. At most ``max_concurrency`` of them are in flight; a tick that
+finds the limit reached is dropped and counted in
+:attr:`AsyncCTimecodeTimer.dropped` (and ``stats``) — for fades only the newest value
+matters, and queueing stale ones would only add latency.
+
+Wake-ups go through the event loop's selector, whose resolution is about a
+millisecond; at the ``'ms'`` framerate (0.25 ms quarter-frames) ticks are
+therefore served in back-to-back bursts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+
+from cuemsutils.log import Logger
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.CTimecodeTimer import CatchUp, CTimecodeTimer
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.ParamSource import ParamSource
+from cuemsutils.tools.TimecodeClock import TimecodeClock
+
+
+class AsyncCTimecodeTimer(CTimecodeTimer):
+    """Quarter-frame timer driven by the running asyncio event loop."""
+
+    def __init__(
+        self,
+        timecode: CTimecode | TimecodeClock,
+        params: list[tuple] | ParamSource | None = None,
+        start_timecode: CTimecode | FastTimecode | None = None,
+        max_concurrency: int = 1,
+        catch_up: CatchUp | str = CatchUp.STRICT,
+    ) -> None:
+        super().__init__(timecode, params, start_timecode, catch_up)
+        if max_concurrency < 1:
+            raise ValueError(
+                "AsyncCTimecodeTimer: max_concurrency must be >= 1"
+            )
+        self._max_concurrency = max_concurrency
+        self._task: asyncio.Task | None = None
+        self._pending: set[asyncio.Future] = set()
+
+    # ── Public interface ────────────────────────────────────────────────
+
+    @property
+    def dropped(self) -> int:
+        """Ticks skipped because ``max_concurrency`` callbacks were running."""
+        return self._stats.dropped
+
+    def start(self) -> None:
+        """Start ticking on the running event loop.
+
+        Raises:
+            RuntimeError: If called outside a running event loop.
+        """
+        asyncio.get_running_loop()
+        super().start()
+
+    async def join(self) -> None:
+        """Wait until the timer stops or exhausts and callbacks have finished."""
+        if self._task is not None:
+            await asyncio.wait({self._task})
+        while self._pending:
+            await asyncio.wait(set(self._pending))
+
+    # ── Scheduling hooks ────────────────────────────────────────────────
+
+    def _launch(self, prev) -> None:
+        self._task = asyncio.get_running_loop().create_task(
+            self._run_async(), name="AsyncCTimecodeTimer"
+        )
+
+    def _halt(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _run_async(self) -> None:
+        self._begin(time.monotonic())
+        try:
+            while True:
+                # sleep(0) still yields when a tick is already due
+                await asyncio.sleep(
+                    max(0.0, self._next_deadline() - time.monotonic())
+                )
+                if not self._step(time.monotonic()):
+                    break
+        except asyncio.CancelledError:
+            pass
+
+    def _dispatch(self, args: tuple, index: int) -> None:
+        with self._lock:
+            cb = self._callback
+        lateness = self._lateness
+        t0 = time.perf_counter()
+        if cb is None:
+            self._stats.record_dispatch(lateness, 0.0)
+            return
+        try:
+            result = cb(*args)
+        except Exception:
+            self._stats.record_error()
+            Logger.exception(
+                f"AsyncCTimecodeTimer: callback raised an exception"
+                f" at quarter-frame {index}"
+            )
+            self._stats.record_dispatch(lateness, time.perf_counter() - t0)
+            return
+        if not inspect.isawaitable(result):
+            self._stats.record_dispatch(lateness, time.perf_counter() - t0)
+            return
+        if len(self._pending) >= self._max_concurrency:
+            self._stats.record_dropped()
+            if inspect.iscoroutine(result):
+                result.close()
+            return
+        future = asyncio.ensure_future(result)
+        self._pending.add(future)
+        # Coroutine duration is measured until the task completes
+        future.add_done_callback(
+            lambda f: self._callback_done(f, lateness, t0)
+        )
+
+    def _callback_done(
+        self, future: asyncio.Future, lateness: float, t0: float
+    ) -> None:
+        self._pending.discard(future)
+        self._stats.record_dispatch(lateness, time.perf_counter() - t0)
+        if not future.cancelled() and future.exception() is not None:
+            self._stats.record_error()
+            Logger.error(
+                f"AsyncCTimecodeTimer: callback raised an exception:"
+                f" {future.exception()!r}"
+            )
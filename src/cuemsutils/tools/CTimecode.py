@@ -235,45 +235,12 @@ class CTimecode(Timecode):
         ``start_seconds=self.milliseconds/1000``, losing one frame to
         upstream's int(s*fr) → frame_number+1 round-trip).
 
-        NOTE — throwaway object cost (deferred 869cyndtv PR #6, 2026-04-27):
-            The ``CTimecode(framerate=framerate)`` construction below is
-            used only to read ``_int_framerate`` from the resulting object.
-            It runs upstream's framerate setter (correct, what we want) but
-            ALSO calls ``tc_to_frames("00:00:00:00")`` to populate
-            ``_frames=1`` (pure waste). Cost is ~5μs per call. Call-sites
-            (run_cue.py:62/252, helpers.py:28/31, loop_cue.py:74/183) are
-            all construction-time, not hot-loop — total project-load impact
-            ~2ms for 100 cues. Deferred because the cost is unmeasurable in
-            production.
-
-            If profiling ever flags this, the recommended fix is a
-            class-level memoization cache keyed on the framerate input
-            (Option D in the 869cyndtv PR #6 plan)::
-
-                _INT_FR_CACHE: dict = {}
-
-                @classmethod
-                def _int_framerate_for(cls, fr):
-                    key = (type(fr), fr) if isinstance(fr, (int, float, str)) else repr(fr)
-                    if key not in cls._INT_FR_CACHE:
-                        cls._INT_FR_CACHE[key] = CTimecode(framerate=fr)._int_framerate
-                    return cls._INT_FR_CACHE[key]
-
-            Then replace the ``target_int_fr = ...`` line below with
-            ``target_int_fr = self._int_framerate_for(framerate)``.
-
-            Why a cache (Option D) over inlining upstream's NTSC-detection
-            logic (Option F): inlining duplicates upstream's algorithm and
-            silently diverges if upstream changes tolerance or adds new
-            NTSC-like rates. The cache delegates to upstream on the first
-            lookup per unique framerate and pays zero on subsequent calls.
-
-            Revisit triggers: (1) profiling shows this method on a hot path,
-            (2) a feature introduces dynamic framerate changes during
-            playback, (3) the same cache pattern is needed elsewhere in
-            CTimecode (unify at that point).
+        The target ``_int_framerate`` comes from :func:`framerate_info`,
+        which memoizes upstream's framerate normalization per framerate
+        (Option D of the 869cyndtv PR #6 plan, now that the same cache is
+        shared with :class:`~cuemsutils.tools.FastTimecode.FastTimecode`).
         """
-        target_int_fr = CTimecode(framerate=framerate)._int_framerate
+        target_int_fr = framerate_info(framerate).int_framerate
         new_frame_number = round(self.frame_number * target_int_fr / self._int_framerate)
         return CTimecode(framerate=framerate, frames=new_frame_number + 1)
 
@@ -455,3 +422,67 @@ class CTimecode(Timecode):
 class CTimecodeError(Exception):
     """Raised when an error occurred in timecode calculation."""
     pass
+
+
+class FramerateInfo:
+    """Immutable snapshot of upstream's framerate normalization.
+
+    Holds everything frame-domain math needs (rounded label rate, real rate,
+    drop-frame flags) so callers do not have to build a throwaway
+    ``CTimecode`` to read ``_int_framerate``. Obtain instances through
+    :func:`framerate_info`, which shares one instance per framerate.
+    """
+
+    __slots__ = (
+        'framerate', 'int_framerate', 'float_framerate',
+        'drop_frame', 'drop_frames', 'ms_frame',
+    )
+
+    def __init__(self, tc: CTimecode):
+        fr = tc.framerate
+        set_ = object.__setattr__
+        set_(self, 'framerate', fr)
+        set_(self, 'int_framerate', tc._int_framerate)
+        set_(self, 'float_framerate', float(fr))
+        set_(self, 'drop_frame', tc.drop_frame)
+        # Same "6% of the framerate" rule upstream applies in tc_to_frames.
+        set_(self, 'drop_frames', round(float(fr) * 0.066666) if tc.drop_frame else 0)
+        set_(self, 'ms_frame', tc.ms_frame)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other):
+        if isinstance(other, FramerateInfo):
+            return (
+                self.int_framerate == other.int_framerate
+                and self.float_framerate == other.float_framerate
+                and self.drop_frame == other.drop_frame
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.int_framerate, self.float_framerate, self.drop_frame))
+
+    def __repr__(self):
+        return f"FramerateInfo({self.framerate!r})"
+
+
+_FRAMERATE_INFO_CACHE: dict = {}
+
+
+def framerate_info(framerate) -> FramerateInfo:
+    """Return the shared :class:`FramerateInfo` for a framerate.
+
+    Delegates to upstream's framerate setter on the first lookup per unique
+    framerate input and pays a dict hit afterwards, so NTSC detection and
+    drop-frame rules never diverge from upstream.
+    """
+    if isinstance(framerate, FramerateInfo):
+        return framerate
+    key = (type(framerate), framerate) if isinstance(framerate, (int, float, str)) else repr(framerate)
+    info = _FRAMERATE_INFO_CACHE.get(key)
+    if info is None:
+        info = FramerateInfo(CTimecode(framerate=framerate))
+        _FRAMERATE_INFO_CACHE[key] = info
+    return info
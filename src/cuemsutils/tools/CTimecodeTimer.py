@@ -5,16 +5,56 @@ accepts an immutable list of parameter tuples at construction time; each
 tuple's contents are unpacked as callback arguments at the corresponding
 quarter-frame. When a tuple list is provided the timer stops automatically
 after the last tuple is consumed; without one it runs until explicitly stopped.
+``params`` may also be a lazy source — a generator, a callable of the QF
+index or a NumPy array (see :mod:`cuemsutils.tools.ParamSource`) — so long
+fades do not materialize every tuple up front.
+
+Quarter-frames are scheduled against absolute ``time.monotonic()`` deadlines
+(``start + n * qf``) rather than by sleeping one interval after each
+callback, so callback time and wake-up latency do not accumulate into
+drift: a late wake-up shortens the following wait, and ticks whose
+deadlines have already passed fire back-to-back until the timer is back on
+its grid. When the bound timecode moved over the missed ticks they are
+skipped together with the corresponding tuples instead. How late each
+dispatch was is exposed through :attr:`CTimecodeTimer.lateness` and
+:attr:`CTimecodeTimer.max_lateness`; :attr:`CTimecodeTimer.stats` keeps
+lateness and callback-duration histograms plus skip/error counters (see
+:mod:`cuemsutils.tools.TimerStats`).
+
+When the timer falls behind — a slow callback, GIL contention — the
+``catch_up`` policy (:class:`CatchUp`) decides what happens to the
+quarter-frames that are already due: ``STRICT`` (default) dispatches every
+one of them back-to-back, ``LATEST`` dispatches only the newest and counts
+the rest as coalesced, and ``BATCH`` calls the callback once with the list
+of all their argument tuples (in ``BATCH`` mode the callback always
+receives a list, one tuple per quarter-frame).
+
+Passing ``start_timecode`` switches parameterised timers to
+timecode-indexed lookup: instead of counting dispatches, every tick
+computes ``index = (timecode - start_timecode) / qf`` from the bound
+position, so forward and backward seeks land on the exact tuple without
+replaying or resetting. Between timecode updates the position freewheels
+on the monotonic clock for at most three quarter-frames, which fills in
+the quarter-frames of a timecode that is only advanced once per frame.
+Each index is dispatched once; positions before ``start_timecode`` wait
+silently, and the timer is exhausted once the position passes the last
+tuple.
 """
 
 from __future__ import annotations
 
 import enum
+import math
 import threading
+import time
 from typing import Callable
 
 from cuemsutils.log import Logger
 from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.ParamSource import NotBufferedError, ParamSource, as_param_source
+from cuemsutils.tools.TimecodeClock import TimecodeClock
+from cuemsutils.tools.TimerStats import TimerStats
 
 
 class _State(enum.Enum):
@@ -24,13 +64,28 @@ class _State(enum.Enum):
     EXHAUSTED = "exhausted"
 
 
+class CatchUp(enum.Enum):
+    """What a late timer does with quarter-frames that are already due."""
+
+    STRICT = "strict"
+    LATEST = "latest"
+    BATCH = "batch"
+
+
 class CTimecodeTimer:
-    """Timer that fires a callback at every quarter-frame boundary."""
+    """Timer that fires a callback at every quarter-frame boundary.
+
+    ``timecode`` is read from the timer thread; bind to a shared
+    :class:`~cuemsutils.tools.TimecodeClock.TimecodeClock` when another
+    thread advances the position.
+    """
 
     def __init__(
         self,
-        timecode: CTimecode,
-        params: list[tuple] | None = None,
+        timecode: CTimecode | TimecodeClock,
+        params: list[tuple] | ParamSource | None = None,
+        start_timecode: CTimecode | FastTimecode | None = None,
+        catch_up: CatchUp | str = CatchUp.STRICT,
     ) -> None:
         if timecode is None:
             raise ValueError("CTimecodeTimer: timecode must not be None")
@@ -41,14 +96,25 @@ class CTimecodeTimer:
         fr = timecode.framerate
         qf_fr = 1000.0 if fr == "ms" else float(fr)
         self._qf_interval: float = 1.0 / (4.0 * qf_fr)
+        # Timecode length of one QF, kept apart from the (overridable)
+        # wake-up interval for timecode-indexed lookup.
+        self._qf_ms: float = 1000.0 / (4.0 * qf_fr)
 
-        # Freeze params; empty list → bare-signal mode
-        if params is not None and len(params) > 0:
-            self._params: tuple[tuple, ...] | None = tuple(
-                tuple(p) for p in params
-            )
+        # Freeze list params, wrap lazy ones; empty → bare-signal mode
+        self._params: tuple[tuple, ...] | ParamSource | None = (
+            as_param_source(params)
+        )
+
+        if start_timecode is not None:
+            if self._params is None:
+                raise ValueError(
+                    "CTimecodeTimer: start_timecode requires params"
+                )
+            self._start_ms: float | None = start_timecode.milliseconds_exact
         else:
-            self._params = None
+            self._start_ms = None
+
+        self._catch_up = CatchUp(catch_up)
 
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
@@ -56,6 +122,12 @@ class CTimecodeTimer:
         self._callback: Callable | None = None
         self._state: _State = _State.IDLE
         self._index: int = 0
+        # Set once a read misses a GeneratorParams window; cleared by the
+        # next backward seek, so each seek logs once
+        self._not_buffered = False
+        self._lateness: float = 0.0
+        self._max_lateness: float = 0.0
+        self._stats = TimerStats()
 
     # ── Public interface ────────────────────────────────────────────────
 
@@ -69,6 +141,21 @@ class CTimecodeTimer:
         with self._lock:
             self._callback = fn
 
+    @property
+    def lateness(self) -> float:
+        """Seconds between the last dispatch and its scheduled deadline."""
+        return self._lateness
+
+    @property
+    def max_lateness(self) -> float:
+        """Largest :attr:`lateness` seen since the last :meth:`start`."""
+        return self._max_lateness
+
+    @property
+    def stats(self) -> TimerStats:
+        """Lifetime instrumentation; call ``stats.snapshot()`` to read it."""
+        return self._stats
+
     def start(self) -> None:
         """Start the timer loop.
 
@@ -86,8 +173,23 @@ class CTimecodeTimer:
                 return
             self._stop_event.clear()
             self._state = _State.RUNNING
+            self._lateness = 0.0
+            self._max_lateness = 0.0
             prev = self._thread
 
+        self._launch(prev)
+
+    def stop(self) -> None:
+        """Stop the timer loop.  RUNNING → STOPPED.  No-op otherwise."""
+        with self._lock:
+            if self._state != _State.RUNNING:
+                return
+            self._state = _State.STOPPED
+
+        self._halt()
+
+    def _launch(self, prev: threading.Thread | None) -> None:
+        """Begin scheduling after the switch to RUNNING."""
         # Join any previous thread outside the lock
         if prev is not None:
             prev.join(timeout=self._qf_interval * 4)
@@ -98,13 +200,8 @@ class CTimecodeTimer:
         self._thread = t
         t.start()
 
-    def stop(self) -> None:
-        """Stop the timer loop.  RUNNING → STOPPED.  No-op otherwise."""
-        with self._lock:
-            if self._state != _State.RUNNING:
-                return
-            self._state = _State.STOPPED
-
+    def _halt(self) -> None:
+        """End scheduling after the switch to STOPPED."""
         self._stop_event.set()
         if self._thread is not None:
             self._thread.join(timeout=self._qf_interval * 4)
@@ -112,53 +209,237 @@ class CTimecodeTimer:
     # ── Private loop ────────────────────────────────────────────────────
 
     def _run_loop(self) -> None:
-        prev_tc_ms: float = self._timecode.milliseconds_exact
-        qf_ms: float = self._qf_interval * 1000.0
-
+        self._begin(time.monotonic())
         while True:
-            # Wait for one QF interval or early exit on stop
-            if self._stop_event.wait(timeout=self._qf_interval):
+            # Wait for the next absolute deadline or early exit on stop
+            timeout = self._next_deadline() - time.monotonic()
+            if timeout > 0:
+                if self._stop_event.wait(timeout=timeout):
+                    break
+            elif self._stop_event.is_set():
+                break
+            if not self._step(time.monotonic()):
                 break
 
-            # Read current timecode position (for seek detection)
-            current_tc_ms = self._timecode.milliseconds_exact
-            delta_ms = current_tc_ms - prev_tc_ms
-            prev_tc_ms = current_tc_ms
-
-            # Seek detection — parameterised mode only
-            if self._params is not None:
-                if delta_ms > 1.5 * qf_ms:
-                    extra = round(delta_ms / qf_ms) - 1
-                    self._index = min(
-                        self._index + extra, len(self._params)
-                    )
-                elif delta_ms < 0:
-                    self._index = 0
-
-                if self._index >= len(self._params):
-                    with self._lock:
-                        self._state = _State.EXHAUSTED
-                    break
+    # ── Scheduling steps (shared with TimerWheel) ───────────────────────
 
-            # Dispatch callback
-            with self._lock:
-                cb = self._callback
-
-            if cb is not None:
-                try:
-                    if self._params is not None:
-                        cb(*self._params[self._index])
-                    else:
-                        cb()
-                except Exception:
-                    Logger.error(
-                        "CTimecodeTimer: callback raised an exception"
-                    )
-
-            # Post-dispatch index advance
-            if self._params is not None:
-                self._index += 1
-                if self._index >= len(self._params):
-                    with self._lock:
-                        self._state = _State.EXHAUSTED
+    def _begin(self, now: float) -> None:
+        """Reset per-run scheduling state; the first tick is due one QF later."""
+        # Deadline of tick n is origin + n * interval; ``_tick`` is the one
+        # about to be dispatched.
+        self._origin = now
+        self._tick = 1
+        self._prev_tc_ms = self._timecode.milliseconds_exact
+        # Timecode-indexed mode: last observed position and when it was
+        # first seen, for freewheeling between timecode updates.  No
+        # freewheel until the timecode has been seen moving.
+        self._seen_tc_ms = self._prev_tc_ms
+        self._seen_at: float | None = None
+        self._last_dispatched: int | None = None
+        self._not_buffered = False
+        self._last_dispatched_at: float = now
+
+    def _next_deadline(self) -> float:
+        return self._origin + self._tick * self._qf_interval
+
+    def _step(self, now: float) -> bool:
+        """Serve the tick due at or before ``now``.
+
+        Returns False once the timer is no longer running (stopped or
+        exhausted); the caller must not schedule it again.
+        """
+        if self._state != _State.RUNNING:
+            return False
+
+        if self._start_ms is not None:
+            # The position is read fresh each tick, so a late wake-up
+            # just moves on to the next future deadline.
+            self._tick = int((now - self._origin) / self._qf_interval) + 1
+            return self._dispatch_at_position(now)
+
+        interval = self._qf_interval
+        qf_ms = interval * 1000.0
+        # Deadlines already passed beyond the one being served
+        missed = max(int((now - self._origin) / interval) - self._tick, 0)
+
+        # Read current timecode position (for seek detection)
+        current_tc_ms = self._timecode.milliseconds_exact
+        delta_ms = current_tc_ms - self._prev_tc_ms
+        self._prev_tc_ms = current_tc_ms
+
+        # Seek detection — parameterised mode only
+        if self._params is not None:
+            if delta_ms > 1.5 * qf_ms:
+                extra = round(delta_ms / qf_ms) - 1
+                # Quarter-frames the timecode moved over while this timer
+                # was late are overdue and served per the catch-up policy;
+                # only a jump beyond that backlog is a seek
+                jump = extra - min(extra, missed)
+                self._index += jump
+                self._stats.record_skipped(jump)
+            elif delta_ms < 0:
+                self._index = 0
+                self._not_buffered = False
+
+            if self._exhausted_at(self._index):
+                self._exhaust()
+                return False
+
+        # Serve every due tick now; the last one is the newest deadline
+        first = self._index
+        last = first + missed
+        if self._params is not None:
+            while last > first and self._exhausted_at(last):
+                last -= 1
+        self._tick += last - first
+
+        self._lateness = now - self._next_deadline()
+        if self._lateness > self._max_lateness:
+            self._max_lateness = self._lateness
+
+        self._serve(first, last, interval)
+        self._tick += 1
+
+        # Post-dispatch index advance
+        if self._params is not None:
+            self._index = last + 1
+            if self._exhausted_at(self._index):
+                self._exhaust()
+                return False
+        return True
+
+    def _dispatch_at_position(self, now: float) -> bool:
+        """Timecode-indexed tick.  Returns False once exhausted."""
+        tc_ms = self._timecode.milliseconds_exact
+        if tc_ms != self._seen_tc_ms:
+            self._seen_tc_ms = tc_ms
+            self._seen_at = now
+        if self._seen_at is None:
+            freewheel_ms = 0.0
+        else:
+            freewheel_ms = min((now - self._seen_at) * 1000.0, 3 * self._qf_ms)
+        # Small epsilon guards exact QF boundaries against float rounding
+        index = math.floor(
+            (tc_ms + freewheel_ms - self._start_ms) / self._qf_ms + 1e-9
+        )
+        self._index = max(index, 0)
+
+        if index >= 0 and self._exhausted_at(index):
+            self._exhaust()
+            return False
+        if self._last_dispatched is not None and index < self._last_dispatched:
+            self._not_buffered = False
+        if index < 0 or index == self._last_dispatched:
+            return True
+
+        first = index
+        if self._last_dispatched is not None and index > self._last_dispatched + 1:
+            # Quarter-frames whose time passed since the last dispatch were
+            # missed by lateness; any further gap is a seek and skipped.
+            gap = index - self._last_dispatched - 1
+            elapsed_qfs = int(
+                (now - self._last_dispatched_at) * 1000.0 / self._qf_ms
+            )
+            late = min(gap, max(elapsed_qfs - 1, 0))
+            if gap > late:
+                self._stats.record_skipped(gap - late)
+            first = index - late
+
+        self._lateness = (
+            tc_ms + freewheel_ms - self._start_ms - index * self._qf_ms
+        ) / 1000.0
+        if self._lateness > self._max_lateness:
+            self._max_lateness = self._lateness
+        self._last_dispatched = index
+        self._last_dispatched_at = now
+
+        self._serve(first, index, self._qf_ms / 1000.0)
+        return True
+
+    def _serve(self, first: int, last: int, spacing: float) -> None:
+        """Dispatch quarter-frames ``first..last`` per the catch-up policy.
+
+        ``first..last-1`` are overdue; ``self._lateness`` is that of
+        ``last`` and earlier ones are ``spacing`` seconds later each.
+        """
+        if self._catch_up is CatchUp.BATCH:
+            self._stats.record_coalesced(last - first)
+            batch = []
+            for i in range(first, last + 1):
+                args = self._args_at(i)
+                if args is not None:
+                    batch.append(args)
+            self._dispatch((batch,), last)
+        elif self._catch_up is CatchUp.LATEST:
+            self._stats.record_coalesced(last - first)
+            self._dispatch_index(last)
+        else:
+            lateness = self._lateness
+            self._max_lateness = max(
+                self._max_lateness, lateness + (last - first) * spacing
+            )
+            for i in range(first, last + 1):
+                # A callback may stop the timer mid-burst
+                if self._state != _State.RUNNING:
                     break
+                self._lateness = lateness + (last - i) * spacing
+                self._dispatch_index(i)
+
+    def _exhausted_at(self, index: int) -> bool:
+        if isinstance(self._params, tuple):
+            return index >= len(self._params)
+        try:
+            return self._params.exhausted(index)
+        except Exception:
+            self._stats.record_error()
+            Logger.exception(
+                f"CTimecodeTimer: cannot tell whether quarter-frame {index}"
+                f" is past the end of the parameters"
+            )
+            return False
+
+    def _args_at(self, index: int) -> tuple | None:
+        if self._params is None:
+            return ()
+        try:
+            return self._params[index]
+        except NotBufferedError as exc:
+            # Seeked back past the window: skipped until playback catches up
+            self._stats.record_skipped(1)
+            if not self._not_buffered:
+                self._not_buffered = True
+                Logger.warning(
+                    f"CTimecodeTimer: {exc}; skipping quarter-frames"
+                    f" until the parameters catch up"
+                )
+            return None
+        except Exception:
+            self._stats.record_error()
+            Logger.exception(
+                f"CTimecodeTimer: no parameters for quarter-frame {index}"
+            )
+            return None
+
+    def _dispatch_index(self, index: int) -> None:
+        args = self._args_at(index)
+        if args is not None:
+            self._dispatch(args, index)
+
+    def _dispatch(self, args: tuple, index: int) -> None:
+        with self._lock:
+            cb = self._callback
+        t0 = time.perf_counter()
+        if cb is not None:
+            try:
+                cb(*args)
+            except Exception:
+                self._stats.record_error()
+                Logger.exception(
+                    f"CTimecodeTimer: callback raised an exception"
+                    f" at quarter-frame {index}"
+                )
+        self._stats.record_dispatch(self._lateness, time.perf_counter() - t0)
+
+    def _exhaust(self) -> None:
+        with self._lock:
+            self._state = _State.EXHAUSTED
@@ -0,0 +1,158 @@
+"""Compact storage for the 512 channels of a DMX universe.
+
+A :class:`DmxBuffer` holds the channel levels in a 512-byte ``bytearray``
+and, next to it, a 512-byte mask of the channels a scene actually sets.
+Channels that are not set read as 0 in the frame but are left out of
+:meth:`DmxBuffer.items`, so a scene that only touches a few channels
+still serializes as the same few ``DmxChannel`` entries it was loaded from.
+
+Single channels and slices are read and written like a ``bytearray``::
+
+    buf = DmxBuffer()
+    buf[0] = 255
+    buf[10:14] = b'\\x10\\x20\\x30\\x40'
+    buf[10:14]          # b'\\x10\\x20\\x30\\x40'
+    buf.frame()         # 512 bytes, ready to send
+
+Every write bumps :attr:`DmxBuffer.version`, so views built from the
+buffer (e.g. ``DmxUniverse.dmx_channels``) know when to rebuild.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+DMX_CHANNELS = 512
+
+DEFAULT_REFRESH_RATE = 44.0
+"""Frames per second; about the most a full DMX512 universe carries."""
+
+_SET = 1
+
+
+class DmxBuffer:
+    """Channel levels of one DMX universe, with a mask of the set channels.
+
+    Args:
+        values: Initial levels from channel 0; every given channel is set.
+    """
+
+    __slots__ = ('_values', '_mask', '_version')
+
+    def __init__(self, values: bytes | Iterable[int] | None = None) -> None:
+        self._values = bytearray(DMX_CHANNELS)
+        self._mask = bytearray(DMX_CHANNELS)
+        self._version = 0
+        if values is not None:
+            values = bytes(values)
+            self[0:len(values)] = values
+
+    # --- Channel access ---
+    def __getitem__(self, key: int | slice) -> int | bytes:
+        if isinstance(key, slice):
+            return bytes(self._values[key])
+        return self._values[_channel(key)]
+
+    def __setitem__(self, key: int | slice, value: int | bytes | Iterable[int]) -> None:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(DMX_CHANNELS)
+            value = bytes(value)
+            count = len(range(start, stop, step))
+            if len(value) != count:
+                raise ValueError(f"Expected {count} channel values, got {len(value)}")
+            self._values[key] = value
+            self._mask[key] = bytes((_SET,)) * count
+        else:
+            channel = _channel(key)
+            self._values[channel] = value
+            self._mask[channel] = _SET
+        self._version += 1
+
+    def __delitem__(self, key: int | slice) -> None:
+        """Unset channels; they read as 0 again."""
+        if isinstance(key, slice):
+            count = len(range(*key.indices(DMX_CHANNELS)))
+            self._values[key] = bytes(count)
+            self._mask[key] = bytes(count)
+        else:
+            channel = _channel(key)
+            self._values[channel] = 0
+            self._mask[channel] = 0
+        self._version += 1
+
+    def is_set(self, channel: int) -> bool:
+        return self._mask[_channel(channel)] == _SET
+
+    def update(self, channels: Iterable[tuple[int, int]]) -> None:
+        """Set ``(channel, value)`` pairs."""
+        values, mask = self._values, self._mask
+        try:
+            for channel, value in channels:
+                channel = _channel(channel)
+                values[channel] = value
+                mask[channel] = _SET
+        finally:
+            # Channels before a bad pair are written
+            self._version += 1
+
+    def clear(self) -> None:
+        """Unset every channel."""
+        del self[:]
+
+    # --- Reading ---
+    def items(self) -> Iterator[tuple[int, int]]:
+        """``(channel, value)`` of the set channels, in channel order."""
+        values, mask = self._values, self._mask
+        channel = mask.find(_SET)
+        while channel != -1:
+            yield channel, values[channel]
+            channel = mask.find(_SET, channel + 1)
+
+    def channels(self) -> list[int]:
+        """Numbers of the set channels, in order."""
+        return [channel for channel, _ in self.items()]
+
+    def frame(self) -> bytes:
+        """All 512 levels, unset channels as 0."""
+        return bytes(self._values)
+
+    @property
+    def values(self) -> memoryview:
+        """Read-only view of the 512 levels."""
+        return memoryview(self._values).toreadonly()
+
+    @property
+    def mask(self) -> memoryview:
+        """Read-only view of the set mask (1 for set channels, 0 otherwise)."""
+        return memoryview(self._mask).toreadonly()
+
+    @property
+    def version(self) -> int:
+        """Incremented on every write."""
+        return self._version
+
+    def copy(self) -> DmxBuffer:
+        new = DmxBuffer()
+        new._values[:] = self._values
+        new._mask[:] = self._mask
+        return new
+
+    def __len__(self) -> int:
+        """Number of set channels."""
+        return self._mask.count(_SET)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DmxBuffer):
+            return NotImplemented
+        return self._mask == other._mask and self._values == other._values
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"DmxBuffer({dict(self.items())})"
+
+
+def _channel(channel: int) -> int:
+    channel = int(channel)
+    if not 0 <= channel < DMX_CHANNELS:
+        raise IndexError(f"DMX channel must be within [0, {DMX_CHANNELS - 1}], got {channel}")
+    return channel
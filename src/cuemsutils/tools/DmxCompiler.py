@@ -0,0 +1,128 @@
+"""Arm-time compilation of DmxCue output.
+
+At GO a DMX player used to interpret the cue's ``DmxScene``, its
+``outputs`` and its fade times before it could send anything. None of
+that depends on when GO arrives, so :func:`compile_dmx_cue` does it ahead
+of time and returns :class:`CompiledDmx`: for the outputs local to a node,
+the frames to send during the fade-in and the fade-out, each a
+:class:`DmxFrame` with its time offset, universe number and 512-byte
+frame, at a fixed refresh rate.
+
+Channels the scene sets fade between their level and the universe's
+``from_frames`` level (zeros by default) on a
+:mod:`~cuemsutils.tools.FadeCurves` curve; channels it does not set keep
+the ``from_frames`` level. ``fadein_time`` and ``fadeout_time`` are read
+as seconds.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, NamedTuple
+
+from .DmxBuffer import DEFAULT_REFRESH_RATE, DMX_CHANNELS
+from .FadeCurves import FadeCurve, get_fade_curve
+
+if TYPE_CHECKING:
+    from ..cues.DmxCue import DmxCue
+    from ..cues.FadeCue import FadeCurveType
+
+
+class DmxFrame(NamedTuple):
+    """A frame to send ``timestamp`` ms after the fade starts."""
+
+    timestamp: float
+    universe: int
+    data: bytes
+
+
+class CompiledDmx(NamedTuple):
+    """Ready-to-send output of a DMX cue on one node.
+
+    ``fade_in`` and ``fade_out`` are empty when no output of the cue is on
+    the node; otherwise each ends with the frame at the end of its fade.
+    """
+
+    node_uuid: str | None
+    outputs: tuple[str, ...]
+    fade_in: tuple[DmxFrame, ...]
+    fade_out: tuple[DmxFrame, ...]
+
+    @property
+    def local(self) -> bool:
+        return bool(self.outputs)
+
+
+def compile_dmx_cue(
+    cue: DmxCue,
+    node_uuid: str | None,
+    refresh_rate: float = DEFAULT_REFRESH_RATE,
+    curve: FadeCurve | FadeCurveType | str = 'linear',
+    from_frames: Mapping[int, bytes] | None = None,
+    **params: float,
+) -> CompiledDmx:
+    """Turn a DMX cue into the frames a node sends for it.
+
+    Args:
+        cue: The DMX cue.
+        node_uuid: The node to compile for; only outputs whose
+            ``output_name`` is this uuid count (see ``DmxCue.local_outputs``).
+        refresh_rate: Frames per second during fades.
+        curve: A bound ``FadeCurve``, a ``FadeCurveType`` or a registered curve name.
+        from_frames: ``{universe_num: frame}`` the fade-in starts from and
+            the fade-out returns to; zeros for missing universes.
+        **params: Curve parameters, when ``curve`` is not already bound.
+
+    Raises:
+        ValueError: If ``refresh_rate`` is not positive, a fade time is
+            negative, a ``from_frames`` frame is not 512 bytes, or the curve
+            is invalid.
+    """
+    if refresh_rate <= 0:
+        raise ValueError(f"refresh_rate must be > 0, got {refresh_rate}")
+    if isinstance(curve, FadeCurve):
+        if params:
+            raise ValueError("Parameters cannot be given with an already bound FadeCurve")
+    else:
+        curve = get_fade_curve(curve, **params)
+    fade_in = _fade_ms(cue.fadein_time, 'fadein_time')
+    fade_out = _fade_ms(cue.fadeout_time, 'fadeout_time')
+    outputs = tuple(output.get('output_name') for output in cue.local_outputs(node_uuid))
+    if not outputs:
+        return CompiledDmx(node_uuid, outputs, (), ())
+
+    universe = cue.DmxScene.DmxUniverse
+    num = universe.universe_num
+    base = (from_frames or {}).get(num, bytes(DMX_CHANNELS))
+    if len(base) != DMX_CHANNELS:
+        raise ValueError(f"A frame has {DMX_CHANNELS} levels, got {len(base)}")
+    channels = universe.buffer.channels()
+    levels = universe.buffer.values
+    interval = 1000.0 / refresh_rate
+    return CompiledDmx(
+        node_uuid,
+        outputs,
+        _fade(num, base, channels, levels, fade_in, interval, curve, rising=True),
+        _fade(num, base, channels, levels, fade_out, interval, curve, rising=False),
+    )
+
+
+def _fade_ms(seconds, name: str) -> float:
+    ms = float(seconds or 0) * 1000.0
+    if ms < 0:
+        raise ValueError(f"{name} must be >= 0, got {seconds}")
+    return ms
+
+
+def _fade(num, base, channels, levels, duration, interval, curve, rising) -> tuple[DmxFrame, ...]:
+    steps = [i * interval for i in range(math.ceil(duration / interval - 1e-9))] + [duration]
+    frames = []
+    frame = bytearray(base)
+    for timestamp in steps:
+        shaped = curve(timestamp / duration) if duration else 1.0
+        amount = shaped if rising else 1.0 - shaped
+        for channel in channels:
+            start = base[channel]
+            frame[channel] = round(start + (levels[channel] - start) * amount)
+        frames.append(DmxFrame(timestamp, num, bytes(frame)))
+    return tuple(frames)
@@ -0,0 +1,329 @@
+"""DmxFadeEngine — DMX scene crossfades as array operations.
+
+Every channel of every universe the engine has seen is one cell of a set
+of ``(universes, 512)`` NumPy arrays: level at the start of its fade,
+target level, fade start, fade length and curve row. The curves' lookup
+tables (see :mod:`cuemsutils.tools.FadeCurves`) are stacked in one 2-D
+array, so :meth:`DmxFadeEngine.tick` computes every channel, whatever its
+curve, with the same few array operations. Its cost depends on the number
+of universes, not on how many cues are playing.
+
+Cues are layers, each holding the levels of the channels its scene sets
+and a merge rule:
+
+- ``Merge.LTP`` (latest takes precedence): the most recently added LTP
+  layer that sets a channel gives its base level;
+- ``Merge.HTP`` (highest takes precedence): HTP layers raise a channel to
+  their level when it is above the base.
+
+Adding or releasing a layer recomputes the targets of the channels it
+sets, and each channel whose target changes starts a crossfade from its
+current level. That is the only work proportional to the number of
+layers, and it happens once per cue event, not once per frame.
+
+Requires the optional ``numpy`` dependency (``pip install cuemsutils[numpy]``).
+"""
+from __future__ import annotations
+
+import enum
+from collections.abc import Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from .DmxBuffer import DEFAULT_REFRESH_RATE, DMX_CHANNELS
+from .FadeCurves import LUT_SIZE, FadeCurve, get_fade_curve
+
+if TYPE_CHECKING:
+    from ..cues.DmxCue import DmxCue, DmxScene, DmxUniverse
+    from ..cues.FadeCue import FadeCurveType
+
+class Merge(enum.Enum):
+    """How a layer combines with the others on the channels it sets."""
+
+    HTP = "htp"
+    LTP = "ltp"
+
+
+class _Layer(NamedTuple):
+    merge: Merge
+    levels: dict[int, tuple[np.ndarray, np.ndarray]]  # row: (values, mask)
+
+
+class DmxFadeEngine:
+    """Crossfades between DMX scenes for any number of universes.
+
+    Times are milliseconds on whatever clock the caller ticks the engine
+    with; layers added or released without ``start_ms`` start at the last
+    tick.
+
+    Args:
+        refresh_rate: Frames per second produced by :meth:`frames`.
+    """
+
+    def __init__(self, refresh_rate: float = DEFAULT_REFRESH_RATE) -> None:
+        if refresh_rate <= 0:
+            raise ValueError(f"refresh_rate must be > 0, got {refresh_rate}")
+        self.refresh_rate = refresh_rate
+        self._rows: dict[int, int] = {}
+        self._nums: list[int] = []
+        shape = (0, DMX_CHANNELS)
+        self._from = np.zeros(shape, dtype=np.float64)
+        self._to = np.zeros(shape, dtype=np.float64)
+        self._start = np.zeros(shape, dtype=np.float64)
+        self._duration = np.zeros(shape, dtype=np.float64)
+        self._curve = np.zeros(shape, dtype=np.intp)
+        self._frame = np.zeros(shape, dtype=np.uint8)
+        self._emitted = np.zeros(0, dtype=bool)
+        self._tables = np.zeros((0, LUT_SIZE + 1), dtype=np.float64)
+        self._curve_rows: dict[int, int] = {}
+        self._curves: list[FadeCurve] = []
+        self._layers: dict[Hashable, _Layer] = {}
+        self._now = 0.0
+
+    @property
+    def frame_interval(self) -> float:
+        """Milliseconds between frames at :attr:`refresh_rate`."""
+        return 1000.0 / self.refresh_rate
+
+    # --- Layers ---
+    def add_scene(
+        self,
+        key: Hashable,
+        scene: DmxScene | DmxUniverse | Iterable[DmxUniverse],
+        fade_ms: float = 0,
+        curve: FadeCurve | FadeCurveType | str = 'linear',
+        merge: Merge | str = Merge.LTP,
+        start_ms: float | None = None,
+        **params: float,
+    ) -> None:
+        """Fade in a scene as layer ``key``, replacing a layer with the same key.
+
+        The scene's levels are copied, so later edits to it do not affect
+        the running layer.
+
+        Args:
+            key: Any hashable key, usually the cue's id.
+            scene: A ``DmxScene``, a ``DmxUniverse`` or several universes.
+            fade_ms: Crossfade length in milliseconds; 0 cuts.
+            curve: A bound ``FadeCurve``, a ``FadeCurveType`` or a registered curve name.
+            merge: ``Merge.LTP`` or ``Merge.HTP`` (or their values).
+            start_ms: Start time; defaults to the last tick.
+            **params: Curve parameters, when ``curve`` is not already bound.
+
+        Raises:
+            ValueError: If ``fade_ms`` is negative or the curve or merge rule is invalid.
+        """
+        merge = Merge(merge)
+        curve_row = self._curve_row(curve, params)
+        _check_fade(fade_ms)
+        levels = {}
+        for universe in _universes(scene):
+            row = self._row(universe.universe_num)
+            buffer = universe.buffer
+            levels[row] = (
+                np.frombuffer(buffer.values, dtype=np.uint8).copy(),
+                np.frombuffer(buffer.mask, dtype=np.uint8).astype(bool),
+            )
+        previous = self._layers.pop(key, None)
+        self._layers[key] = _Layer(merge, levels)
+        rows = set(levels) | (set(previous.levels) if previous else set())
+        self._retarget(rows, fade_ms, curve_row, start_ms)
+
+    def add_cue(
+        self,
+        cue: DmxCue,
+        curve: FadeCurve | FadeCurveType | str = 'linear',
+        merge: Merge | str = Merge.LTP,
+        start_ms: float | None = None,
+        **params: float,
+    ) -> None:
+        """Fade in a ``DmxCue``'s scene over its ``fadein_time`` (seconds), keyed by the cue id."""
+        self.add_scene(
+            cue.id, cue.DmxScene, _cue_fade(cue.fadein_time), curve, merge, start_ms, **params
+        )
+
+    def release(
+        self,
+        key: Hashable,
+        fade_ms: float = 0,
+        curve: FadeCurve | FadeCurveType | str = 'linear',
+        start_ms: float | None = None,
+        **params: float,
+    ) -> bool:
+        """Remove layer ``key``; its channels fade to what the other layers give them.
+
+        Returns:
+            ``False`` if there was no such layer.
+        """
+        curve_row = self._curve_row(curve, params)
+        _check_fade(fade_ms)
+        layer = self._layers.pop(key, None)
+        if layer is None:
+            return False
+        self._retarget(set(layer.levels), fade_ms, curve_row, start_ms)
+        return True
+
+    def release_cue(
+        self,
+        cue: DmxCue,
+        curve: FadeCurve | FadeCurveType | str = 'linear',
+        start_ms: float | None = None,
+        **params: float,
+    ) -> bool:
+        """Release a ``DmxCue``'s layer over its ``fadeout_time`` (seconds)."""
+        return self.release(cue.id, _cue_fade(cue.fadeout_time), curve, start_ms, **params)
+
+    def active_keys(self) -> list[Hashable]:
+        """Layer keys, oldest first."""
+        return list(self._layers)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    # --- Frames ---
+    def tick(self, now_ms: float) -> dict[int, bytes]:
+        """Advance every channel to ``now_ms``.
+
+        Returns:
+            ``{universe_num: frame}`` (512 bytes each) for the universes
+            whose frame changed since the last tick.
+        """
+        self._now = now_ms
+        if not self._nums:
+            return {}
+        frame = np.rint(self._levels(now_ms)).astype(np.uint8)
+        changed = (frame != self._frame).any(axis=1) | ~self._emitted
+        self._frame = frame
+        self._emitted[:] = True
+        # Settled channels stop fading, so their values are exact from now on
+        done = (self._duration > 0) & (now_ms >= self._start + self._duration)
+        self._from[done] = self._to[done]
+        self._duration[done] = 0.0
+        return {self._nums[r]: frame[r].tobytes() for r in np.flatnonzero(changed)}
+
+    def frames(self, start_ms: float, stop_ms: float) -> Iterator[tuple[float, dict[int, bytes]]]:
+        """Tick at :attr:`refresh_rate` from ``start_ms`` up to ``stop_ms``.
+
+        Yields:
+            ``(time_ms, changes)`` for every frame, ``changes`` as returned
+            by :meth:`tick` (empty when nothing changed).
+        """
+        interval = self.frame_interval
+        i = 0
+        while (now := start_ms + i * interval) <= stop_ms:
+            yield now, self.tick(now)
+            i += 1
+
+    def frame(self, universe_num: int) -> bytes:
+        """The last ticked frame of a universe (all zeros if it is unknown)."""
+        row = self._rows.get(universe_num)
+        if row is None:
+            return bytes(DMX_CHANNELS)
+        return self._frame[row].tobytes()
+
+    def universes(self) -> list[int]:
+        return list(self._nums)
+
+    def fading(self) -> bool:
+        """Whether a channel is still moving after the last tick."""
+        return bool((self._duration > 0).any())
+
+    # --- Internal helpers ---
+    def _levels(self, now_ms: float, rows=slice(None)) -> np.ndarray:
+        duration = self._duration[rows]
+        moving = duration > 0
+        progress = np.ones(duration.shape)
+        np.divide(now_ms - self._start[rows], duration, out=progress, where=moving)
+        np.clip(progress, 0.0, 1.0, out=progress)
+        pos = progress * LUT_SIZE
+        i = np.minimum(pos.astype(np.intp), LUT_SIZE - 1)
+        curve = self._curve[rows]
+        lo = self._tables[curve, i]
+        hi = self._tables[curve, i + 1]
+        shaped = lo + (hi - lo) * (pos - i)
+        shaped[progress >= 1.0] = 1.0
+        return self._from[rows] + (self._to[rows] - self._from[rows]) * shaped
+
+    def _retarget(self, rows: set[int], fade_ms: float, curve_row: int, start_ms: float | None) -> None:
+        start = self._now if start_ms is None else start_ms
+        for row in sorted(rows):
+            target = self._target(row)
+            changed = target != self._to[row]
+            if not changed.any():
+                continue
+            current = self._levels(start, row)
+            self._from[row, changed] = current[changed]
+            self._to[row, changed] = target[changed]
+            self._start[row, changed] = start
+            self._duration[row, changed] = fade_ms
+            self._curve[row, changed] = curve_row
+            if fade_ms == 0:
+                # A cut: park the channel on its target with no fade running
+                self._from[row, changed] = target[changed]
+                self._duration[row, changed] = 0.0
+
+    def _target(self, row: int) -> np.ndarray:
+        ltp = np.zeros(DMX_CHANNELS, dtype=np.float64)
+        htp = np.zeros(DMX_CHANNELS, dtype=np.float64)
+        for layer in self._layers.values():
+            levels = layer.levels.get(row)
+            if levels is None:
+                continue
+            values, mask = levels
+            if layer.merge is Merge.LTP:
+                ltp[mask] = values[mask]
+            else:
+                np.maximum(htp, np.where(mask, values, 0), out=htp)
+        return np.maximum(ltp, htp)
+
+    def _row(self, universe_num: int) -> int:
+        row = self._rows.get(universe_num)
+        if row is None:
+            row = len(self._nums)
+            self._rows[universe_num] = row
+            self._nums.append(universe_num)
+            for name in ('_from', '_to', '_start', '_duration', '_curve', '_frame'):
+                array = getattr(self, name)
+                setattr(self, name, np.vstack((array, np.zeros((1, DMX_CHANNELS), dtype=array.dtype))))
+            # Not emitted yet, so the next tick reports it
+            self._emitted = np.append(self._emitted, False)
+        return row
+
+    def _curve_row(self, curve: FadeCurve | FadeCurveType | str, params: dict) -> int:
+        if not isinstance(curve, FadeCurve):
+            curve = get_fade_curve(curve, **params)
+        elif params:
+            raise ValueError("Parameters cannot be given with an already bound FadeCurve")
+        row = self._curve_rows.get(id(curve))
+        if row is None:
+            row = len(self._curves)
+            self._curves.append(curve)  # keeps id(curve) alive and unique
+            self._curve_rows[id(curve)] = row
+            table = np.frombuffer(curve.table, dtype=np.float64)
+            if len(table) != LUT_SIZE + 1:
+                table = np.interp(
+                    np.linspace(0.0, 1.0, LUT_SIZE + 1),
+                    np.linspace(0.0, 1.0, len(table)),
+                    table,
+                )
+            self._tables = np.vstack((self._tables, table))
+        return row
+
+
+def _check_fade(fade_ms: float) -> None:
+    if fade_ms < 0:
+        raise ValueError(f"fade_ms must be >= 0, got {fade_ms}")
+
+
+def _cue_fade(seconds) -> float:
+    return float(seconds or 0) * 1000.0
+
+
+def _universes(scene) -> Iterable[DmxUniverse]:
+    if hasattr(scene, 'buffer'):
+        return [scene]
+    if isinstance(scene, dict):
+        universe = scene.get('DmxUniverse')
+        return [] if universe is None else [universe]
+    return scene
@@ -0,0 +1,224 @@
+"""DmxFrameBuffer — double-buffered DMX frames with dirty-range tracking.
+
+Transports like Art-Net or sACN do not need the 512 bytes of every
+universe on every frame. ``DmxFrameBuffer`` keeps, per universe (keyed by
+``DmxUniverse.universe_num``):
+
+- a back buffer that writers fill (:meth:`DmxFrameBuffer.write`,
+  :meth:`~DmxFrameBuffer.set_frame`, :meth:`~DmxFrameBuffer.update` with
+  the result of ``DmxFadeEngine.tick()``), recording the channel ranges
+  each write actually changed;
+- a published front frame. :meth:`DmxFrameBuffer.flush` turns the dirty
+  ranges into :class:`DmxDelta` items (only the bytes that differ from the
+  front frame, nearby ranges merged) and publishes the new frames of all
+  universes at once.
+
+Published frames are immutable ``bytes`` held in one tuple that a flush
+replaces as a whole, so readers (:meth:`~DmxFrameBuffer.snapshot`,
+:meth:`~DmxFrameBuffer.frame`) need no lock and never see half a flush.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+
+from .DmxBuffer import DMX_CHANNELS
+
+if TYPE_CHECKING:
+    from ..cues.DmxCue import DmxUniverse
+
+DEFAULT_MERGE_GAP = 8
+"""Changed ranges at most this many unchanged channels apart are sent as one."""
+
+
+class DmxDelta(NamedTuple):
+    """Changed channels ``start`` to ``start + len(data) - 1`` of a universe."""
+
+    universe: int
+    start: int
+    data: bytes
+
+    @property
+    def stop(self) -> int:
+        return self.start + len(self.data)
+
+
+class FrameSnapshot(NamedTuple):
+    """Published frames of every universe after one flush."""
+
+    sequence: int
+    frames: Mapping[int, bytes]
+
+
+class DmxFrameBuffer:
+    """Back and front DMX frames of several universes.
+
+    Args:
+        merge_gap: Changed ranges separated by at most this many unchanged
+            channels become a single delta.
+    """
+
+    def __init__(self, merge_gap: int = DEFAULT_MERGE_GAP) -> None:
+        if merge_gap < 0:
+            raise ValueError(f"merge_gap must be >= 0, got {merge_gap}")
+        self.merge_gap = merge_gap
+        self._back: dict[int, bytearray] = {}
+        self._dirty: dict[int, list[list[int]]] = {}
+        self._write_lock = threading.Lock()
+        self._front = FrameSnapshot(0, MappingProxyType({}))
+
+    # --- Writers ---
+    def write(self, universe_num: int, start: int, data: bytes | Iterable[int]) -> bool:
+        """Write levels from channel ``start`` of a universe.
+
+        Returns:
+            Whether any channel changed.
+
+        Raises:
+            IndexError: If the range does not fit in 512 channels.
+            ValueError: If a level is outside 0-255.
+        """
+        data = bytes(data)
+        stop = start + len(data)
+        if start < 0 or stop > DMX_CHANNELS:
+            raise IndexError(f"Channels {start}-{stop - 1} are outside [0, {DMX_CHANNELS - 1}]")
+        with self._write_lock:
+            back = self._universe(universe_num)
+            current = back[start:stop]
+            if current == data:
+                return False
+            first, last = _diff_bounds(current, data)
+            back[start:stop] = data
+            _add_range(self._dirty[universe_num], start + first, start + last)
+            return True
+
+    def set_frame(self, universe_num: int, frame: bytes | Iterable[int]) -> bool:
+        """Replace a universe's whole frame (512 levels)."""
+        frame = bytes(frame)
+        if len(frame) != DMX_CHANNELS:
+            raise ValueError(f"A frame has {DMX_CHANNELS} levels, got {len(frame)}")
+        return self.write(universe_num, 0, frame)
+
+    def set_universe(self, universe: DmxUniverse) -> bool:
+        """Replace the frame of ``universe.universe_num`` with the universe's levels."""
+        return self.set_frame(universe.universe_num, universe.frame())
+
+    def update(self, frames: Mapping[int, bytes]) -> None:
+        """Replace several frames, e.g. the changes returned by ``DmxFadeEngine.tick()``."""
+        for universe_num, frame in frames.items():
+            self.set_frame(universe_num, frame)
+
+    # --- Flushing ---
+    def dirty_ranges(self, universe_num: int) -> list[tuple[int, int]]:
+        """``[start, stop)`` channel ranges written since the last flush."""
+        with self._write_lock:
+            return [tuple(r) for r in self._dirty.get(universe_num, ())]
+
+    def is_dirty(self) -> bool:
+        return any(self._dirty.values())
+
+    def flush(self, full: bool = False) -> list[DmxDelta]:
+        """Publish the back frames and return what changed since the last flush.
+
+        Args:
+            full: Return one whole-frame delta per universe instead of the
+                changes, e.g. to resynchronize a receiver.
+
+        Returns:
+            Deltas ordered by universe, then channel. Written ranges whose
+            levels ended up as published before are left out.
+        """
+        with self._write_lock:
+            published = self._front.frames
+            frames = dict(published)
+            deltas: list[DmxDelta] = []
+            for universe_num in sorted(self._back):
+                back = self._back[universe_num]
+                old = published.get(universe_num)
+                ranges = self._dirty[universe_num]
+                if ranges or old is None:
+                    frames[universe_num] = bytes(back)
+                if full or old is None:
+                    # A universe's first flush sends its whole frame
+                    deltas.append(DmxDelta(universe_num, 0, frames[universe_num]))
+                else:
+                    deltas.extend(
+                        DmxDelta(universe_num, start, bytes(back[start:stop]))
+                        for start, stop in _changed(old, back, ranges, self.merge_gap)
+                    )
+                ranges.clear()
+            self._front = FrameSnapshot(self._front.sequence + 1, MappingProxyType(frames))
+            return deltas
+
+    # --- Readers ---
+    def snapshot(self) -> FrameSnapshot:
+        """The frames published by the last flush, all from the same flush."""
+        return self._front
+
+    def frame(self, universe_num: int) -> bytes:
+        """The published frame of a universe (all zeros if none was published)."""
+        return self._front.frames.get(universe_num, bytes(DMX_CHANNELS))
+
+    def universes(self) -> list[int]:
+        return sorted(self._back)
+
+    # --- Internal helpers ---
+    def _universe(self, universe_num: int) -> bytearray:
+        back = self._back.get(universe_num)
+        if back is None:
+            back = self._back[universe_num] = bytearray(DMX_CHANNELS)
+            self._dirty[universe_num] = []
+        return back
+
+
+def _diff_bounds(old: bytes, new: bytes) -> tuple[int, int]:
+    """``[first, last)`` around the bytes that differ between two unequal, same-length buffers.
+
+    Bisects on slice equality, so the scan runs in C.
+    """
+    lo, hi = 0, len(new) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if old[:mid + 1] == new[:mid + 1]:
+            lo = mid + 1
+        else:
+            hi = mid
+    first = lo
+    lo, hi = first, len(new) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old[mid:] == new[mid:]:
+            hi = mid - 1
+        else:
+            lo = mid
+    return first, lo + 1
+
+
+def _add_range(ranges: list[list[int]], start: int, stop: int) -> None:
+    """Insert ``[start, stop)`` into sorted, disjoint ``ranges``, merging overlaps."""
+    i = 0
+    while i < len(ranges) and ranges[i][1] < start:
+        i += 1
+    j = i
+    while j < len(ranges) and ranges[j][0] <= stop:
+        start = min(start, ranges[j][0])
+        stop = max(stop, ranges[j][1])
+        j += 1
+    ranges[i:j] = [[start, stop]]
+
+
+def _changed(old: bytes, new: bytearray, ranges: list[list[int]], gap: int) -> list[tuple[int, int]]:
+    """Ranges of ``new`` that differ from ``old`` inside ``ranges``, merged across ``gap``."""
+    spans: list[list[int]] = []
+    for start, stop in ranges:
+        if old[start:stop] == new[start:stop]:
+            continue
+        for channel in range(start, stop):
+            if old[channel] != new[channel]:
+                if spans and channel - spans[-1][1] <= gap:
+                    spans[-1][1] = channel + 1
+                else:
+                    spans.append([channel, channel + 1])
+    return [(start, stop) for start, stop in spans]
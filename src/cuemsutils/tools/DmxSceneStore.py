@@ -0,0 +1,289 @@
+"""DmxSceneStore — DMX scenes held as deltas against other scenes.
+
+In a lighting-heavy show most ``DmxCue`` scenes differ from the previous
+one by a few channels. :class:`DmxSceneStore` keeps each scene as the
+list of channels that differ from a reference scene: by default the
+previous scene in the store, or any earlier scene given as ``base``. Every
+``keyframe_interval`` links (or when there is no reference) a scene is
+stored against the empty scene instead, which bounds how many deltas a
+lookup applies.
+
+:meth:`DmxSceneStore.scene` materializes a scene as
+:class:`~cuemsutils.tools.DmxBuffer.DmxBuffer` objects. The last scene
+materialized is remembered, so walking a show in order applies a single
+delta per scene.
+
+The store sits next to the script rather than replacing its format:
+:meth:`DmxSceneStore.from_cues` reads parsed ``DmxCue``s, and
+:meth:`DmxSceneStore.apply_to_cue` writes a stored scene back into a cue's
+``DmxUniverse`` before saving, so the XML stays the full ``DmxChannel``
+form ``script.xsd`` describes.
+"""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, NamedTuple
+
+from .DmxBuffer import DMX_CHANNELS, DmxBuffer
+
+if TYPE_CHECKING:
+    from ..cues.DmxCue import DmxCue, DmxScene, DmxUniverse
+
+DEFAULT_KEYFRAME_INTERVAL = 16
+
+_UNSET = -1
+
+# universe_num: (channels, values), values of _UNSET unset the channel;
+# None removes the universe
+Delta = dict[int, 'tuple[array, array] | None']
+
+
+class _Entry(NamedTuple):
+    ref: Hashable | None
+    depth: int
+    delta: Delta
+
+
+class DmxSceneStore:
+    """Ordered DMX scenes, each stored as a delta against another one.
+
+    Args:
+        keyframe_interval: Most deltas applied to materialize a scene.
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be >= 1, got {keyframe_interval}")
+        self.keyframe_interval = keyframe_interval
+        self._entries: dict[Hashable, _Entry] = {}
+        self._last: tuple[Hashable, dict[int, DmxBuffer]] | None = None
+
+    @classmethod
+    def from_cues(cls, cues: Iterable, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> DmxSceneStore:
+        """Store the scenes of the ``DmxCue``s among ``cues``, in order, keyed by cue id.
+
+        Cue lists are walked recursively; other cues are skipped.
+        """
+        store = cls(keyframe_interval)
+        for cue in iter_dmx_cues(cues):
+            store.append(cue.id, cue.DmxScene)
+        return store
+
+    # --- Adding scenes ---
+    def append(
+        self,
+        key: Hashable,
+        scene: DmxScene | DmxUniverse | Iterable[DmxUniverse] | Mapping[int, DmxBuffer],
+        base: Hashable | None = None,
+    ) -> None:
+        """Store a scene at the end, or in place of the scene stored under ``key``.
+
+        Args:
+            key: Any hashable key, usually the cue's id.
+            scene: A ``DmxScene``, ``DmxUniverse`` or several universes, or
+                ``{universe_num: DmxBuffer}`` as returned by :meth:`scene`.
+            base: Key of the scene to store the delta against; defaults to
+                the scene before it in the store.
+
+        Raises:
+            KeyError: If ``base`` is not in the store.
+            ValueError: If ``base`` is ``key``.
+        """
+        if base is None:
+            keys = list(self._entries)
+            position = keys.index(key) if key in self._entries else len(keys)
+            base = keys[position - 1] if position else None
+        elif base == key:
+            raise ValueError("A scene cannot be stored against itself")
+        elif base not in self._entries:
+            raise KeyError(base)
+        if base is not None and key in self._chain(base):
+            raise ValueError(f"Scene {base!r} is stored against {key!r}")
+        dependents = self._dependent_scenes(key)
+        self._entries[key] = self._entry(base, _buffers(scene))
+        self._last = None
+        self._rebase(dependents, key)
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a scene; scenes stored against it are re-based on its reference."""
+        ref = self._entries[key].ref
+        dependents = self._dependent_scenes(key)
+        del self._entries[key]
+        self._last = None
+        self._rebase(dependents, ref)
+
+    # --- Reading ---
+    def scene(self, key: Hashable) -> dict[int, DmxBuffer]:
+        """Materialize a scene as ``{universe_num: DmxBuffer}`` (fresh copies)."""
+        return {num: buf.copy() for num, buf in self._materialize(key).items()}
+
+    def frames(self, key: Hashable) -> dict[int, bytes]:
+        """A scene's 512-byte frames by universe number."""
+        return {num: buf.frame() for num, buf in self._materialize(key).items()}
+
+    def delta(self, key: Hashable) -> dict[int, list[tuple[int, int | None]] | None]:
+        """The stored changes of a scene against its reference.
+
+        ``{universe_num: [(channel, value), ...]}``, ``None`` as value for
+        an unset channel and as list for a removed universe.
+        """
+        return {
+            num: None if change is None else [
+                (channel, None if value == _UNSET else value)
+                for channel, value in zip(*change)
+            ]
+            for num, change in self._entries[key].delta.items()
+        }
+
+    def reference(self, key: Hashable) -> Hashable | None:
+        """Key of the scene ``key`` is stored against, ``None`` for a keyframe."""
+        return self._entries[key].ref
+
+    def apply_to_cue(self, cue: DmxCue, key: Hashable | None = None) -> None:
+        """Write a stored scene into a cue's ``DmxUniverse`` (by default the cue's own scene).
+
+        Raises:
+            ValueError: If the scene has more than one universe, which a
+                ``DmxScene`` cannot hold.
+        """
+        scene = self._materialize(cue.id if key is None else key)
+        if len(scene) > 1:
+            raise ValueError(f"A DmxScene holds one universe, the stored scene has {len(scene)}")
+        universe = cue.DmxScene.DmxUniverse
+        universe.buffer.clear()
+        for num, buf in scene.items():
+            universe.universe_num = num
+            universe.buffer.update(buf.items())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stored_channels(self) -> int:
+        """Channel entries held over all deltas, a measure of the store's size."""
+        return sum(
+            len(change[0])
+            for entry in self._entries.values()
+            for change in entry.delta.values()
+            if change is not None
+        )
+
+    # --- Internal helpers ---
+    def _entry(self, base: Hashable | None, buffers: Mapping[int, DmxBuffer]) -> _Entry:
+        if base is None or self._entries[base].depth + 1 >= self.keyframe_interval:
+            return _Entry(None, 0, _diff({}, buffers))
+        return _Entry(base, self._entries[base].depth + 1, _diff(self._materialize(base), buffers))
+
+    def _chain(self, key: Hashable) -> list[Hashable]:
+        """``key`` and the keys it is stored against, down to its keyframe."""
+        chain = []
+        while key is not None:
+            chain.append(key)
+            key = self._entries[key].ref
+        return chain
+
+    def _rebase(self, scenes: Mapping[Hashable, Mapping[int, DmxBuffer]], base: Hashable | None) -> None:
+        """Store ``scenes`` against ``base`` and keep their descendants within the keyframe interval."""
+        for key, scene in scenes.items():
+            self._entries[key] = self._entry(base, scene)
+        for key, entry in list(self._entries.items()):
+            depth = len(self._chain(key)) - 1
+            if depth != entry.depth:
+                if depth >= self.keyframe_interval:
+                    self._entries[key] = _Entry(None, 0, _diff({}, self._materialize(key)))
+                else:
+                    self._entries[key] = entry._replace(depth=depth)
+        self._last = None
+
+    def _dependent_scenes(self, key: Hashable) -> dict[Hashable, dict[int, DmxBuffer]]:
+        """Materialized scenes of the entries stored against ``key``."""
+        return {
+            other: self.scene(other)
+            for other, entry in self._entries.items()
+            if entry.ref == key
+        }
+
+    def _materialize(self, key: Hashable) -> dict[int, DmxBuffer]:
+        """The scene's buffers; shared with the memo, callers must not modify them."""
+        chain = []
+        last_key = self._last[0] if self._last is not None else None
+        current = key
+        while current is not None and current != last_key:
+            chain.append(current)
+            current = self._entries[current].ref
+        if current is None:
+            scene: dict[int, DmxBuffer] = {}
+        else:
+            scene = {num: buf.copy() for num, buf in self._last[1].items()}
+        for current in reversed(chain):
+            _apply(scene, self._entries[current].delta)
+        self._last = (key, scene)
+        return scene
+
+
+def iter_dmx_cues(cues: Iterable) -> Iterator[DmxCue]:
+    """``DmxCue``s among ``cues``, walking into cue lists, in order."""
+    for cue in cues:
+        if hasattr(cue, 'DmxScene'):
+            yield cue
+        elif isinstance(getattr(cue, 'contents', None), list):
+            yield from iter_dmx_cues(cue.contents)
+
+
+def _buffers(scene) -> dict[int, DmxBuffer]:
+    if isinstance(scene, Mapping) and all(isinstance(v, DmxBuffer) for v in scene.values()):
+        return dict(scene)
+    if hasattr(scene, 'buffer'):
+        universes = [scene]
+    elif isinstance(scene, Mapping):
+        universe = scene.get('DmxUniverse')
+        universes = [] if universe is None else [universe]
+    else:
+        universes = scene
+    return {universe.universe_num: universe.buffer for universe in universes}
+
+
+def _diff(old: Mapping[int, DmxBuffer], new: Mapping[int, DmxBuffer]) -> Delta:
+    delta: Delta = {}
+    for num in old.keys() - new.keys():
+        delta[num] = None
+    for num, buf in new.items():
+        before = old.get(num)
+        if before is None:
+            before = DmxBuffer()
+        elif before == buf:
+            continue
+        channels, values = array('H'), array('h')
+        old_values, old_mask = before.values, before.mask
+        new_values, new_mask = buf.values, buf.mask
+        for channel in range(DMX_CHANNELS):
+            if new_mask[channel]:
+                if not old_mask[channel] or old_values[channel] != new_values[channel]:
+                    channels.append(channel)
+                    values.append(new_values[channel])
+            elif old_mask[channel]:
+                channels.append(channel)
+                values.append(_UNSET)
+        delta[num] = (channels, values)
+    return delta
+
+
+def _apply(scene: dict[int, DmxBuffer], delta: Delta) -> None:
+    for num, change in delta.items():
+        if change is None:
+            scene.pop(num, None)
+            continue
+        buf = scene.get(num)
+        if buf is None:
+            buf = scene[num] = DmxBuffer()
+        for channel, value in zip(*change):
+            if value == _UNSET:
+                del buf[channel]
+            else:
+                buf[channel] = value
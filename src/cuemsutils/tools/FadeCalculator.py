@@ -1,6 +1,8 @@
 from collections.abc import Callable
+from functools import partial
 
 from .CTimecode import CTimecode
+from .FadeCurves import FADE_CURVES, curve_values
 
 
 class FadeCalculator:
@@ -19,22 +21,27 @@ class FadeCalculator:
         Calculate a timeline of timecodes between start_time and end_time.
 
         Args:
-            fade_function: The fade function to apply to the timeline.
+            fade_function: The fade function to apply to the timeline: a callable, a curve method
+                name of FadeCalculator or a curve name registered in FadeCurves.FADE_CURVES.
             **kwargs: Additional keyword arguments to pass to the timeline calculation and the fade function.
 
         Returns:
             A list of tuples, each containing a timecode and the value of the fade function at that timecode.
 
         Raises:
-            ValueError: If fade_function is a string and not a valid function name of FadeCalculator.
+            ValueError: If fade_function is a string and neither a function name of FadeCalculator
+                nor a registered fade curve.
         """
         timeline_args = {k: v for k,v in kwargs.items() if k in FadeCalculator.TIMELINE_PARAMS}
         for k in timeline_args.keys():
             kwargs.pop(k)
         if isinstance(fade_function, str):
-            if not hasattr(FadeCalculator, fade_function):
+            if hasattr(FadeCalculator, fade_function):
+                fade_function = getattr(FadeCalculator, fade_function)
+            elif fade_function in FADE_CURVES:
+                fade_function = partial(curve_values, fade_function)
+            else:
                 raise ValueError(f"Invalid fade function name: {fade_function}")
-            fade_function = getattr(FadeCalculator, fade_function)
         if not callable(fade_function):
             raise ValueError(f"Invalid fade function: {fade_function}")
         timeline = FadeCalculator.calculate_timeline(**timeline_args)
@@ -0,0 +1,148 @@
+"""Arm-time compilation of MediaCue fade profiles.
+
+A ``FadeProfile`` carries a ``function_id`` string and a list of
+``FadeFunctionParameter`` items. Interpreting them (registry lookup,
+parameter checks, building the curve table and envelope) is work that does
+not depend on when GO arrives, so :func:`compile_media_fades` does it when
+the cue is armed and returns :class:`CompiledFades`: the fade-in and
+fade-out placed on the media timeline, between the region's in and out
+points (or ``0`` and ``Media.duration``), with their envelopes taken from
+the shared :mod:`~cuemsutils.tools.FadeEnvelopeCache`.
+
+At GO the player only reads :meth:`CompiledFades.gain` or walks the
+envelopes.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from .FadeCurves import FadeCurve, curve_for_profile
+from .FadeEnvelopeCache import DEFAULT_STEP_MILLISECONDS, FadeEnvelope, fade_envelope
+from .TimecodeCache import parse_timecode
+
+if TYPE_CHECKING:
+    from ..cues.MediaCue import MediaCue
+
+
+class CompiledFade(NamedTuple):
+    """One fade of a media cue, ready to play.
+
+    ``start`` and ``end`` are milliseconds on the media timeline.
+    """
+
+    type: str
+    curve: FadeCurve
+    envelope: FadeEnvelope
+    start: int
+    end: int
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+    def gain(self, position: float) -> float:
+        """Gain (0–1) this fade applies at ``position`` ms of the media."""
+        t = (position - self.start) / (self.end - self.start)
+        shaped = self.curve(t)
+        return shaped if self.type == 'in' else 1.0 - shaped
+
+
+class CompiledFades(NamedTuple):
+    """Fade-in and fade-out of a media cue over its playback window (ms)."""
+
+    fade_in: CompiledFade | None
+    fade_out: CompiledFade | None
+    play_start: int
+    play_end: int | None
+
+    def gain(self, position: float) -> float:
+        """Combined fade gain (0–1) at ``position`` ms of the media."""
+        gain = 1.0
+        if self.fade_in is not None:
+            gain *= self.fade_in.gain(position)
+        if self.fade_out is not None:
+            gain *= self.fade_out.gain(position)
+        return gain
+
+
+def _milliseconds(value) -> int:
+    if value is None or value == '':
+        return 0
+    if isinstance(value, str):
+        value = parse_timecode(value)
+    return value.milliseconds_rounded
+
+
+def playback_window(cue: MediaCue) -> tuple[int, int | None]:
+    """``(start, end)`` in ms of the media a cue plays.
+
+    Uses the first region's in and out points; a missing or zero out point
+    means the end of the media (``None`` when ``Media.duration`` is unset).
+    """
+    media = cue.media
+    start, end = 0, 0
+    regions = media.get('regions') if media else None
+    if regions:
+        region = regions[0]
+        start = _milliseconds(region.get('in_time'))
+        end = _milliseconds(region.get('out_time'))
+    if not end:
+        duration = media.get('duration') if media else None
+        end = _milliseconds(duration) or None
+    return start, end
+
+
+def compile_media_fades(
+    cue: MediaCue,
+    fade_in=None,
+    fade_out=None,
+    framerate='ms',
+    step: int = DEFAULT_STEP_MILLISECONDS,
+) -> CompiledFades:
+    """Resolve a cue's fade profiles into envelopes on its playback window.
+
+    Args:
+        cue: The media cue.
+        fade_in: Fade-in length in ms or as a timecode; ignored without an ``in`` profile.
+        fade_out: Fade-out length in ms or as a timecode; ignored without an ``out`` profile.
+        framerate: Framerate the envelope steps are snapped to.
+        step: Milliseconds between envelope steps.
+
+    Raises:
+        ValueError: If a profile cannot be resolved, a profile has no (or a
+            non-positive) length, the playback window is empty, a fade-out is
+            requested but the end of the window is unknown, or the fades do
+            not fit in the window.
+    """
+    start, end = playback_window(cue)
+    if end is not None and end <= start:
+        raise ValueError(f"Empty playback window: {start} to {end} ms")
+    fades: dict[str, CompiledFade] = {}
+    for direction, length in (('in', fade_in), ('out', fade_out)):
+        profile = cue.get_fade_profile(direction)
+        if profile is None:
+            continue
+        if length is None:
+            raise ValueError(f"Fade {direction} profile needs a length")
+        length = length if isinstance(length, (int, float)) else _milliseconds(length)
+        length = round(length)
+        if length <= 0:
+            raise ValueError(f"Fade {direction} length must be > 0, got {length}")
+        if direction == 'out' and end is None:
+            raise ValueError("Media duration is unknown; cannot place the fade out")
+        curve = curve_for_profile(profile)
+        envelope = fade_envelope(curve.name, length, framerate, step, **curve.params)
+        fade_start = start if direction == 'in' else end - length
+        fades[direction] = CompiledFade(direction, curve, envelope, fade_start, fade_start + length)
+    if 'in' in fades and 'out' in fades and fades['in'].end > fades['out'].start:
+        raise ValueError(
+            f"Fades of {fades['in'].duration} + {fades['out'].duration} ms"
+            f" exceed the {end - start} ms playback window"
+        )
+    for fade in fades.values():
+        if end is not None and (fade.start < start or fade.end > end):
+            raise ValueError(
+                f"Fade {fade.type} of {fade.duration} ms exceeds the"
+                f" {end - start} ms playback window"
+            )
+    return CompiledFades(fades.get('in'), fades.get('out'), start, end)
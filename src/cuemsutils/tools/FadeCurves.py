@@ -0,0 +1,308 @@
+"""FadeCurves — registry of fade curve shapes backed by lookup tables.
+
+Every :class:`~cuemsutils.cues.FadeCue.FadeCurveType` value and every
+``FadeProfile.function_id`` the scripts use is registered here as a
+:class:`FadeShape`: a normalized shape ``f: [0, 1] -> [0, 1]`` with
+``f(0) == 0`` and ``f(1) == 1``, plus the names and defaults of its
+parameters.
+
+Binding a shape to a set of parameters gives a :class:`FadeCurve`, which
+samples the shape once into a table of ``LUT_SIZE + 1`` doubles. Evaluating a
+fade at playback time is then an index and a linear interpolation, never a
+call to ``exp``/``log``/``pow``. Bound curves are kept per shape, so the
+table for a given parameter set is built once.
+
+>>> curve = get_fade_curve('exponential', growth=3.0)
+>>> curve(0.0), curve(1.0)
+(0.0, 1.0)
+>>> values = curve.values(100, 0.0, 1.0)  # same signature as FadeCalculator.linear
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from array import array
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..cues.FadeCue import FadeCurveType
+    from ..cues.FadeProfile import FadeFunctionParameter, FadeProfile
+
+LUT_SIZE = 4096
+"""Number of intervals of a curve's lookup table."""
+
+BOUND_CURVES_PER_SHAPE = 64
+"""Parameter sets kept per shape before the oldest table is dropped."""
+
+
+class FadeCurve:
+    """A fade shape bound to its parameters, evaluated by table lookup.
+
+    Args:
+        name: Name of the shape the curve comes from.
+        fn: Normalized shape function of one float in [0, 1].
+        params: Parameter values the curve was built with.
+        size: Number of intervals of the lookup table.
+    """
+
+    __slots__ = ('name', 'params', 'table', '_size')
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[float], float],
+        params: Mapping[str, float] | None = None,
+        size: int = LUT_SIZE,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self.name = name
+        self.params = dict(params or {})
+        table = [float(fn(i / size)) for i in range(size + 1)]
+        # Pin the ends so a fade always starts and lands exactly on its values
+        table[0] = 0.0
+        table[-1] = 1.0
+        self.table = array('d', table)
+        self._size = size
+
+    def __call__(self, t: float) -> float:
+        """Curve value at normalized position ``t`` (clamped to [0, 1])."""
+        if t <= 0.0:
+            return 0.0
+        if t >= 1.0:
+            return 1.0
+        pos = t * self._size
+        i = int(pos)
+        a = self.table[i]
+        return a + (self.table[i + 1] - a) * (pos - i)
+
+    def sample(self, n: int) -> list[float]:
+        """``n`` evenly spaced normalized values from 0 to 1 inclusive."""
+        if n < 2:
+            raise ValueError(f"n must be >= 2, got {n}")
+        last = n - 1
+        return [self(i / last) for i in range(n)]
+
+    def values(self, length: int, start_value: float, end_value: float) -> list[float]:
+        """Fade values from ``start_value`` to ``end_value`` over ``length`` steps.
+
+        Same signature and end points as ``FadeCalculator.linear``, so a
+        bound curve can be passed to ``FadeCalculator.calculate``.
+        """
+        span = end_value - start_value
+        return [start_value + span * v for v in self.sample(length)]
+
+    def __repr__(self) -> str:
+        params = ', '.join(f"{k}={v!r}" for k, v in self.params.items())
+        return f"<FadeCurve {self.name}({params})>"
+
+
+class FadeShape:
+    """A registered fade shape and its parameters.
+
+    Args:
+        name: Registry name, a ``FadeCurveType`` value or a profile ``function_id``.
+        fn: ``fn(x, **params)`` normalized shape, ``fn(0) == 0`` and ``fn(1) == 1``.
+        parameters: Parameter names mapped to their default, or ``None`` when required.
+        minimums: Parameter names mapped to a value they must be greater than.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[..., float],
+        parameters: Mapping[str, float | None] | None = None,
+        minimums: Mapping[str, float] | None = None,
+    ) -> None:
+        self.name = name
+        self.fn = fn
+        self.parameters: dict[str, float | None] = dict(parameters or {})
+        self.minimums: dict[str, float] = dict(minimums or {})
+        self._curves: dict[tuple[tuple[str, float], ...], FadeCurve] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def required(self) -> tuple[str, ...]:
+        return tuple(k for k, v in self.parameters.items() if v is None)
+
+    def resolve_params(self, params: Mapping[str, Any]) -> dict[str, float]:
+        """Merge ``params`` over the defaults and check them.
+
+        Raises:
+            ValueError: On unknown or missing parameters, non-finite values,
+                or values not above the shape's minimum.
+        """
+        unknown = set(params) - set(self.parameters)
+        if unknown:
+            raise ValueError(
+                f"Unknown parameters for fade curve {self.name!r}: {sorted(unknown)}"
+            )
+        out = {}
+        for key, default in self.parameters.items():
+            value = params.get(key, default)
+            if value is None:
+                raise ValueError(
+                    f"Fade curve {self.name!r} requires parameter {key!r}"
+                )
+            value = float(value)
+            if not math.isfinite(value):
+                raise ValueError(f"Parameter {key!r} must be a finite number")
+            minimum = self.minimums.get(key)
+            if minimum is not None and not value > minimum:
+                raise ValueError(
+                    f"Parameter {key!r} of fade curve {self.name!r} must be"
+                    f" > {minimum}, got {value}"
+                )
+            out[key] = value
+        return out
+
+    def bind(self, **params: float) -> FadeCurve:
+        """The table-backed curve for ``params``, built on first use."""
+        resolved = self.resolve_params(params)
+        key = tuple(sorted(resolved.items()))
+        with self._lock:
+            curve = self._curves.get(key)
+        if curve is not None:
+            return curve
+        curve = FadeCurve(self.name, lambda x: self.fn(x, **resolved), resolved)
+        with self._lock:
+            if len(self._curves) >= BOUND_CURVES_PER_SHAPE:
+                self._curves.pop(next(iter(self._curves)))
+            return self._curves.setdefault(key, curve)
+
+    def __repr__(self) -> str:
+        return f"<FadeShape {self.name} {self.parameters}>"
+
+
+FADE_CURVES: dict[str, FadeShape] = {}
+"""Shape name -> :class:`FadeShape`."""
+
+
+def register_fade_curve(
+    name: str,
+    fn: Callable[..., float],
+    parameters: Mapping[str, float | None] | None = None,
+    replace: bool = True,
+    minimums: Mapping[str, float] | None = None,
+) -> FadeShape:
+    """Register a fade shape under ``name``.
+
+    Args:
+        name: A ``FadeCurveType`` value or ``FadeProfile.function_id``.
+        fn: ``fn(x, **params)`` normalized shape on [0, 1].
+        parameters: Parameter names mapped to defaults (``None`` when required).
+        replace: Whether to replace an existing shape of the same name.
+        minimums: Parameter names mapped to a value they must be greater than.
+
+    Returns:
+        The registered shape.
+    """
+    if not replace and name in FADE_CURVES:
+        return FADE_CURVES[name]
+    shape = FadeShape(name, fn, parameters, minimums)
+    FADE_CURVES[name] = shape
+    return shape
+
+
+def get_fade_shape(curve: FadeCurveType | str) -> FadeShape:
+    """The registered shape for a ``FadeCurveType`` or name.
+
+    Raises:
+        ValueError: If no shape is registered under that name.
+    """
+    name = str(curve)
+    try:
+        return FADE_CURVES[name]
+    except KeyError:
+        raise ValueError(f"Unknown fade curve: {name!r}") from None
+
+
+def get_fade_curve(curve: FadeCurveType | str, **params: float) -> FadeCurve:
+    """The table-backed curve for a ``FadeCurveType`` or name and its parameters."""
+    return get_fade_shape(curve).bind(**params)
+
+
+def parameters_to_dict(
+    parameters: Iterable[FadeFunctionParameter | Mapping[str, Any]] | None,
+) -> dict[str, float]:
+    """``FadeFunctionParameter`` list to a ``{parameter_name: parameter_value}`` dict."""
+    return {
+        p['parameter_name']: float(p['parameter_value'])
+        for p in parameters or ()
+    }
+
+
+def curve_for_profile(profile: FadeProfile) -> FadeCurve:
+    """The table-backed curve described by a ``FadeProfile``.
+
+    ``preset`` profiles use the shape's defaults; ``parametric`` profiles
+    override them with their ``parameters`` list.
+
+    Raises:
+        ValueError: If ``function_id`` is not registered, a parametric
+            profile misses a required parameter or names an unknown one, or
+            a preset profile uses a shape that has required parameters.
+    """
+    shape = get_fade_shape(profile.function_id)
+    if profile.mode == 'parametric':
+        return shape.bind(**parameters_to_dict(profile.parameters))
+    if shape.required:
+        raise ValueError(
+            f"Fade function {shape.name!r} needs parameters "
+            f"{list(shape.required)} and cannot be used as a preset"
+        )
+    return shape.bind()
+
+
+def curve_values(
+    name: FadeCurveType | str,
+    length: int,
+    start_value: float,
+    end_value: float,
+    **params: float,
+) -> list[float]:
+    """``get_fade_curve(name, **params).values(length, start_value, end_value)``."""
+    return get_fade_curve(name, **params).values(length, start_value, end_value)
+
+
+# --- Shapes ---
+def _linear(x: float) -> float:
+    return x
+
+
+def _exponential(x: float, growth: float) -> float:
+    if growth == 0.0:
+        return x
+    return math.expm1(growth * x) / math.expm1(growth)
+
+
+def _logarithmic(x: float, growth: float) -> float:
+    if growth == 0.0:
+        return x
+    return math.log1p(math.expm1(growth) * x) / growth
+
+
+def _sigmoid(x: float, inflec: float, growth: float) -> float:
+    # FadeCalculator.sigmoid's curve on a normalized axis, scaled so f(1) == 1
+    def h(v: float) -> float:
+        return 1.0 - 1.0 / (1.0 + (v / inflec) ** growth)
+    return h(x) / h(1.0)
+
+
+def _bezier(x: float, p1: float, p2: float) -> float:
+    # Cubic Bezier with control points evenly spaced in time, so t == x
+    u = 1.0 - x
+    return 3.0 * u * u * x * p1 + 3.0 * u * x * x * p2 + x * x * x
+
+
+register_fade_curve('linear', _linear)
+register_fade_curve('exponential', _exponential, {'growth': 5.0})
+register_fade_curve('logarithmic', _logarithmic, {'growth': 5.0})
+register_fade_curve(
+    'sigmoid', _sigmoid, {'inflec': 0.5, 'growth': 4.0},
+    minimums={'inflec': 0.0, 'growth': 0.0},
+)
+register_fade_curve('linear_in_out', _linear)
+register_fade_curve('bezier', _bezier, {'p1': None, 'p2': None})
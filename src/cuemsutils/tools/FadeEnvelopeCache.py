@@ -0,0 +1,193 @@
+"""Memoized fade envelopes shared between cues.
+
+Shows reuse a handful of fade shapes (a 2 s linear out, a 5 s sigmoid in)
+and every GO used to recompute them. :func:`fade_envelope` computes each
+distinct ``(curve, parameters, duration, framerate, step)`` once and keeps
+the result in a size-bounded LRU cache.
+
+Envelopes are normalized (0 to 1) so fades between any two levels share
+them; :meth:`FadeEnvelope.levels` scales one to a fade's start and end
+values. Offsets and values are read-only ``memoryview`` objects over
+packed ``array`` buffers, so one envelope can be handed to every cue that
+needs it without copying and without any of them being able to modify it.
+``numpy.frombuffer(envelope.values)`` wraps them without a copy as well.
+"""
+from __future__ import annotations
+
+import threading
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple
+
+from .CTimecode import framerate_info
+from .FadeCurves import FadeCurve, get_fade_shape
+from .FastTimecode import FastTimecode
+
+if TYPE_CHECKING:
+    from ..cues.FadeCue import FadeCurveType
+
+ENVELOPE_CACHE_SIZE = 256
+
+DEFAULT_STEP_MILLISECONDS = 20
+"""Same step as ``FadeCalculator.TRANSITION_DURATION_MILLISECONDS``."""
+
+
+class FadeEnvelope:
+    """Normalized fade values at millisecond offsets from the fade start.
+
+    Offsets follow ``FadeCalculator.calculate_timeline``: one every ``step``
+    milliseconds, snapped to the start of a frame at ``framerate`` counted
+    from the fade start, with the last one moved to the end of the fade (and
+    at least two points). Each value is the curve at ``offset / duration``.
+    """
+
+    __slots__ = ('curve', 'duration', 'step', 'framerate', 'offsets', 'values')
+
+    def __init__(self, curve: FadeCurve, duration: int, framerate='ms', step: int = DEFAULT_STEP_MILLISECONDS):
+        if duration <= 0:
+            raise ValueError(f"duration must be > 0, got {duration}")
+        if step <= 0:
+            raise ValueError(f"step must be > 0, got {step}")
+        rate = framerate_info(framerate)
+        steps = max(2, duration // step)
+        offsets = [
+            FastTimecode.from_seconds(i * step / 1000, rate.framerate).milliseconds_rounded
+            for i in range(steps - 1)
+        ]
+        offsets.append(duration)
+        self.curve = curve
+        self.duration = duration
+        self.step = step
+        self.framerate = rate.framerate
+        self.offsets = memoryview(array('q', offsets)).toreadonly()
+        self.values = memoryview(array('d', [curve(o / duration) for o in offsets])).toreadonly()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def levels(self, start_value: float, end_value: float) -> list[float]:
+        """Envelope values scaled from ``start_value`` to ``end_value``."""
+        span = end_value - start_value
+        return [start_value + span * v for v in self.values]
+
+    def __repr__(self) -> str:
+        return f"<FadeEnvelope {self.curve!r} {self.duration} ms, {len(self)} steps>"
+
+
+class EnvelopeCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _milliseconds(duration) -> int:
+    ms = getattr(duration, 'milliseconds_rounded', None)
+    if ms is None:
+        ms = round(duration)
+    return int(ms)
+
+
+class FadeEnvelopeCache:
+    """Thread-safe LRU cache of :class:`FadeEnvelope` objects.
+
+    Args:
+        maxsize: Number of envelopes kept before the least recently used is evicted.
+    """
+
+    def __init__(self, maxsize: int = ENVELOPE_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be >= 1, got {maxsize}")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, FadeEnvelope] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        curve: FadeCurveType | str,
+        duration,
+        framerate='ms',
+        step: int = DEFAULT_STEP_MILLISECONDS,
+        **params: float,
+    ) -> FadeEnvelope:
+        """Return the envelope for a curve and its timing, computing it at most once.
+
+        Args:
+            curve: A ``FadeCurveType`` or registered fade curve name.
+            duration: Fade length in milliseconds, or a timecode (``milliseconds_rounded`` is used).
+            framerate: Framerate the step offsets are snapped to.
+            step: Milliseconds between steps.
+            **params: Curve parameters; defaults are filled in before the lookup.
+
+        Raises:
+            ValueError: For an unknown curve, invalid parameters, or a non-positive duration or step.
+        """
+        shape = get_fade_shape(curve)
+        resolved = shape.resolve_params(params)
+        duration = _milliseconds(duration)
+        rate = framerate_info(framerate)
+        key = (shape.name, tuple(sorted(resolved.items())), duration, rate, step)
+        with self._lock:
+            envelope = self._entries.get(key)
+            if envelope is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return envelope
+            self._misses += 1
+        envelope = FadeEnvelope(shape.bind(**resolved), duration, rate.framerate, step)
+        with self._lock:
+            # Another thread may have computed it meanwhile; keep the first one
+            envelope = self._entries.setdefault(key, envelope)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return envelope
+
+    def info(self) -> EnvelopeCacheInfo:
+        with self._lock:
+            return EnvelopeCacheInfo(
+                self._hits, self._misses, self._evictions, self.maxsize, len(self._entries)
+            )
+
+    def clear(self) -> None:
+        """Drop every envelope and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+ENVELOPE_CACHE = FadeEnvelopeCache()
+
+
+def fade_envelope(
+    curve: FadeCurveType | str,
+    duration,
+    framerate='ms',
+    step: int = DEFAULT_STEP_MILLISECONDS,
+    **params: float,
+) -> FadeEnvelope:
+    """Return the shared envelope from the process-wide cache (see :meth:`FadeEnvelopeCache.get`)."""
+    return ENVELOPE_CACHE.get(curve, duration, framerate, step, **params)
+
+
+def cache_info() -> EnvelopeCacheInfo:
+    """Hits, misses, evictions and sizes of the process-wide envelope cache."""
+    return ENVELOPE_CACHE.info()
+
+
+def cache_clear() -> None:
+    """Empty the process-wide envelope cache and reset its counters."""
+    ENVELOPE_CACHE.clear()
@@ -0,0 +1,335 @@
+"""FadeMixer — all running fades advanced together, one vectorized step per tick.
+
+Each running fade (from a ``FadeCue`` or a ``MediaCue`` fade profile) is a
+row in a set of parallel NumPy arrays: target slot, start time, duration,
+start and end values, curve row, priority and start order. The curves'
+lookup tables (see :mod:`cuemsutils.tools.FadeCurves`) are stacked in one
+2-D array, so :meth:`FadeMixer.tick` evaluates every fade, whatever its
+curve, with the same handful of array operations.
+
+Overlapping fades on one target resolve as follows:
+
+- a new fade replaces the target's running fades of the same or lower
+  priority, and starts from the target's current value when no start value
+  is given (latest takes precedence);
+- a fade of higher priority keeps control until it finishes, then the
+  running lower-priority fade takes over.
+
+``tick()`` returns only targets whose value changed since the last tick.
+Finished fades are removed after their final value has been emitted; the
+target keeps that value. Array rows are only held by running fades: a
+target with none left gives its slot back and a curve no fade uses gives
+back its table row, both reused by later fades.
+
+Requires the optional ``numpy`` dependency (``pip install cuemsutils[numpy]``).
+"""
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .FadeCurves import LUT_SIZE, FadeCurve, curve_for_profile, get_fade_curve
+
+if TYPE_CHECKING:
+    from ..cues.FadeCue import FadeCue, FadeCurveType
+    from ..cues.FadeProfile import FadeProfile
+
+_FIELDS = {
+    'target': np.intp,
+    'start': np.float64,
+    'duration': np.float64,
+    'from': np.float64,
+    'to': np.float64,
+    'curve': np.intp,
+    'priority': np.int64,
+    'seq': np.int64,
+    'id': np.int64,
+}
+
+
+class FadeMixer:
+    """Running fades of many targets in struct-of-arrays form.
+
+    Times are milliseconds on whatever clock the caller ticks the mixer
+    with; fades added without ``start_ms`` start at the last tick.
+
+    Args:
+        capacity: Initial number of fade rows; the arrays double when full.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self._cols = {k: np.zeros(capacity, dtype=t) for k, t in _FIELDS.items()}
+        self._n = 0
+        self._tables = np.zeros((capacity, LUT_SIZE + 1), dtype=np.float64)
+        self._curve_rows: dict[int, int] = {}
+        self._curves: list[FadeCurve | None] = []
+        self._free_curves: list[int] = []
+        self._targets: list[Hashable] = []
+        self._slots: dict[Hashable, int] = {}
+        self._live = np.zeros(capacity, dtype=bool)
+        self._values = np.zeros(capacity, dtype=np.float64)
+        self._emitted = np.zeros(capacity, dtype=np.float64)
+        self._free_slots: list[int] = []
+        # Values of targets without a slot, already emitted
+        self._settled: dict[Hashable, float] = {}
+        self._seq = 0
+        self._now = 0.0
+
+    # --- Adding fades ---
+    def add(
+        self,
+        target: Hashable,
+        end_value: float,
+        duration: float,
+        curve: FadeCurve | FadeCurveType | str = 'linear',
+        start_value: float | None = None,
+        start_ms: float | None = None,
+        priority: int = 0,
+        **params: float,
+    ) -> int:
+        """Start a fade of ``target`` to ``end_value``.
+
+        Args:
+            target: Any hashable key, usually the target cue's id.
+            end_value: Value at the end of the fade.
+            duration: Fade length in milliseconds.
+            curve: A bound ``FadeCurve``, a ``FadeCurveType`` or a registered curve name.
+            start_value: Value at the start; defaults to the target's current value.
+            start_ms: Start time; defaults to the last tick.
+            priority: Fades of higher priority win over running ones.
+            **params: Curve parameters, when ``curve`` is not already bound.
+
+        Returns:
+            An id for :meth:`cancel`.
+
+        Raises:
+            ValueError: If ``duration`` is not positive, the curve is invalid,
+                or ``start_value`` is missing for a target the mixer has no value for.
+        """
+        if duration <= 0:
+            raise ValueError(f"duration must be > 0, got {duration}")
+        if not isinstance(curve, FadeCurve):
+            curve = get_fade_curve(curve, **params)
+        elif params:
+            raise ValueError("Parameters cannot be given with an already bound FadeCurve")
+        slot = self._slots.get(target)
+        if start_value is None:
+            start_value = self.value(target)
+            if start_value is None:
+                raise ValueError(f"start_value is required for new target {target!r}")
+        if slot is None:
+            slot = self._add_target(target, start_value)
+        self._supersede(slot, priority)
+        if self._n == len(self._cols['target']):
+            self._grow()
+        self._seq += 1
+        row = self._n
+        cols = self._cols
+        cols['target'][row] = slot
+        cols['start'][row] = self._now if start_ms is None else start_ms
+        cols['duration'][row] = duration
+        cols['from'][row] = start_value
+        cols['to'][row] = end_value
+        cols['curve'][row] = self._curve_row(curve)
+        cols['priority'][row] = priority
+        cols['seq'][row] = self._seq
+        cols['id'][row] = self._seq
+        self._n += 1
+        return self._seq
+
+    def add_fade_cue(self, cue: FadeCue, start_ms: float | None = None, priority: int = 0) -> int:
+        """Start the fade described by a ``FadeCue`` on its ``action_target``.
+
+        The start value is the target's current value, as the cue does not store one.
+        """
+        if cue.duration is None:
+            raise ValueError("FadeCue has no duration")
+        return self.add(
+            cue.action_target,
+            cue.target_value,
+            cue.duration.milliseconds_rounded,
+            cue.curve_type,
+            start_ms=start_ms,
+            priority=priority,
+        )
+
+    def add_fade_profile(
+        self,
+        target: Hashable,
+        profile: FadeProfile,
+        duration: float,
+        level: float,
+        start_ms: float | None = None,
+        priority: int = 0,
+    ) -> int:
+        """Start a ``MediaCue`` fade profile on ``target``.
+
+        An ``in`` profile fades from 0 to ``level``; an ``out`` profile fades
+        from the target's current value (``level`` for a new target) to 0.
+        """
+        curve = curve_for_profile(profile)
+        if profile.type == 'in':
+            return self.add(target, level, duration, curve, 0.0, start_ms, priority)
+        start = None if self.value(target) is not None else level
+        return self.add(target, 0.0, duration, curve, start, start_ms, priority)
+
+    def cancel(self, fade_id: int) -> bool:
+        """Stop a fade where it is; the target keeps its current value."""
+        keep = self._cols['id'][:self._n] != fade_id
+        if keep.all():
+            return False
+        self._keep(keep)
+        return True
+
+    def cancel_target(self, target: Hashable) -> int:
+        """Stop every fade of ``target``. Returns how many were running."""
+        slot = self._slots.get(target)
+        if slot is None:
+            return 0
+        keep = self._cols['target'][:self._n] != slot
+        removed = self._n - int(keep.sum())
+        self._keep(keep)
+        return removed
+
+    # --- Ticking ---
+    def tick(self, now_ms: float) -> dict[Hashable, float]:
+        """Advance every fade to ``now_ms``.
+
+        Returns:
+            ``{target: value}`` for the targets whose value changed.
+        """
+        self._now = now_ms
+        n = self._n
+        if n:
+            c = {k: v[:n] for k, v in self._cols.items()}
+            progress = np.clip((now_ms - c['start']) / c['duration'], 0.0, 1.0)
+            pos = progress * LUT_SIZE
+            i = np.minimum(pos.astype(np.intp), LUT_SIZE - 1)
+            lo = self._tables[c['curve'], i]
+            hi = self._tables[c['curve'], i + 1]
+            shaped = lo + (hi - lo) * (pos - i)
+            shaped[progress >= 1.0] = 1.0
+            values = c['from'] + (c['to'] - c['from']) * shaped
+            # Winner per target: highest priority, then latest started
+            order = np.lexsort((c['seq'], c['priority'], c['target']))
+            targets = c['target'][order]
+            last = np.ones(n, dtype=bool)
+            last[:-1] = targets[1:] != targets[:-1]
+            winners = order[last]
+            self._values[c['target'][winners]] = values[winners]
+            done = progress >= 1.0
+            if done.any():
+                self._keep(~done)
+        changed = np.flatnonzero(self._values != self._emitted)
+        self._emitted[changed] = self._values[changed]
+        out = {self._targets[s]: float(self._values[s]) for s in changed}
+        self._release_targets()
+        return out
+
+    # --- Inspection ---
+    def value(self, target: Hashable) -> float | None:
+        """The target's current value, or ``None`` if the mixer never saw it."""
+        slot = self._slots.get(target)
+        if slot is None:
+            return self._settled.get(target)
+        return float(self._values[slot])
+
+    def set_value(self, target: Hashable, value: float) -> None:
+        """Set a target's current value (e.g. the level a cue started at)."""
+        slot = self._slots.get(target)
+        if slot is None:
+            self._add_target(target, value)
+        else:
+            self._values[slot] = value
+
+    def active_targets(self) -> set[Hashable]:
+        return {self._targets[s] for s in np.unique(self._cols['target'][:self._n])}
+
+    def __len__(self) -> int:
+        return self._n
+
+    # --- Internal helpers ---
+    def _add_target(self, target: Hashable, value: float) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._targets)
+            self._targets.append(None)
+            if slot == len(self._values):
+                self._live = np.concatenate((self._live, np.zeros_like(self._live)))
+                self._values = np.concatenate((self._values, np.zeros_like(self._values)))
+                self._emitted = np.concatenate((self._emitted, np.zeros_like(self._emitted)))
+        self._targets[slot] = target
+        self._slots[target] = slot
+        self._live[slot] = True
+        self._values[slot] = value
+        # A new target is not emitted yet, so the first tick reports it
+        self._emitted[slot] = self._settled.pop(target, np.nan)
+        return slot
+
+    def _release_targets(self) -> None:
+        """Give back the slots of emitted targets that have no running fade."""
+        idle = self._live.copy()
+        idle[self._cols['target'][:self._n]] = False
+        for slot in np.flatnonzero(idle).tolist():
+            target = self._targets[slot]
+            self._settled[target] = float(self._values[slot])
+            del self._slots[target]
+            self._targets[slot] = None
+            self._live[slot] = False
+            self._values[slot] = self._emitted[slot] = 0.0
+            self._free_slots.append(slot)
+
+    def _curve_row(self, curve: FadeCurve) -> int:
+        row = self._curve_rows.get(id(curve))
+        if row is None:
+            if self._free_curves:
+                row = self._free_curves.pop()
+                self._curves[row] = curve
+            else:
+                row = len(self._curves)
+                self._curves.append(curve)  # keeps id(curve) alive and unique
+                if row == len(self._tables):
+                    self._tables = np.concatenate((self._tables, np.zeros_like(self._tables)))
+            self._curve_rows[id(curve)] = row
+            table = np.frombuffer(curve.table, dtype=np.float64)
+            if len(table) != LUT_SIZE + 1:
+                table = np.interp(
+                    np.linspace(0.0, 1.0, LUT_SIZE + 1),
+                    np.linspace(0.0, 1.0, len(table)),
+                    table,
+                )
+            self._tables[row] = table
+        return row
+
+    def _release_curves(self) -> None:
+        """Give back the table rows of curves no running fade uses."""
+        used = np.zeros(len(self._curves), dtype=bool)
+        used[self._cols['curve'][:self._n]] = True
+        for row in np.flatnonzero(~used).tolist():
+            curve = self._curves[row]
+            if curve is not None:
+                del self._curve_rows[id(curve)]
+                self._curves[row] = None
+                self._free_curves.append(row)
+
+    def _supersede(self, slot: int, priority: int) -> None:
+        n = self._n
+        same = self._cols['target'][:n] == slot
+        if same.any():
+            self._keep(~(same & (self._cols['priority'][:n] <= priority)))
+
+    def _keep(self, mask: np.ndarray) -> None:
+        kept = int(mask.sum())
+        for col in self._cols.values():
+            col[:kept] = col[:self._n][mask]
+        self._n = kept
+        self._release_curves()
+
+    def _grow(self) -> None:
+        for k, col in self._cols.items():
+            self._cols[k] = np.concatenate((col, np.zeros_like(col)))
@@ -0,0 +1,162 @@
+"""Fades at the resolution of their output.
+
+A fade sampled every 20 ms sends 90,000 messages over 30 minutes, even
+though a 0–100 volume or an 8-bit DMX channel only has a few hundred
+distinct values to go through. :func:`change_points` works the other way
+round: it finds, for each quantization threshold the fade crosses, the time
+at which it crosses it, and returns only those points.
+
+Thresholds are found on the curve's lookup table (see
+:mod:`cuemsutils.tools.FadeCurves`) by scanning its segments once and
+inverting the linear interpolation inside each segment, so the times are
+exact for the table-backed curve the player would evaluate, monotonic or
+not. :func:`suppress_duplicates` does the same filtering on a fade that is
+already sampled on a fixed step.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+from .FadeCurves import FadeCurve, get_fade_curve
+
+if TYPE_CHECKING:
+    from ..cues.FadeCue import FadeCurveType
+
+
+def quantize(value: float, resolution: float) -> float:
+    """Round ``value`` to the nearest multiple of ``resolution`` (halves round up)."""
+    return math.floor(value / resolution + 0.5) * resolution
+
+
+def suppress_duplicates(
+    pairs: Iterable[tuple[Any, float]],
+    resolution: float = 1.0,
+) -> Iterator[tuple[Any, float]]:
+    """Quantize a stream of ``(position, value)`` pairs and drop repeated values.
+
+    For already sampled fades, such as ``FadeCalculator.calculate()`` or
+    :func:`~cuemsutils.tools.FadeStream.stream_fade` output.
+    """
+    last = None
+    for position, value in pairs:
+        value = quantize(value, resolution)
+        if value != last:
+            last = value
+            yield position, value
+
+
+def change_points(
+    curve: FadeCurve | FadeCurveType | str,
+    duration: float,
+    start_value: float,
+    end_value: float,
+    resolution: float = 1.0,
+    min_interval: float = 0.0,
+    **params: float,
+) -> list[tuple[float, float]]:
+    """Times at which a fade's quantized value changes, and the new values.
+
+    The first point is ``(0, quantize(start_value))``; the value at the end
+    of the fade is always the last point's value.
+
+    Args:
+        curve: A bound ``FadeCurve``, a ``FadeCurveType`` or a registered curve name.
+        duration: Fade length in milliseconds.
+        start_value: Value at offset 0.
+        end_value: Value at ``duration``.
+        resolution: Output step; values are rounded to multiples of it. The
+            default of 1 suits 0–100 levels and 8-bit DMX values alike.
+        min_interval: Minimum milliseconds between two points. Changes that
+            come sooner are merged into one point carrying the latest value,
+            sent ``min_interval`` after the previous one (never after ``duration``).
+        **params: Curve parameters, when ``curve`` is not already bound.
+
+    Returns:
+        A list of ``(offset, value)`` with increasing offsets in milliseconds
+        and no two consecutive equal values.
+
+    Raises:
+        ValueError: For a non-positive duration or resolution, a negative
+            min_interval, or invalid curve parameters.
+    """
+    if isinstance(curve, FadeCurve):
+        if params:
+            raise ValueError("Parameters cannot be given with an already bound FadeCurve")
+    else:
+        curve = get_fade_curve(curve, **params)
+    if duration <= 0:
+        raise ValueError(f"duration must be > 0, got {duration}")
+    if resolution <= 0:
+        raise ValueError(f"resolution must be > 0, got {resolution}")
+    if min_interval < 0:
+        raise ValueError(f"min_interval must be >= 0, got {min_interval}")
+    points = [(0.0, quantize(start_value, resolution))]
+    if start_value == end_value:
+        return points
+    return _throttle(
+        _crossings(curve, duration, start_value, end_value, resolution, points),
+        min_interval,
+        duration,
+    )
+
+
+def _crossings(curve, duration, start_value, end_value, resolution, points):
+    span = end_value - start_value
+    table = curve.table
+    size = len(table) - 1
+    # Work in steps of resolution; a crossing of k + 0.5 moves the output to k or k + 1
+    scaled = [(start_value + span * s) / resolution + 0.5 for s in table]
+    level = math.floor(scaled[0])
+    for i in range(size):
+        a0 = scaled[i]
+        b = scaled[i + 1]
+        while True:
+            if b >= level + 1:
+                # Rising through level + 1
+                threshold, new_level = level + 1, level + 1
+            elif b < level:
+                threshold, new_level = level, level - 1
+            else:
+                break
+            frac = (threshold - a0) / (b - a0)
+            offset = (i + min(max(frac, 0.0), 1.0)) / size * duration
+            value = new_level * resolution
+            if offset == points[-1][0]:
+                points[-1] = (offset, value)
+            else:
+                points.append((offset, value))
+            level = new_level
+    # Drop consecutive duplicates left by merges at the same offset
+    out = [points[0]]
+    for point in points[1:]:
+        if point[1] != out[-1][1]:
+            out.append(point)
+    return out
+
+
+def _throttle(points, min_interval, duration):
+    if min_interval <= 0 or len(points) < 2:
+        return points
+    out = [points[0]]
+    pending = None
+    for offset, value in points[1:]:
+        earliest = out[-1][0] + min_interval
+        if pending is not None and offset >= earliest:
+            if pending != out[-1][1]:
+                out.append((earliest, pending))
+                earliest += min_interval
+            pending = None
+        if offset >= earliest:
+            if value != out[-1][1]:
+                out.append((offset, value))
+        else:
+            pending = value
+    if pending is not None and pending != out[-1][1]:
+        offset = min(out[-1][0] + min_interval, duration)
+        if offset == out[-1][0]:
+            out[-1] = (offset, pending)
+        else:
+            out.append((offset, pending))
+    return out
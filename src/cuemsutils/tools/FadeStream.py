@@ -0,0 +1,155 @@
+"""Lazy fade evaluation.
+
+``FadeCalculator.calculate()`` builds the whole timeline and value list
+before the first value is available. The helpers here compute each value
+when it is asked for, from a table-backed
+:class:`~cuemsutils.tools.FadeCurves.FadeCurve`, so memory does not grow
+with the fade length and a fade can start anywhere in its course (a seek,
+or a GO that arrives late):
+
+- :func:`stream_fade` yields ``(offset, value)`` pairs on a fixed step;
+- :class:`FadeParams` is a :class:`~cuemsutils.tools.ParamSource.ParamSource`
+  indexed by quarter-frame, to be passed as a ``CTimecodeTimer``'s
+  ``params``. Each tick calls the callback with ``(offset, value)``.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from .CTimecode import framerate_info
+from .FadeCurves import FadeCurve, get_fade_curve
+from .FadeEnvelopeCache import DEFAULT_STEP_MILLISECONDS
+from .ParamSource import ParamSource
+
+if TYPE_CHECKING:
+    from ..cues.FadeCue import FadeCurveType
+
+
+def _resolve_curve(curve: FadeCurve | FadeCurveType | str, params: dict) -> FadeCurve:
+    if isinstance(curve, FadeCurve):
+        if params:
+            raise ValueError("Parameters cannot be given with an already bound FadeCurve")
+        return curve
+    return get_fade_curve(curve, **params)
+
+
+def _check_timing(duration: float, start_offset: float) -> None:
+    if duration <= 0:
+        raise ValueError(f"duration must be > 0, got {duration}")
+    if not 0 <= start_offset <= duration:
+        raise ValueError(f"start_offset must be within [0, {duration}], got {start_offset}")
+
+
+def stream_fade(
+    curve: FadeCurve | FadeCurveType | str,
+    duration: float,
+    start_value: float,
+    end_value: float,
+    step: float = DEFAULT_STEP_MILLISECONDS,
+    start_offset: float = 0,
+    **params: float,
+) -> Iterator[tuple[float, float]]:
+    """Yield ``(offset, value)`` pairs of a fade, computed one at a time.
+
+    The first pair is at ``start_offset``, the following ones on the
+    multiples of ``step`` after it and the last one at ``duration``.
+
+    Args:
+        curve: A bound ``FadeCurve``, a ``FadeCurveType`` or a registered curve name.
+        duration: Fade length in milliseconds.
+        start_value: Value at offset 0.
+        end_value: Value at ``duration``.
+        step: Milliseconds between values.
+        start_offset: Milliseconds into the fade of the first value.
+        **params: Curve parameters, when ``curve`` is not already bound.
+
+    Raises:
+        ValueError: For invalid timing or curve parameters. Raised at the
+            call, not on the first ``next()``.
+    """
+    fade = _resolve_curve(curve, params)
+    _check_timing(duration, start_offset)
+    if step <= 0:
+        raise ValueError(f"step must be > 0, got {step}")
+    return _stream(fade, duration, start_value, end_value - start_value, step, start_offset)
+
+
+def _stream(fade, duration, start_value, span, step, start_offset):
+    yield start_offset, start_value + span * fade(start_offset / duration)
+    i = math.floor(start_offset / step) + 1
+    while (offset := i * step) < duration:
+        yield offset, start_value + span * fade(offset / duration)
+        i += 1
+    if start_offset < duration:
+        yield duration, start_value + span * fade(1.0)
+
+
+class FadeParams(ParamSource):
+    """Fade values for a quarter-frame timer, computed per tick.
+
+    Item ``i`` is ``(offset, value)`` at ``start_offset + i * interval``
+    milliseconds into the fade; the last item lands exactly on the end of
+    the fade, after which the source is exhausted. Random access keeps it
+    consistent with the timer's seeks and ``start_timecode`` lookup.
+
+    Args:
+        curve: A bound ``FadeCurve``, a ``FadeCurveType`` or a registered curve name.
+        duration: Fade length in milliseconds.
+        start_value: Value at offset 0.
+        end_value: Value at ``duration``.
+        interval: Milliseconds between items, usually one quarter-frame
+            (see :meth:`quarter_frames`).
+        start_offset: Milliseconds into the fade of item 0.
+        **params: Curve parameters, when ``curve`` is not already bound.
+    """
+
+    def __init__(
+        self,
+        curve: FadeCurve | FadeCurveType | str,
+        duration: float,
+        start_value: float,
+        end_value: float,
+        interval: float,
+        start_offset: float = 0,
+        **params: float,
+    ) -> None:
+        self.curve = _resolve_curve(curve, params)
+        _check_timing(duration, start_offset)
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        self.duration = duration
+        self.start_value = start_value
+        self.end_value = end_value
+        self.interval = interval
+        self.start_offset = start_offset
+        self._span = end_value - start_value
+        self._length = math.ceil((duration - start_offset) / interval - 1e-9) + 1
+
+    @classmethod
+    def quarter_frames(
+        cls,
+        curve: FadeCurve | FadeCurveType | str,
+        duration: float,
+        start_value: float,
+        end_value: float,
+        framerate='ms',
+        start_offset: float = 0,
+        **params: float,
+    ) -> FadeParams:
+        """A source with one item per quarter-frame at ``framerate``, as ``CTimecodeTimer`` ticks."""
+        fr = framerate_info(framerate).float_framerate
+        return cls(curve, duration, start_value, end_value, 1000.0 / (4.0 * fr), start_offset, **params)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def exhausted(self, index: int) -> bool:
+        return index >= self._length
+
+    def __getitem__(self, index: int) -> tuple[float, float]:
+        if index < 0 or index >= self._length:
+            raise IndexError(index)
+        offset = min(self.start_offset + index * self.interval, self.duration)
+        return offset, self.start_value + self._span * self.curve(offset / self.duration)
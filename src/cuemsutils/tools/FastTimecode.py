@@ -0,0 +1,306 @@
+"""FastTimecode — lean integer-backed timecode value for hot paths.
+
+``CTimecode`` inherits the upstream ``timecode.Timecode`` machinery: every
+``+``/``-`` runs the full constructor (framerate setter, default
+``tc_to_frames`` parse) and every comparison recomputes a float from
+``frame_number``. MTC listeners and playback loops compare and advance
+positions thousands of times per second, so they can use ``FastTimecode``
+instead: an immutable, slotted pair of an integer 0-based frame number and a
+shared :class:`~cuemsutils.tools.CTimecode.FramerateInfo`.
+
+Semantics match ``CTimecode``:
+
+- *playhead* semantics — ``frame_number`` ``n`` is at ``n / fps`` seconds, so
+  ``FastTimecode.from_ctimecode(tc).milliseconds_exact == tc.milliseconds_exact``;
+- drop-frame math at 29.97/59.94 DF mirrors upstream's ``tc_to_frames`` /
+  ``frames_to_tc`` (see :func:`hmsf_to_frame_number` and
+  :func:`frame_number_to_hmsf`);
+- equality, ordering and hashing go through ``milliseconds_rounded`` across
+  framerates (and against ``CTimecode``), and through plain integer frame
+  comparison when both operands share a framerate;
+- arithmetic between different framerates raises ``CTimecodeError``.
+
+Arithmetic and comparison never parse or format strings. ``str()`` formats
+from integers; string *input* goes through ``CTimecode`` once
+(:meth:`FastTimecode.from_string`).
+"""
+from __future__ import annotations
+
+from .CTimecode import CTimecode, CTimecodeError, FramerateInfo, framerate_info
+
+_set = object.__setattr__
+
+
+def hmsf_to_frame_number(hrs: int, mins: int, secs: int, frs: int, info: FramerateInfo) -> int:
+    """Return the 0-based frame number of an HMSF label (drop-frame aware).
+
+    Integer mirror of upstream ``Timecode.tc_to_frames`` minus its ``+1``.
+    """
+    ifps = info.int_framerate
+    total_minutes = 60 * hrs + mins
+    return (
+        ifps * 3600 * hrs + ifps * 60 * mins + ifps * secs + frs
+        - info.drop_frames * (total_minutes - total_minutes // 10)
+    )
+
+
+def frame_number_to_hmsf(frame_number: int, info: FramerateInfo) -> tuple[int, int, int, int]:
+    """Return the HMSF label of a 0-based frame number (drop-frame aware).
+
+    Integer mirror of upstream ``Timecode.frames_to_tc`` with
+    ``skip_rollover=True``, the mode ``CTimecode.__str__`` uses.
+    """
+    ifps = info.int_framerate
+    if info.drop_frame:
+        drop = info.drop_frames
+        ffps = info.float_framerate
+        frames_per_10_minutes = round(ffps * 600)
+        frames_per_minute = int(round(ffps) * 60) - drop
+        d, m = divmod(frame_number, frames_per_10_minutes)
+        if m > drop:
+            frame_number += drop * 9 * d + drop * ((m - drop) // frames_per_minute)
+        else:
+            frame_number += drop * 9 * d
+    total_secs, frs = divmod(frame_number, ifps)
+    total_mins, secs = divmod(total_secs, 60)
+    hrs, mins = divmod(total_mins, 60)
+    return hrs, mins, secs, frs
+
+
+def seconds_to_frame_number(seconds: float, info: FramerateInfo) -> int:
+    """Return the playhead 0-based frame number at ``seconds``.
+
+    Same route as ``CTimecode(start_seconds=...)``: round to label frames,
+    split into HMSF, then apply drop-frame correction.
+    """
+    if seconds < 0:
+        raise ValueError(f"seconds must be non-negative, got {seconds}")
+    ifps = info.int_framerate
+    total_frames = round(seconds * ifps)
+    hrs, rem = divmod(total_frames, ifps * 3600)
+    mins, rem = divmod(rem, ifps * 60)
+    secs, frs = divmod(rem, ifps)
+    return hmsf_to_frame_number(hrs, mins, secs, frs, info)
+
+
+def format_hmsf(hrs: int, mins: int, secs: int, frs: int, info: FramerateInfo) -> str:
+    """Format an HMSF label the way ``CTimecode.__str__`` does."""
+    if info.drop_frame:
+        return f"{hrs:02d}:{mins:02d}:{secs:02d};{frs:02d}"
+    if info.ms_frame:
+        return f"{hrs:02d}:{mins:02d}:{secs:02d}.{frs:03d}"
+    return f"{hrs:02d}:{mins:02d}:{secs:02d}:{frs:02d}"
+
+
+class FastTimecode:
+    """Immutable integer-frame timecode with ``CTimecode`` playhead semantics."""
+
+    __slots__ = ('_frame_number', '_rate')
+
+    def __init__(self, frame_number: int = 0, framerate='ms'):
+        """Create a timecode at a 0-based frame number.
+
+        Args:
+            frame_number: Elapsed frames from 00:00:00:00 (``CTimecode.frame_number``).
+            framerate: Any framerate ``CTimecode`` accepts, or a ``FramerateInfo``.
+
+        Raises:
+            TypeError: If frame_number is not an int.
+            ValueError: If frame_number is negative.
+        """
+        if not isinstance(frame_number, int) or isinstance(frame_number, bool):
+            raise TypeError(
+                f"frame_number must be int, not {type(frame_number).__name__}"
+            )
+        if frame_number < 0:
+            raise ValueError(f"frame_number must be >= 0, got {frame_number}")
+        _set(self, '_frame_number', frame_number)
+        _set(self, '_rate', framerate_info(framerate))
+
+    @classmethod
+    def _make(cls, frame_number: int, rate: FramerateInfo) -> FastTimecode:
+        # Trusted constructor for arithmetic results: skips validation and
+        # the framerate cache lookup.
+        self = object.__new__(cls)
+        _set(self, '_frame_number', frame_number)
+        _set(self, '_rate', rate)
+        return self
+
+    # ------------------------------------------------------------------
+    # conversions
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_ctimecode(cls, tc: CTimecode) -> FastTimecode:
+        return cls._make(tc.frame_number, framerate_info(tc.framerate))
+
+    @classmethod
+    def from_seconds(cls, seconds: float, framerate='ms') -> FastTimecode:
+        info = framerate_info(framerate)
+        return cls._make(seconds_to_frame_number(seconds, info), info)
+
+    @classmethod
+    def from_string(cls, timecode: str, framerate='ms') -> FastTimecode:
+        """Parse a timecode string once through ``CTimecode``."""
+        return cls.from_ctimecode(CTimecode(timecode, framerate=framerate))
+
+    def to_ctimecode(self) -> CTimecode:
+        return CTimecode(framerate=self._rate.framerate, frames=self._frame_number + 1)
+
+    def return_in_other_framerate(self, framerate) -> FastTimecode:
+        """Frame-domain conversion, same rounding as ``CTimecode.return_in_other_framerate``."""
+        info = framerate_info(framerate)
+        new_frame_number = round(
+            self._frame_number * info.int_framerate / self._rate.int_framerate
+        )
+        return self._make(new_frame_number, info)
+
+    # ------------------------------------------------------------------
+    # accessors
+    # ------------------------------------------------------------------
+    @property
+    def frame_number(self) -> int:
+        return self._frame_number
+
+    @property
+    def frames(self) -> int:
+        """1-indexed frame count, as upstream ``Timecode.frames``."""
+        return self._frame_number + 1
+
+    @property
+    def rate(self) -> FramerateInfo:
+        return self._rate
+
+    @property
+    def framerate(self):
+        return self._rate.framerate
+
+    @property
+    def drop_frame(self) -> bool:
+        return self._rate.drop_frame
+
+    @property
+    def milliseconds_exact(self) -> float:
+        return self._frame_number * 1000 / self._rate.float_framerate
+
+    @property
+    def milliseconds_rounded(self) -> int:
+        return round(self._frame_number * 1000 / self._rate.float_framerate)
+
+    @property
+    def hmsf(self) -> tuple[int, int, int, int]:
+        return frame_number_to_hmsf(self._frame_number, self._rate)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return (FastTimecode, (self._frame_number, self._rate.framerate))
+
+    # ------------------------------------------------------------------
+    # arithmetic
+    # ------------------------------------------------------------------
+    def _other_frame_number(self, other) -> int:
+        if isinstance(other, int) and not isinstance(other, bool):
+            return other
+        if isinstance(other, FastTimecode):
+            if other._rate.int_framerate != self._rate.int_framerate:
+                raise CTimecodeError(
+                    f"Arithmetic between timecodes of different framerates "
+                    f"({self.framerate} vs {other.framerate}); use "
+                    f".return_in_other_framerate() first."
+                )
+            return other._frame_number
+        if isinstance(other, CTimecode):
+            return self._other_frame_number(FastTimecode.from_ctimecode(other))
+        raise CTimecodeError(
+            f"Type {other.__class__.__name__} not supported for arithmetic."
+        )
+
+    def __add__(self, other) -> FastTimecode:
+        """Advance by a frame count (int) or a duration (timecode)."""
+        result = self._frame_number + self._other_frame_number(other)
+        if result < 0:
+            raise ValueError(f"timecode arithmetic result is negative ({result} frames)")
+        return self._make(result, self._rate)
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> FastTimecode:
+        """Rewind by a frame count (int) or a duration (timecode); no silent wrap."""
+        result = self._frame_number - self._other_frame_number(other)
+        if result < 0:
+            raise ValueError(f"timecode arithmetic result is negative ({result} frames)")
+        return self._make(result, self._rate)
+
+    # ------------------------------------------------------------------
+    # hashing + comparison
+    # ------------------------------------------------------------------
+    def _cmp_pair(self, other):
+        # Same framerate → compare integer frames; otherwise fall back to the
+        # CTimecode contract (rounded milliseconds).
+        if isinstance(other, FastTimecode):
+            if other._rate is self._rate or other._rate == self._rate:
+                return self._frame_number, other._frame_number
+            return self.milliseconds_rounded, other.milliseconds_rounded
+        if isinstance(other, CTimecode):
+            return self.milliseconds_rounded, other.milliseconds_rounded
+        if isinstance(other, int) and not isinstance(other, bool):
+            return self.milliseconds_rounded, other
+        return None
+
+    def __hash__(self):
+        # Matches CTimecode.__hash__ so equal values hash equal across types.
+        return hash((self.milliseconds_rounded,))
+
+    def __eq__(self, other):
+        if isinstance(other, int):
+            return NotImplemented
+        pair = self._cmp_pair(other)
+        if pair is None:
+            return NotImplemented
+        return pair[0] == pair[1]
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __lt__(self, other):
+        pair = self._cmp_pair(other)
+        if pair is None:
+            return NotImplemented
+        return pair[0] < pair[1]
+
+    def __le__(self, other):
+        pair = self._cmp_pair(other)
+        if pair is None:
+            return NotImplemented
+        return pair[0] <= pair[1]
+
+    def __gt__(self, other):
+        pair = self._cmp_pair(other)
+        if pair is None:
+            return NotImplemented
+        return pair[0] > pair[1]
+
+    def __ge__(self, other):
+        pair = self._cmp_pair(other)
+        if pair is None:
+            return NotImplemented
+        return pair[0] >= pair[1]
+
+    # ------------------------------------------------------------------
+    # serialization
+    # ------------------------------------------------------------------
+    def __str__(self):
+        return format_hmsf(*frame_number_to_hmsf(self._frame_number, self._rate), self._rate)
+
+    def __repr__(self):
+        return f"FastTimecode({self._frame_number}, framerate={self.framerate!r})"
+
+    def __json__(self):
+        return {"CTimecode": self.__str__()}
@@ -0,0 +1,197 @@
+"""Lazy parameter sources for quarter-frame timers.
+
+``CTimecodeTimer`` used to freeze ``params`` into a tuple of tuples, so a
+ten-minute fade at the ``'ms'`` framerate (2.4 million quarter-frames)
+materialized every tuple before the first tick. A ``ParamSource`` produces
+the argument tuple for a quarter-frame index on demand instead:
+
+- :class:`CallableParams` — ``fn(index)``, with an optional length;
+- :class:`ArrayParams` — rows of a NumPy (or any ``tolist()``-able) array,
+  read without copying the array;
+- :class:`GeneratorParams` — a one-shot iterable, pulled as the timer
+  advances and kept in a bounded look-back window.
+
+All of them are indexed like a sequence, so seeks (forward skips,
+timecode-indexed lookup) read the tuple at the new index directly.
+Indexing past the end raises ``IndexError``, which the timer treats as
+exhaustion. :func:`as_param_source` picks a source for whatever was passed
+as ``params``.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable
+from typing import Any, Callable
+
+GENERATOR_WINDOW = 256
+"""Items a :class:`GeneratorParams` keeps for backward seeks."""
+
+
+class NotBufferedError(ValueError):
+    """An item that existed was dropped from a :class:`GeneratorParams` window."""
+
+
+def _as_args(value: Any) -> tuple:
+    """Callback arguments for one item: tuples and lists unpack, scalars wrap."""
+    if isinstance(value, tuple):
+        return value
+    if isinstance(value, list):
+        return tuple(value)
+    return (value,)
+
+
+class ParamSource(ABC):
+    """Random-access sequence of callback argument tuples, built lazily."""
+
+    @abstractmethod
+    def __getitem__(self, index: int) -> tuple:
+        """Arguments for quarter-frame ``index``.
+
+        Raises:
+            IndexError: If ``index`` is negative or past the end.
+        """
+
+    def exhausted(self, index: int) -> bool:
+        """Whether ``index`` is past the last item."""
+        try:
+            self[index]
+        except IndexError:
+            return True
+        return False
+
+
+class CallableParams(ParamSource):
+    """Arguments computed by ``fn(index)``.
+
+    ``length`` bounds the source; without it the callable signals the end by
+    raising ``IndexError`` (or never ends).
+    """
+
+    def __init__(self, fn: Callable[[int], Any], length: int | None = None) -> None:
+        if length is not None and length < 0:
+            raise ValueError(f"length must be >= 0, got {length}")
+        self._fn = fn
+        self._length = length
+        # (index, args, error) of the last call, so exhausted() and the
+        # read that follows it run fn once
+        self._last: tuple[int, tuple | None, Exception | None] | None = None
+
+    def __len__(self) -> int:
+        if self._length is None:
+            raise TypeError("CallableParams without a length has no len()")
+        return self._length
+
+    def exhausted(self, index: int) -> bool:
+        if self._length is not None:
+            return index >= self._length
+        try:
+            self[index]
+        except IndexError:
+            return True
+        except Exception:
+            # Not the end; the error surfaces when the item is read
+            return False
+        return False
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0 or (self._length is not None and index >= self._length):
+            raise IndexError(index)
+        last = self._last
+        if last is None or last[0] != index:
+            try:
+                last = (index, _as_args(self._fn(index)), None)
+            except Exception as exc:
+                last = (index, None, exc)
+            self._last = last
+        if last[2] is not None:
+            raise last[2]
+        return last[1]
+
+
+class ArrayParams(ParamSource):
+    """Rows of an array: 1-D items become ``(value,)``, 2-D rows unpack."""
+
+    def __init__(self, array) -> None:
+        if getattr(array, "ndim", 1) not in (1, 2):
+            raise ValueError(f"array must be 1-D or 2-D, got ndim={array.ndim}")
+        self._array = array
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def exhausted(self, index: int) -> bool:
+        return index >= len(self._array)
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0 or index >= len(self._array):
+            raise IndexError(index)
+        item = self._array[index]
+        return _as_args(item.tolist() if hasattr(item, "tolist") else item)
+
+
+class GeneratorParams(ParamSource):
+    """A one-shot iterable, consumed as the timer advances.
+
+    Forward seeks consume the skipped items. Only the last ``window`` items
+    are kept; reading an index older than that raises
+    :class:`NotBufferedError`.
+    """
+
+    def __init__(self, iterable: Iterable, window: int = GENERATOR_WINDOW) -> None:
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self._iter = iter(iterable)
+        self._buffer: deque[tuple] = deque(maxlen=window)
+        self._next = 0  # index of the next item the iterator yields
+        self._length: int | None = None
+
+    def exhausted(self, index: int) -> bool:
+        if index < 0:
+            return True
+        if index < self._next:
+            # Already yielded, whether or not it is still buffered
+            return False
+        return super().exhausted(index)
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0:
+            raise IndexError(index)
+        while self._next <= index:
+            if self._length is not None:
+                raise IndexError(index)
+            try:
+                item = next(self._iter)
+            except StopIteration:
+                self._length = self._next
+                raise IndexError(index) from None
+            self._buffer.append(_as_args(item))
+            self._next += 1
+        offset = index - (self._next - len(self._buffer))
+        if offset < 0:
+            raise NotBufferedError(
+                f"GeneratorParams: index {index} is no longer buffered"
+                f" (window of {self._buffer.maxlen})"
+            )
+        return self._buffer[offset]
+
+
+def as_param_source(params) -> tuple[tuple, ...] | ParamSource | None:
+    """Normalize a timer's ``params`` argument.
+
+    ``None`` and empty sequences mean bare-signal mode (``None``). Lists and
+    tuples are frozen into a tuple of tuples as before; ``ParamSource``
+    instances pass through; arrays, callables and iterators are wrapped.
+    """
+    if params is None or isinstance(params, ParamSource):
+        return params
+    if hasattr(params, "ndim"):
+        return ArrayParams(params) if len(params) > 0 else None
+    if callable(params):
+        return CallableParams(params)
+    if hasattr(params, "__next__"):
+        return GeneratorParams(params)
+    if len(params) > 0:
+        return tuple(tuple(p) for p in params)
+    return None
@@ -0,0 +1,206 @@
+"""TimecodeArray — NumPy-backed batch of timecodes at one framerate.
+
+Paths that convert many positions at once (fade timelines, cue list
+offsets, region lists, MTC logs) used to build one ``CTimecode`` per value
+and call ``str()`` on it. ``TimecodeArray`` holds the 0-based frame numbers
+of a whole batch in an ``int64`` array and converts them with array
+arithmetic, using the same playhead semantics, drop-frame rules and
+rounding as :class:`~cuemsutils.tools.FastTimecode.FastTimecode` (itself
+checked against ``CTimecode``).
+
+Requires the optional ``numpy`` dependency (``pip install cuemsutils[numpy]``).
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from .CTimecode import CTimecode, CTimecodeError, FramerateInfo, framerate_info
+from .FastTimecode import FastTimecode
+
+
+def _hmsf_to_frame_numbers(hrs, mins, secs, frs, info: FramerateInfo) -> np.ndarray:
+    # Vector form of FastTimecode.hmsf_to_frame_number.
+    ifps = info.int_framerate
+    total_minutes = 60 * hrs + mins
+    return (
+        ifps * 3600 * hrs + ifps * 60 * mins + ifps * secs + frs
+        - info.drop_frames * (total_minutes - total_minutes // 10)
+    )
+
+
+def _frame_numbers_to_hmsf(frame_numbers: np.ndarray, info: FramerateInfo) -> np.ndarray:
+    # Vector form of FastTimecode.frame_number_to_hmsf.
+    fn = frame_numbers
+    if info.drop_frame:
+        drop = info.drop_frames
+        ffps = info.float_framerate
+        frames_per_10_minutes = round(ffps * 600)
+        frames_per_minute = int(round(ffps) * 60) - drop
+        d, m = np.divmod(fn, frames_per_10_minutes)
+        fn = fn + np.where(
+            m > drop,
+            drop * 9 * d + drop * ((m - drop) // frames_per_minute),
+            drop * 9 * d,
+        )
+    total_secs, frs = np.divmod(fn, info.int_framerate)
+    total_mins, secs = np.divmod(total_secs, 60)
+    hrs, mins = np.divmod(total_mins, 60)
+    return np.stack((hrs, mins, secs, frs), axis=-1)
+
+
+class TimecodeArray:
+    """Immutable array of frame numbers sharing one framerate."""
+
+    __slots__ = ('_frame_numbers', '_rate')
+
+    def __init__(self, frame_numbers: Iterable[int] | np.ndarray, framerate='ms'):
+        """Wrap 0-based frame numbers (``CTimecode.frame_number``).
+
+        Raises:
+            ValueError: If any frame number is negative or the input is not 1-D.
+        """
+        arr = np.array(frame_numbers, dtype=np.int64)
+        if arr.ndim != 1:
+            raise ValueError(f"frame_numbers must be 1-D, got shape {arr.shape}")
+        if arr.size and arr.min() < 0:
+            raise ValueError("frame_numbers must be >= 0")
+        arr.flags.writeable = False
+        self._frame_numbers = arr
+        self._rate = framerate_info(framerate)
+
+    @classmethod
+    def _wrap(cls, arr: np.ndarray, rate: FramerateInfo) -> TimecodeArray:
+        self = object.__new__(cls)
+        arr.flags.writeable = False
+        self._frame_numbers = arr
+        self._rate = rate
+        return self
+
+    # ------------------------------------------------------------------
+    # construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_seconds(cls, seconds, framerate='ms') -> TimecodeArray:
+        """Batch ``CTimecode(start_seconds=s)``: playhead semantics, drop-frame correct."""
+        info = framerate_info(framerate)
+        s = np.asarray(seconds, dtype=np.float64)
+        if s.size and s.min() < 0:
+            raise ValueError("seconds must be non-negative")
+        ifps = info.int_framerate
+        total_frames = np.rint(s * ifps).astype(np.int64)
+        hrs, rem = np.divmod(total_frames, ifps * 3600)
+        mins, rem = np.divmod(rem, ifps * 60)
+        secs, frs = np.divmod(rem, ifps)
+        return cls._wrap(
+            np.atleast_1d(_hmsf_to_frame_numbers(hrs, mins, secs, frs, info)), info
+        )
+
+    @classmethod
+    def from_milliseconds(cls, milliseconds, framerate='ms') -> TimecodeArray:
+        return cls.from_seconds(np.asarray(milliseconds, dtype=np.float64) / 1000, framerate)
+
+    @classmethod
+    def from_timecodes(cls, timecodes: Iterable[CTimecode | FastTimecode], framerate=None) -> TimecodeArray:
+        """Collect timecodes of a single framerate.
+
+        Raises:
+            CTimecodeError: If the timecodes do not share one framerate.
+        """
+        items = list(timecodes)
+        if framerate is None:
+            if not items:
+                raise ValueError("framerate is required for an empty TimecodeArray")
+            framerate = items[0].framerate
+        info = framerate_info(framerate)
+        frame_numbers = []
+        for tc in items:
+            if framerate_info(tc.framerate) != info:
+                raise CTimecodeError(
+                    f"TimecodeArray holds a single framerate ({info.framerate}), "
+                    f"got {tc.framerate}; use .return_in_other_framerate() first."
+                )
+            frame_numbers.append(tc.frame_number)
+        return cls._wrap(np.array(frame_numbers, dtype=np.int64), info)
+
+    # ------------------------------------------------------------------
+    # container protocol
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._frame_numbers)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return FastTimecode._make(int(self._frame_numbers[index]), self._rate)
+        return self._wrap(np.array(self._frame_numbers[index]), self._rate)
+
+    def __iter__(self) -> Iterator[FastTimecode]:
+        make, rate = FastTimecode._make, self._rate
+        return (make(n, rate) for n in self._frame_numbers.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, TimecodeArray):
+            return self._rate == other._rate and np.array_equal(
+                self._frame_numbers, other._frame_numbers
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TimecodeArray({len(self)} frames, framerate={self.framerate!r})"
+
+    # ------------------------------------------------------------------
+    # accessors and conversions
+    # ------------------------------------------------------------------
+    @property
+    def frame_numbers(self) -> np.ndarray:
+        """Read-only ``int64`` array of 0-based frame numbers."""
+        return self._frame_numbers
+
+    @property
+    def framerate(self):
+        return self._rate.framerate
+
+    @property
+    def rate(self) -> FramerateInfo:
+        return self._rate
+
+    def milliseconds_exact(self) -> np.ndarray:
+        return self._frame_numbers * 1000 / self._rate.float_framerate
+
+    def milliseconds_rounded(self) -> np.ndarray:
+        # np.rint rounds half to even, like the builtin round() CTimecode uses.
+        return np.rint(self.milliseconds_exact()).astype(np.int64)
+
+    def seconds(self) -> np.ndarray:
+        return self._frame_numbers / self._rate.float_framerate
+
+    def hmsf(self) -> np.ndarray:
+        """``(N, 4)`` array of hours, minutes, seconds, frames labels."""
+        return _frame_numbers_to_hmsf(self._frame_numbers, self._rate)
+
+    def to_strings(self) -> list[str]:
+        """Format every position the way ``CTimecode.__str__`` does."""
+        info = self._rate
+        if info.drop_frame:
+            template = "{:02d}:{:02d}:{:02d};{:02d}"
+        elif info.ms_frame:
+            template = "{:02d}:{:02d}:{:02d}.{:03d}"
+        else:
+            template = "{:02d}:{:02d}:{:02d}:{:02d}"
+        fmt = template.format
+        return [fmt(*row) for row in self.hmsf().tolist()]
+
+    def to_ctimecodes(self) -> list[CTimecode]:
+        fr = self._rate.framerate
+        return [CTimecode(framerate=fr, frames=n + 1) for n in self._frame_numbers.tolist()]
+
+    def return_in_other_framerate(self, framerate) -> TimecodeArray:
+        """Batch ``CTimecode.return_in_other_framerate`` (same half-even rounding)."""
+        info = framerate_info(framerate)
+        converted = np.rint(
+            self._frame_numbers * info.int_framerate / self._rate.int_framerate
+        ).astype(np.int64)
+        return self._wrap(converted, info)
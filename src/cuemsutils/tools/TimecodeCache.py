@@ -0,0 +1,60 @@
+"""Flyweight cache for parsing timecode strings.
+
+Scripts repeat the same timecode strings over and over (``00:00:00.000``
+offsets, common fade durations, region in/out points) and each one used to
+go through upstream's ``tc_to_frames`` parser. :func:`parse_timecode` parses
+each distinct ``(string, framerate)`` once and keeps the result in an LRU
+cache of immutable entries.
+
+``CTimecode`` is mutable (upstream exposes ``frames``/``framerate`` setters
+and in-place ``add_frames``), so callers never receive the cached object:
+:func:`parse_timecode` returns a fresh ``CTimecode`` restored from the
+cached attribute snapshot, which is cheaper than a full construction and
+keeps per-instance display state such as ``fraction_frame``.
+:func:`parsed_timecode` returns the shared immutable
+:class:`~cuemsutils.tools.FastTimecode.FastTimecode` directly.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+
+from .CTimecode import CTimecode
+from .FastTimecode import FastTimecode
+
+TIMECODE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=TIMECODE_CACHE_SIZE, typed=True)
+def _parse(timecode: str, framerate) -> tuple[FastTimecode, tuple]:
+    tc = CTimecode(timecode, framerate=framerate)
+    return FastTimecode.from_ctimecode(tc), tuple(vars(tc).items())
+
+
+def parse_timecode(timecode: str, framerate='ms') -> CTimecode:
+    """Return a new ``CTimecode`` for ``timecode``, parsing it at most once.
+
+    Equivalent to ``CTimecode(timecode, framerate=framerate)``.
+
+    Raises:
+        Whatever ``CTimecode`` raises for an invalid string; failures are
+        not cached.
+    """
+    _, state = _parse(timecode, framerate)
+    tc = CTimecode.__new__(CTimecode)
+    tc.__dict__.update(state)
+    return tc
+
+
+def parsed_timecode(timecode: str, framerate='ms') -> FastTimecode:
+    """Return the shared immutable value for ``timecode``."""
+    return _parse(timecode, framerate)[0]
+
+
+def cache_info():
+    """Return ``(hits, misses, maxsize, currsize)`` of the parse cache."""
+    return _parse.cache_info()
+
+
+def cache_clear() -> None:
+    """Empty the parse cache and reset its counters."""
+    _parse.cache_clear()
@@ -0,0 +1,176 @@
+"""TimecodeClock — shared, mutable running timecode position.
+
+MTC listeners used to advance with ``self.main_tc + 1``, which through
+``CTimecode.__add__`` allocates and fully constructs a new ``CTimecode`` on
+every (quarter) frame, while ``CTimecodeTimer`` reads ``milliseconds_exact``
+from that shared object on another thread. ``TimecodeClock`` is the object
+both sides bind to instead:
+
+- writers call :meth:`TimecodeClock.advance` (in place, no allocation beyond
+  one small tuple) and :meth:`TimecodeClock.seek`;
+- readers call :meth:`TimecodeClock.snapshot` or the ``frame_number`` /
+  ``milliseconds_exact`` properties. The position and the seek counter live
+  in a single tuple that is replaced atomically, so reads need no lock and
+  never observe a torn state;
+- seek listeners are notified after every :meth:`TimecodeClock.seek`.
+
+The clock duck-types the parts of ``CTimecode`` a timer reads
+(``framerate``, ``milliseconds_exact``), so it can be passed anywhere a
+bound ``CTimecode`` was.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Callable, NamedTuple
+
+from cuemsutils.log import Logger
+
+from .CTimecode import CTimecode, FramerateInfo, framerate_info
+from .FastTimecode import FastTimecode
+
+
+class ClockSnapshot(NamedTuple):
+    """Consistent view of a clock at one instant."""
+
+    frame_number: int
+    milliseconds_exact: float
+    seek_count: int
+
+
+class TimecodeClock:
+    """Thread-safe running timecode position with in-place advance."""
+
+    def __init__(self, framerate='ms', frame_number: int = 0):
+        if frame_number < 0:
+            raise ValueError(f"frame_number must be >= 0, got {frame_number}")
+        self._rate: FramerateInfo = framerate_info(framerate)
+        # (frame_number, seek_count) — replaced as a whole so readers get
+        # an atomic pair without locking.
+        self._state: tuple[int, int] = (int(frame_number), 0)
+        self._write_lock = threading.Lock()
+        self._listeners: list[Callable[[ClockSnapshot, ClockSnapshot], None]] = []
+
+    @classmethod
+    def from_timecode(cls, timecode: CTimecode | FastTimecode) -> TimecodeClock:
+        return cls(timecode.framerate, timecode.frame_number)
+
+    # ── Writers ─────────────────────────────────────────────────────────
+
+    def advance(self, frames: int = 1) -> int:
+        """Move the position forward by ``frames`` in place.
+
+        Returns:
+            int: The new frame number.
+
+        Raises:
+            ValueError: If the result would be negative.
+        """
+        with self._write_lock:
+            frame_number, seek_count = self._state
+            frame_number += frames
+            if frame_number < 0:
+                raise ValueError(
+                    f"clock cannot move before 00:00:00:00 ({frame_number} frames)"
+                )
+            self._state = (frame_number, seek_count)
+        return frame_number
+
+    def seek(self, position: int | CTimecode | FastTimecode) -> None:
+        """Jump to a position and notify seek listeners.
+
+        Args:
+            position: A 0-based frame number, or a timecode at the clock's
+                framerate (``CTimecode``/``FastTimecode`` are converted with
+                ``return_in_other_framerate`` when the rates differ).
+        """
+        frame_number = self._to_frame_number(position)
+        if frame_number < 0:
+            raise ValueError(f"frame_number must be >= 0, got {frame_number}")
+        with self._write_lock:
+            old_frame, old_count = self._state
+            self._state = (frame_number, old_count + 1)
+        before = self._snapshot_of((old_frame, old_count))
+        after = self._snapshot_of((frame_number, old_count + 1))
+        for listener in list(self._listeners):
+            try:
+                listener(before, after)
+            except Exception:
+                Logger.exception("TimecodeClock: seek listener raised an exception")
+
+    def _to_frame_number(self, position) -> int:
+        if isinstance(position, int) and not isinstance(position, bool):
+            return position
+        if isinstance(position, CTimecode):
+            position = FastTimecode.from_ctimecode(position)
+        if isinstance(position, FastTimecode):
+            if position.rate != self._rate:
+                position = position.return_in_other_framerate(self._rate)
+            return position.frame_number
+        raise TypeError(
+            f"Cannot seek to {type(position).__name__}; expected int or timecode"
+        )
+
+    # ── Listeners ───────────────────────────────────────────────────────
+
+    def add_seek_listener(self, listener: Callable[[ClockSnapshot, ClockSnapshot], None]) -> None:
+        """Call ``listener(before, after)`` after every seek, on the seeking thread."""
+        self._listeners.append(listener)
+
+    def remove_seek_listener(self, listener: Callable) -> None:
+        try:
+            self._listeners.remove(listener)
+        except ValueError:
+            pass
+
+    # ── Readers ─────────────────────────────────────────────────────────
+
+    def _snapshot_of(self, state: tuple[int, int]) -> ClockSnapshot:
+        frame_number, seek_count = state
+        return ClockSnapshot(
+            frame_number, frame_number * 1000 / self._rate.float_framerate, seek_count
+        )
+
+    def snapshot(self) -> ClockSnapshot:
+        return self._snapshot_of(self._state)
+
+    @property
+    def frame_number(self) -> int:
+        return self._state[0]
+
+    @property
+    def frames(self) -> int:
+        """1-indexed frame count, as ``CTimecode.frames``."""
+        return self._state[0] + 1
+
+    @property
+    def seek_count(self) -> int:
+        return self._state[1]
+
+    @property
+    def milliseconds_exact(self) -> float:
+        return self._state[0] * 1000 / self._rate.float_framerate
+
+    @property
+    def milliseconds_rounded(self) -> int:
+        return round(self.milliseconds_exact)
+
+    @property
+    def framerate(self):
+        return self._rate.framerate
+
+    @property
+    def rate(self) -> FramerateInfo:
+        return self._rate
+
+    def timecode(self) -> FastTimecode:
+        """Immutable value of the current position."""
+        return FastTimecode._make(self._state[0], self._rate)
+
+    def to_ctimecode(self) -> CTimecode:
+        return self.timecode().to_ctimecode()
+
+    def __str__(self):
+        return str(self.timecode())
+
+    def __repr__(self):
+        return f"TimecodeClock({self._state[0]}, framerate={self.framerate!r})"
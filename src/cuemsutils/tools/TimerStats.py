@@ -0,0 +1,156 @@
+"""TimerStats — always-on instrumentation for quarter-frame timers.
+
+Every ``CTimecodeTimer`` (and ``WheelTimer``/``AsyncCTimecodeTimer``) owns a
+``TimerStats`` that records, per dispatch:
+
+- wake-up lateness (how far past its deadline or timecode position a tick
+  was served) and callback duration, each in a fixed log-spaced
+  :class:`LatencyHistogram`;
+- counters for dispatched ticks, quarter-frames skipped by seeks or late
+  wake-ups, quarter-frames coalesced by a catch-up policy, ticks dropped by
+  a concurrency limit, and callback errors.
+
+Recording is a ``bisect`` and a few integer additions on the timer's own
+thread, cheap enough to leave enabled in production. Other threads read a
+consistent copy through :meth:`TimerStats.snapshot`.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import NamedTuple
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    50e-6, 100e-6, 250e-6, 500e-6,
+    1e-3, 2.5e-3, 5e-3, 10e-3, 25e-3, 50e-3,
+    100e-3, 250e-3, 500e-3, 1.0,
+)
+"""Histogram bucket upper bounds in seconds; a final bucket catches the rest."""
+
+
+class HistogramSnapshot(NamedTuple):
+    """Immutable copy of a :class:`LatencyHistogram`."""
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    count: int
+    total: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding quantile ``q`` (0–1).
+
+        Values in the overflow bucket report the observed maximum.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"q must be within [0, 1], got {q}")
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    __slots__ = ('_bounds', '_counts', '_count', '_total', '_max')
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self._bounds = bounds
+        self.reset()
+
+    def reset(self) -> None:
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def record(self, seconds: float) -> None:
+        if seconds < 0.0:
+            seconds = 0.0
+        self._counts[bisect_left(self._bounds, seconds)] += 1
+        self._count += 1
+        self._total += seconds
+        if seconds > self._max:
+            self._max = seconds
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            self._bounds, tuple(self._counts), self._count, self._total, self._max
+        )
+
+
+class TimerStatsSnapshot(NamedTuple):
+    """Consistent view of a timer's :class:`TimerStats`."""
+
+    lateness: HistogramSnapshot
+    callback_duration: HistogramSnapshot
+    dispatched: int
+    skipped: int
+    coalesced: int
+    dropped: int
+    errors: int
+
+
+class TimerStats:
+    """Lateness/duration histograms and event counters for one timer."""
+
+    def __init__(self) -> None:
+        self.lateness = LatencyHistogram()
+        self.callback_duration = LatencyHistogram()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.lateness.reset()
+            self.callback_duration.reset()
+            self.dispatched = 0
+            self.skipped = 0
+            self.coalesced = 0
+            self.dropped = 0
+            self.errors = 0
+
+    def record_dispatch(self, lateness: float, duration: float) -> None:
+        with self._lock:
+            self.dispatched += 1
+            self.lateness.record(lateness)
+            self.callback_duration.record(duration)
+
+    def record_skipped(self, n: int) -> None:
+        with self._lock:
+            self.skipped += n
+
+    def record_coalesced(self, n: int) -> None:
+        with self._lock:
+            self.coalesced += n
+
+    def record_dropped(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    def record_error(self) -> None:
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self) -> TimerStatsSnapshot:
+        with self._lock:
+            return TimerStatsSnapshot(
+                self.lateness.snapshot(),
+                self.callback_duration.snapshot(),
+                self.dispatched,
+                self.skipped,
+                self.coalesced,
+                self.dropped,
+                self.errors,
+            )
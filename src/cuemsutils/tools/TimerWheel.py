@@ -0,0 +1,171 @@
+"""TimerWheel — one scheduler thread for many quarter-frame timers.
+
+Every ``CTimecodeTimer`` owns a thread that wakes once per quarter-frame
+(every 10 ms at 25 fps, every 0.25 ms at the ``'ms'`` framerate), so a cue
+stack running dozens of fades runs dozens of threads contending for the
+GIL. A ``TimerWheel`` is bound to one clock and drives any number of
+:class:`WheelTimer` subscriptions from a single thread, keeping their next
+deadlines in a heap.
+
+``WheelTimer`` is a ``CTimecodeTimer``: construction, ``start()``/``stop()``,
+the ``IDLE → RUNNING → STOPPED/EXHAUSTED`` state machine, deadline
+scheduling, seek handling, catch-up policy and ``start_timecode`` lookup
+are the same. Only where the ticks run differs — every subscription's
+callback runs on the wheel thread, one after the other, so callbacks must
+stay short.
+
+The wheel thread starts with the first running subscription and exits when
+none are left.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+import weakref
+
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.CTimecodeTimer import CatchUp, CTimecodeTimer
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.ParamSource import ParamSource
+from cuemsutils.tools.TimecodeClock import TimecodeClock
+
+
+class WheelTimer(CTimecodeTimer):
+    """``CTimecodeTimer`` scheduled by a :class:`TimerWheel`."""
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        params: list[tuple] | ParamSource | None = None,
+        start_timecode: CTimecode | FastTimecode | None = None,
+        catch_up: CatchUp | str = CatchUp.STRICT,
+    ) -> None:
+        super().__init__(wheel.timecode, params, start_timecode, catch_up)
+        self._wheel = wheel
+        # Bumped on every start/stop so stale heap entries are dropped
+        self._generation = 0
+
+    def _launch(self, prev: threading.Thread | None) -> None:
+        self._wheel._schedule(self)
+
+    def _halt(self) -> None:
+        self._wheel._unschedule(self)
+
+
+class TimerWheel:
+    """Single-threaded scheduler for the quarter-frame timers of one clock."""
+
+    _shared: dict[int, TimerWheel] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, timecode: CTimecode | TimecodeClock) -> None:
+        if timecode is None:
+            raise ValueError("TimerWheel: timecode must not be None")
+        # Shared wheels drop _owner so they do not keep their clock alive;
+        # running subscriptions still hold it
+        self._owner: CTimecode | TimecodeClock | None = timecode
+        self._timecode_ref = weakref.ref(timecode)
+        # Entries: (deadline, seq, generation, timer, begin)
+        self._heap: list[tuple[float, int, int, WheelTimer, bool]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def shared(cls, timecode: CTimecode | TimecodeClock) -> TimerWheel:
+        """The wheel shared by every caller bound to ``timecode``.
+
+        Keyed by object identity. The wheel only holds ``timecode`` weakly
+        and is dropped when ``timecode`` is garbage-collected.
+        """
+        key = id(timecode)
+        with cls._shared_lock:
+            wheel = cls._shared.get(key)
+            if wheel is None or wheel.timecode is not timecode:
+                wheel = cls(timecode)
+                wheel._owner = None
+                cls._shared[key] = wheel
+                weakref.finalize(timecode, cls._forget, key, wheel)
+            return wheel
+
+    @classmethod
+    def _forget(cls, key: int, wheel: TimerWheel) -> None:
+        with cls._shared_lock:
+            if cls._shared.get(key) is wheel:
+                del cls._shared[key]
+
+    @property
+    def timecode(self) -> CTimecode | TimecodeClock:
+        return self._timecode_ref()
+
+    def timer(
+        self,
+        params: list[tuple] | ParamSource | None = None,
+        start_timecode: CTimecode | FastTimecode | None = None,
+        catch_up: CatchUp | str = CatchUp.STRICT,
+    ) -> WheelTimer:
+        """Create an idle subscription; see ``CTimecodeTimer`` for arguments."""
+        return WheelTimer(self, params, start_timecode, catch_up)
+
+    def __len__(self) -> int:
+        """Number of running subscriptions."""
+        with self._cond:
+            return sum(1 for _, _, gen, t, _ in self._heap if gen == t._generation)
+
+    # ── Scheduling ──────────────────────────────────────────────────────
+
+    def _schedule(self, timer: WheelTimer) -> None:
+        with self._cond:
+            timer._generation += 1
+            # The wheel thread runs _begin, so a restart cannot overlap a
+            # _step of the previous run that is still in progress
+            heapq.heappush(
+                self._heap,
+                (time.monotonic(), next(self._seq), timer._generation, timer, True),
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="TimerWheel"
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _unschedule(self, timer: WheelTimer) -> None:
+        with self._cond:
+            # The heap entry is discarded lazily when it reaches the top
+            timer._generation += 1
+            self._cond.notify()
+
+    def _run(self) -> None:
+        heap = self._heap
+        while True:
+            with self._cond:
+                while True:
+                    if not heap:
+                        self._thread = None
+                        return
+                    deadline, _, generation, timer, begin = heap[0]
+                    if generation != timer._generation:
+                        heapq.heappop(heap)
+                        continue
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        heapq.heappop(heap)
+                        break
+                    self._cond.wait(timeout)
+
+            # Callbacks run outside the lock so they may start/stop timers
+            if begin:
+                timer._begin(time.monotonic())
+                keep = True
+            else:
+                keep = timer._step(time.monotonic())
+            if keep:
+                with self._cond:
+                    if generation == timer._generation:
+                        heapq.heappush(
+                            heap,
+                            (timer._next_deadline(), next(self._seq), generation, timer, False),
+                        )
@@ -1,26 +1,87 @@
-from re import match
-from uuid import uuid4
+from re import compile as re_compile
+from uuid import UUID, uuid4
+from weakref import WeakValueDictionary
 
 UUID4_REGEX = r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$'
+_UUID4_MATCH = re_compile(UUID4_REGEX).match
+UUID_STR_LENGTH = 36
+UUID_BYTES_LENGTH = 16
+
+# Interning pool: every live Uuid is reachable here by its string, so wrapping
+# the same id again (Cue.set_id, set_target, Media.set_id, the parsers'
+# str_to_value) returns the existing instance instead of re-validating it.
+# Weak values let unreferenced ids be collected with their cues.
+_POOL: 'WeakValueDictionary[str, Uuid]' = WeakValueDictionary()
+
+
+def is_valid_uuid(uuid: str) -> bool:
+    """Check whether a string is a canonical lowercase uuid4.
+
+    Cheap rejection by length first, so scalars that are obviously not ids
+    (names, numbers, booleans) never reach the regex.
+    """
+    return (
+        isinstance(uuid, str)
+        and len(uuid) == UUID_STR_LENGTH
+        and _UUID4_MATCH(uuid) is not None
+    )
+
 
 class Uuid():
     """A class to interact with unique identifiers.
-        
-        Comparisions should be made based on memory allocation.
+
+        Instances are interned: equal uuid strings share one instance, so
+        comparisons can be made based on memory allocation. Equality and
+        hashing still follow the uuid string, including against plain `str`.
 
         Calling or printing the instance will return the uuid4 string.
     """
-    def __init__(self, uuid: str | None = None):
+    __slots__ = ('uuid', '_bytes', '__weakref__')
+
+    def __new__(cls, uuid: 'str | Uuid | None' = None):
+        if isinstance(uuid, Uuid):
+            return uuid
         if not uuid:
-            self.uuid = str(uuid4())
+            uuid = str(uuid4())
         else:
-            self.uuid = str(uuid)
-        if not self.check():
+            uuid = str(uuid)
+        existing = _POOL.get(uuid)
+        if existing is not None:
+            return existing
+        if not is_valid_uuid(uuid):
             raise ValueError(f'uuid {uuid} is not valid')
-    
+        self = super().__new__(cls)
+        self.uuid = uuid
+        self._bytes = None
+        return _POOL.setdefault(uuid, self)
+
+    def __init__(self, uuid: 'str | Uuid | None' = None):
+        # All the work happens in __new__, which may hand back an interned
+        # instance that must not be reinitialized.
+        pass
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Uuid':
+        """Build (or fetch the interned) Uuid from its 16-byte compact form.
+
+        Raises:
+            ValueError: If data is not 16 bytes long or not a valid uuid4.
+        """
+        if len(data) != UUID_BYTES_LENGTH:
+            raise ValueError(
+                f'uuid bytes must be {UUID_BYTES_LENGTH} long, got {len(data)}'
+            )
+        return cls(str(UUID(bytes=bytes(data))))
+
+    def to_bytes(self) -> bytes:
+        """Return the 16-byte big-endian compact form, for indexes and wire formats."""
+        if self._bytes is None:
+            self._bytes = UUID(self.uuid).bytes
+        return self._bytes
+
     def __str__(self):
         return self.uuid
-    
+
     def __repr__(self):
         return self.uuid
 
@@ -31,6 +92,8 @@ class Uuid():
         return hash(self.uuid)
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, Uuid):
             return self.uuid == other.uuid
         elif isinstance(other, str):
@@ -40,15 +103,22 @@ class Uuid():
 
     def __ne__(self, other):
         return not self.__eq__(other)
-    
+
+    def __reduce__(self):
+        # Route unpickling through __new__ so loaded ids are interned too.
+        return (Uuid, (self.uuid,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def __json__(self):
         return self.uuid
 
     def items(self):
         return [("uuid", self.uuid)]
-    
+
     def check(self):
-        m = match(UUID4_REGEX, self.uuid)
-        if m:
-            return m.span() == (0, 36)
-        return False
+        return is_valid_uuid(self.uuid)
@@ -3,10 +3,13 @@ from ..cues.FadeProfile import FadeFunctionParameter, FadeProfile
 from ..cues.MediaCue import Media, Region
 from ..cues.CueOutput import AudioCueOutput, VideoCueOutput, DmxCueOutput
 from ..cues.Cue import Cue, UI_properties
+from ..cues.CuemsScript import CuemsScript
 from ..log import Logger
 from ..helpers import strtobool
+from ..registry import CLASS_REGISTRY, PARSER_REGISTRY, auto_register
 from ..tools.CTimecode import CTimecode
-from ..tools.Uuid import Uuid
+from ..tools.TimecodeCache import parse_timecode
+from ..tools.Uuid import Uuid, is_valid_uuid
 
 PARSER_SUFFIX = 'Parser'
 GENERIC_PARSER = 'GenericParser'
@@ -38,7 +41,18 @@ STRING_TYPED_KEYS = frozenset({
 class GenericDict(dict):
     pass
 
+# Value classes that are not CuemsDict subclasses and therefore do not
+# register themselves.
+for _cls in (CuemsScript, CTimecode, Uuid, GenericDict):
+    CLASS_REGISTRY.register(_cls.__name__, _cls, replace=False)
+
+_register_parser = auto_register(PARSER_REGISTRY, PARSER_SUFFIX)
+
 class CuemsParser():
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _register_parser(cls)
+
     def __init__(self, init_dict):
         try:
             if next(iter(init_dict)) != XML_ROOT_TAG:
@@ -54,23 +68,12 @@ class CuemsParser():
             Logger.debug(self.init_dict)
 
     def get_parser_class(self, class_string):
-        parser_name = class_string + PARSER_SUFFIX
-        try:
-            parser_class = (globals()[parser_name], class_string)
-        except KeyError:
-            Logger.debug(
-                f"Could not find class {parser_name}, reverting to generic parser class"
-            )
-            parser_class = (globals()[GENERIC_PARSER], class_string)
-        return parser_class
+        """Return ``(parser_class, class_string)`` for a tag, defaulting to GenericParser."""
+        return (PARSER_REGISTRY.get(class_string, GenericParser), class_string)
 
     def get_class(self, class_string):
-        try:
-            _class = globals()[class_string]
-        except KeyError:
-            Logger.debug(f"Could not find class {class_string}")
-            _class = GenericDict
-        return _class
+        """Return the class registered for a tag, defaulting to GenericDict."""
+        return CLASS_REGISTRY.get(class_string, GenericDict)
 
     def get_first_key(self, _dict):
         return list(_dict.keys())[0]
@@ -100,11 +103,15 @@ class CuemsParser():
             return None
         if _string.isdigit():
             return int(_string)
-        for f in [float, strtobool, Uuid]:
+        for f in [float, strtobool]:
             try:
                 return f(_string)
             except ValueError:
                 pass
+        # Checked up front rather than via try/except: most scalars are not ids
+        # and the length test rejects them without raising.
+        if is_valid_uuid(_string):
+            return Uuid(_string)
         return _string
     
 
@@ -228,7 +235,10 @@ class GenericSubObjectParser(GenericParser):
 class CTimecodeParser(GenericParser):  
     def parse(self):
         for dict_key, dict_value in self.init_dict.items():
-            self.item_gp = self._class(dict_value)
+            if self._class is CTimecode and isinstance(dict_value, str):
+                self.item_gp = parse_timecode(dict_value)
+            else:
+                self.item_gp = self._class(dict_value)
         return self.item_gp
 
 # class CTimecodeKeyParser(GenericParser):
@@ -407,3 +417,5 @@ class NoneTypeParser():
 
     def parse(self):
         return None
+
+PARSER_REGISTRY.register('NoneType', NoneTypeParser, replace=False)
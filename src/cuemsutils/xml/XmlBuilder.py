@@ -3,6 +3,7 @@ from xml.etree.ElementTree import Element, ElementTree, SubElement, register_nam
 
 from .Parsers import GenericDict
 from ..helpers import as_cuemsdict
+from ..registry import BUILDER_REGISTRY, auto_register
 from ..tools.Uuid import Uuid
 from ..log import Logger
 
@@ -15,7 +16,13 @@ VALUE_TYPES = (str, bool, int, float, Enum, Uuid)
 
 ## "<target /> | <target><Uuid>sadqaweasd-as-das-dasd</Uuid></target> | <uuid><Uuid>asdas-das-da-sd-asd</Uuid></uuid>"
 
+_register_builder = auto_register(BUILDER_REGISTRY, PARSER_SUFFIX)
+
 class XmlBuilder():
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _register_builder(cls)
+
     def __init__(self, _object, namespace, xsd_path, xml_tree = None, xml_root_tag='CuemsProject'):
         self._object = _object
         self.xml_tree = xml_tree
@@ -27,14 +34,11 @@ class XmlBuilder():
             register_namespace(next(iter(self.namespace)), next(iter(self.namespace.values())))
 
     def get_builder_class(self, _object):
-        object_class_name = type(_object).__name__
-        builder_class_name = object_class_name + PARSER_SUFFIX
-        try:
-            builder_class = globals()[builder_class_name]
-        except KeyError as err:
-            #logger.debug("Could not find class {0}, reverting to generic builder class".format(err))
-            builder_class = globals()[GENERIC_BUILDER]
-        return builder_class
+        """Return the builder registered for the object's class or its nearest ancestor.
+
+        Falls back to GenericCueXmlBuilder when no class in the MRO has one.
+        """
+        return BUILDER_REGISTRY.resolve(type(_object), GenericCueXmlBuilder)
 
     def build(self):
         #xml_root = Element(f'{{{next(iter(self.namespace.values()))}}}CuemsProject')
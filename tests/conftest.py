@@ -16,3 +16,12 @@ if not _module_available("pynng"):
 
 if not _module_available("systemd"):
     collect_ignore_glob += ["test_signalengine.py"]
+
+if not _module_available("numpy"):
+    collect_ignore_glob += [
+        "unit/test_timecode_array.py",
+        "unit/test_param_source.py",
+        "unit/test_vector_fade_calculator.py",
+        "unit/test_fade_mixer.py",
+        "unit/test_dmx_fade_engine.py",
+    ]
@@ -0,0 +1,171 @@
+"""Tests for AsyncCTimecodeTimer — event-loop quarter-frame timer."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from cuemsutils.tools.AsyncCTimecodeTimer import AsyncCTimecodeTimer
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.CTimecodeTimer import _State
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.TimecodeClock import TimecodeClock
+
+
+def _fast(timer: AsyncCTimecodeTimer) -> AsyncCTimecodeTimer:
+    timer._qf_interval = 0.001
+    return timer
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate() and loop.time() < deadline:
+        await asyncio.sleep(0.001)
+
+
+class TestDispatch:
+    def test_sync_callback(self):
+        calls: list[int] = []
+
+        async def main():
+            timer = _fast(AsyncCTimecodeTimer(
+                CTimecode(framerate=25), params=[(i,) for i in range(4)]
+            ))
+            timer.callback = calls.append
+            timer.start()
+            await asyncio.wait_for(timer.join(), 2.0)
+            return timer
+
+        timer = asyncio.run(main())
+        assert calls == [0, 1, 2, 3]
+        assert timer._state == _State.EXHAUSTED
+
+    def test_coroutine_callback_runs_on_loop(self):
+        calls: list[int] = []
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            seen_loops = set()
+
+            async def cb(i):
+                seen_loops.add(asyncio.get_running_loop())
+                await asyncio.sleep(0)
+                calls.append(i)
+
+            timer = _fast(AsyncCTimecodeTimer(
+                CTimecode(framerate=25), params=[(i,) for i in range(4)],
+                max_concurrency=4,
+            ))
+            timer.callback = cb
+            timer.start()
+            await asyncio.wait_for(timer.join(), 2.0)
+            return seen_loops == {loop}
+
+        assert asyncio.run(main())
+        assert calls == [0, 1, 2, 3]
+
+    def test_bounded_concurrency_drops_ticks(self):
+        started: list[int] = []
+
+        async def main():
+            release = asyncio.Event()
+
+            async def cb(i):
+                started.append(i)
+                await release.wait()
+
+            timer = _fast(AsyncCTimecodeTimer(
+                CTimecode(framerate=25), params=[(i,) for i in range(10)],
+                max_concurrency=2,
+            ))
+            timer.callback = cb
+            timer.start()
+            await _wait_for(lambda: timer._state == _State.EXHAUSTED)
+            release.set()
+            await asyncio.wait_for(timer.join(), 2.0)
+            return timer
+
+        timer = asyncio.run(main())
+        assert started == [0, 1]
+        assert timer.dropped == 8
+
+    def test_callback_exceptions_are_contained(self):
+        calls: list[int] = []
+
+        async def main():
+            async def cb(i):
+                if i == 1:
+                    raise RuntimeError("boom")
+                calls.append(i)
+
+            timer = _fast(AsyncCTimecodeTimer(
+                CTimecode(framerate=25), params=[(i,) for i in range(4)],
+                max_concurrency=4,
+            ))
+            timer.callback = cb
+            timer.start()
+            await asyncio.wait_for(timer.join(), 2.0)
+
+        asyncio.run(main())
+        assert calls == [0, 2, 3]
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError):
+            AsyncCTimecodeTimer(CTimecode(framerate=25), max_concurrency=0)
+
+
+class TestLifecycle:
+    def test_start_requires_running_loop(self):
+        timer = AsyncCTimecodeTimer(CTimecode(framerate=25))
+        with pytest.raises(RuntimeError):
+            timer.start()
+        assert timer._state == _State.IDLE
+
+    def test_stop_and_restart(self):
+        calls: list[bool] = []
+
+        async def main():
+            timer = _fast(AsyncCTimecodeTimer(CTimecode(framerate=25)))
+            timer.callback = lambda: calls.append(True)
+            timer.start()
+            await _wait_for(lambda: len(calls) >= 3)
+            timer.stop()
+            await timer.join()
+            assert timer._state == _State.STOPPED
+            count = len(calls)
+            await asyncio.sleep(0.010)
+            assert len(calls) == count
+            timer.start()
+            await _wait_for(lambda: len(calls) >= count + 3)
+            timer.stop()
+            await timer.join()
+            return count
+
+        count = asyncio.run(main())
+        assert len(calls) >= count + 3
+
+    def test_timecode_indexed_seek(self):
+        clock = TimecodeClock(25)
+        calls: list[int] = []
+
+        async def main():
+            timer = _fast(AsyncCTimecodeTimer(
+                clock, params=[(i,) for i in range(400)],
+                start_timecode=FastTimecode(0, 25),
+            ))
+            timer.callback = calls.append
+            clock.seek(50)
+            timer.start()
+            await _wait_for(lambda: calls)
+            clock.seek(10)
+            await _wait_for(lambda: any(c < 200 for c in calls))
+            clock.seek(200)
+            await asyncio.wait_for(timer.join(), 2.0)
+            return timer
+
+        timer = asyncio.run(main())
+        assert calls[0] == 200
+        assert [c for c in calls if c < 200][0] == 40
+        assert timer._state == _State.EXHAUSTED
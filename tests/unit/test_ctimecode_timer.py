@@ -9,7 +9,9 @@ from unittest.mock import MagicMock
 import pytest
 
 from cuemsutils.tools.CTimecode import CTimecode
-from cuemsutils.tools.CTimecodeTimer import CTimecodeTimer, _State
+from cuemsutils.tools.CTimecodeTimer import CatchUp, CTimecodeTimer, _State
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.TimecodeClock import TimecodeClock
 
 # ── Shared fixtures ─────────────────────────────────────────────────────────
 
@@ -395,6 +397,220 @@ class TestPolish:
         assert len(calls) >= 5
 
 
+class TestDeadlineScheduling:
+    def test_slow_callback_does_not_drift(self, make_tc):
+        """Callback time is absorbed by the next wait, not added to it."""
+        params = [(i,) for i in range(20)]
+        timer = CTimecodeTimer(make_tc(), params=params)
+        timer._qf_interval = 0.005
+        timer.callback = lambda *a: time.sleep(0.003)
+        t0 = time.monotonic()
+        _run_to_exhaustion(timer)
+        elapsed = time.monotonic() - t0
+        # Relative scheduling would take 20 × 8 ms = 160 ms
+        assert elapsed < 0.140
+
+    def test_late_wakeup_catches_up_without_loss(self, make_tc):
+        calls: list[int] = []
+        params = [(i,) for i in range(10)]
+
+        def cb(i):
+            calls.append(i)
+            if i == 2:
+                time.sleep(0.020)  # 4 QF late
+
+        timer = CTimecodeTimer(make_tc(), params=params)
+        timer._qf_interval = 0.005
+        timer.callback = cb
+        t0 = time.monotonic()
+        _run_to_exhaustion(timer)
+        elapsed = time.monotonic() - t0
+        assert calls == list(range(10))
+        assert timer.max_lateness >= 0.010
+        assert elapsed < 0.080
+
+    def test_lateness_reset_on_start(self, make_tc):
+        timer = _fast(CTimecodeTimer(make_tc()))
+        assert timer.lateness == 0.0
+        assert timer.max_lateness == 0.0
+        timer._max_lateness = 1.0
+        timer.start()
+        assert timer.max_lateness < 1.0
+        timer.stop()
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.0005)
+
+
+class TestCatchUp:
+    """Policies for quarter-frames already due after a stall (5 ms QF)."""
+
+    def _stalling(self, make_tc, policy, record):
+        timer = CTimecodeTimer(
+            make_tc(), params=[(i,) for i in range(10)], catch_up=policy
+        )
+        timer._qf_interval = 0.005
+
+        def cb(arg):
+            record(arg)
+            if arg == 2 or arg == [(2,)]:
+                time.sleep(0.030)  # 6 QF stall
+
+        timer.callback = cb
+        return timer
+
+    def test_strict_is_default(self, make_tc):
+        assert CTimecodeTimer(make_tc())._catch_up is CatchUp.STRICT
+
+    def test_policy_from_string(self, make_tc):
+        timer = CTimecodeTimer(make_tc(), catch_up="latest")
+        assert timer._catch_up is CatchUp.LATEST
+        with pytest.raises(ValueError):
+            CTimecodeTimer(make_tc(), catch_up="sometimes")
+
+    def test_latest_coalesces_overdue(self, make_tc):
+        calls: list[int] = []
+        timer = self._stalling(make_tc, CatchUp.LATEST, calls.append)
+        _run_to_exhaustion(timer)
+        assert calls[:3] == [0, 1, 2]
+        assert calls == sorted(set(calls))
+        assert calls[-1] == 9
+        assert len(calls) < 10
+        assert timer.stats.coalesced == 10 - len(calls)
+
+    def test_batch_delivers_all_in_one_call(self, make_tc):
+        batches: list[list[tuple]] = []
+        timer = self._stalling(make_tc, "batch", batches.append)
+        _run_to_exhaustion(timer)
+        assert [a for b in batches for (a,) in b] == list(range(10))
+        assert max(len(b) for b in batches) > 1
+        assert timer.stats.coalesced == 10 - len(batches)
+
+    @staticmethod
+    def _late_with_moving_clock(policy, record):
+        """Step a timer by hand while its clock keeps pace with real time."""
+        clock = TimecodeClock(25)
+        timer = CTimecodeTimer(clock, params=[(i,) for i in range(100)], catch_up=policy)
+        timer.callback = record
+        timer._state = _State.RUNNING
+        timer._begin(0.0)
+        # Wake-ups 3, 3 and 11 QFs late; the clock moved over those QFs
+        for frame, now in ((1, 0.0405), (2, 0.0805), (5, 0.2005)):
+            clock.seek(frame)
+            timer._step(now)
+        # Then a seek: the clock jumps 20 QFs within one tick
+        clock.seek(10)
+        timer._step(0.2105)
+        return timer
+
+    @pytest.mark.parametrize("policy, expected, coalesced", [
+        (CatchUp.STRICT, [[i] for i in range(20)] + [[39]], 0),
+        (CatchUp.LATEST, [[3], [7], [19], [39]], 17),
+        (CatchUp.BATCH, [list(range(0, 4)), list(range(4, 8)), list(range(8, 20)), [39]], 17),
+    ])
+    def test_policy_applies_while_clock_moves(self, policy, expected, coalesced):
+        calls: list[list[int]] = []
+
+        def record(arg):
+            batch = arg if isinstance(arg, list) else [(arg,)]
+            calls.append([i for (i,) in batch])
+
+        timer = self._late_with_moving_clock(policy, record)
+        assert calls == expected
+        snap = timer.stats.snapshot()
+        assert snap.skipped == 19
+        assert snap.coalesced == coalesced
+
+    def test_batch_bare_signal(self, make_tc):
+        batches: list[list[tuple]] = []
+        timer = _fast(CTimecodeTimer(make_tc(), catch_up=CatchUp.BATCH))
+        timer.callback = batches.append
+        timer.start()
+        deadline = time.monotonic() + 2.0
+        while len(batches) < 3 and time.monotonic() < deadline:
+            time.sleep(0.0005)
+        timer.stop()
+        assert all(b and all(t == () for t in b) for b in batches)
+
+
+class TestTimecodeIndexed:
+    """Parameter index computed from the bound position (25 fps → 10 ms QF)."""
+
+    def _timer(self, clock, n=400, start=0):
+        calls: list[int] = []
+        timer = _fast(CTimecodeTimer(
+            clock, params=[(i,) for i in range(n)],
+            start_timecode=FastTimecode(start, 25),
+        ))
+        timer.callback = calls.append
+        return timer, calls
+
+    def test_requires_params(self, make_tc):
+        with pytest.raises(ValueError, match="requires params"):
+            CTimecodeTimer(make_tc(), start_timecode=make_tc())
+
+    def test_paused_position_dispatches_once(self):
+        clock = TimecodeClock(25)
+        timer, calls = self._timer(clock)
+        timer.start()
+        time.sleep(0.020)
+        timer.stop()
+        assert calls == [0]
+
+    def test_waits_before_start_timecode(self):
+        clock = TimecodeClock(25)
+        timer, calls = self._timer(clock, start=50)
+        timer.start()
+        time.sleep(0.010)
+        assert calls == []
+        assert timer._state == _State.RUNNING
+        clock.seek(51)
+        _wait_for(lambda: calls)
+        timer.stop()
+        assert calls[0] == 4
+
+    def test_seeks_land_on_exact_tuple(self):
+        clock = TimecodeClock(25)
+        timer, calls = self._timer(clock)
+        clock.seek(50)
+        timer.start()
+        _wait_for(lambda: calls)
+        assert calls[0] == 200
+        clock.seek(10)
+        _wait_for(lambda: any(c < 200 for c in calls))
+        assert [c for c in calls if c < 200][0] == 40
+        clock.seek(CTimecode(start_seconds=3, framerate=25))
+        _wait_for(lambda: 300 in calls)
+        timer.stop()
+        assert 0 not in calls
+
+    def test_exhaustion_is_position_based(self):
+        clock = TimecodeClock(25)
+        timer, calls = self._timer(clock, n=8)
+        timer.start()
+        _wait_for(lambda: calls)
+        clock.seek(2)
+        _wait_for(lambda: timer._state == _State.EXHAUSTED)
+        assert timer._state == _State.EXHAUSTED
+        assert calls == [0]
+
+    def test_running_clock_fills_quarter_frames(self):
+        clock = TimecodeClock(25)
+        timer, calls = self._timer(clock, n=16)
+        timer._qf_interval = 0.002
+        timer.start()
+        for _ in range(4):
+            time.sleep(0.040)
+            clock.advance()
+        _wait_for(lambda: timer._state == _State.EXHAUSTED)
+        timer.stop()
+        assert calls == sorted(set(calls))
+        assert len(calls) > 8
+
+
 @pytest.mark.slow
 class TestIntegration:
     def test_realtime_25fps_jitter(self, make_tc):
@@ -0,0 +1,122 @@
+"""Tests for DmxBuffer and the buffer-backed DmxUniverse."""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from cuemsutils.cues.DmxCue import DmxChannel, DmxUniverse
+from cuemsutils.tools.DmxBuffer import DMX_CHANNELS, DmxBuffer
+
+
+class TestDmxBuffer:
+    def test_channels_and_mask(self):
+        buf = DmxBuffer()
+        assert len(buf) == 0
+        buf[5] = 200
+        buf[0] = 0
+        assert buf[5] == 200
+        assert buf.is_set(0) and not buf.is_set(1)
+        assert list(buf.items()) == [(0, 0), (5, 200)]
+        assert len(buf.frame()) == DMX_CHANNELS
+
+    def test_slices(self):
+        buf = DmxBuffer(b'\x01\x02\x03')
+        assert buf.channels() == [0, 1, 2]
+        buf[508:] = [9, 9, 9, 9]
+        assert buf[507:512] == b'\x00\x09\x09\x09\x09'
+        assert buf.channels() == [0, 1, 2, 508, 509, 510, 511]
+        del buf[1:3]
+        assert buf.channels() == [0, 508, 509, 510, 511]
+        with pytest.raises(ValueError, match="Expected 2"):
+            buf[0:2] = b'\x01'
+        assert len(buf.frame()) == DMX_CHANNELS
+
+    def test_bounds(self):
+        buf = DmxBuffer()
+        with pytest.raises(IndexError):
+            buf[512] = 1
+        with pytest.raises(IndexError):
+            buf.update([(-1, 1)])
+        with pytest.raises(ValueError):
+            buf[0] = 256
+
+    def test_version_and_copy(self):
+        buf = DmxBuffer()
+        version = buf.version
+        buf.update([(1, 1), (2, 2)])
+        assert buf.version > version
+        copy = buf.copy()
+        assert copy == buf
+        copy[3] = 0
+        assert copy != buf
+        with pytest.raises(TypeError):
+            buf.values[0] = 1
+
+    def test_failed_update_bumps_version(self):
+        buf = DmxBuffer()
+        version = buf.version
+        with pytest.raises(IndexError):
+            buf.update([(1, 10), (600, 1)])
+        assert buf[1] == 10
+        assert buf.version > version
+
+
+class TestDmxUniverse:
+    def test_accepts_xml_and_object_forms(self):
+        universe = DmxUniverse({
+            'universe_num': 1,
+            'dmx_channels': [
+                {'DmxChannel': [{'channel': 3, 'value': 30}, {'channel': 1, 'value': 10}]},
+                DmxChannel({'channel': 0, 'value': 5}),
+                {'channel': 2, 'value': 20},
+            ],
+        })
+        assert universe.get_slice(0, 4) == b'\x05\x0a\x14\x1e'
+        channels = universe.dmx_channels
+        assert all(isinstance(c, DmxChannel) for c in channels)
+        assert [c.channel for c in channels] == [0, 1, 2, 3]
+        assert list(universe.keys()) == ['dmx_channels', 'universe_num']
+
+    def test_channel_list_follows_buffer(self):
+        universe = DmxUniverse({'dmx_channels': [{'channel': 0, 'value': 1}]})
+        channels = universe.dmx_channels
+        assert universe.dmx_channels is channels
+        universe.set_slice(10, b'\xff\xff')
+        assert [(c.channel, c.value) for c in universe.dmx_channels] == [(0, 1), (10, 255), (11, 255)]
+        universe.buffer[0] = 7
+        assert universe['dmx_channels'][0].value == 7
+        assert universe.frame()[:1] == b'\x07'
+        universe.dmx_channels = None
+        assert universe.dmx_channels == []
+
+    def test_equality(self):
+        a = DmxUniverse({'universe_num': 2, 'dmx_channels': [{'channel': 4, 'value': 40}]})
+        b = DmxUniverse({'universe_num': 2})
+        assert a != b
+        b.buffer[4] = 40
+        assert a == b
+        assert a == {'universe_num': 2, 'dmx_channels': [{'channel': 4, 'value': 40}]}
+
+    def test_dict_reads_follow_buffer(self):
+        universe = DmxUniverse({'dmx_channels': [{'channel': 0, 'value': 1}]})
+        assert universe.get('dmx_channels') == [{'channel': 0, 'value': 1}]
+        assert dict.__getitem__(universe, 'dmx_channels') == [{'channel': 0, 'value': 1}]
+        universe.set_slice(1, b'\x02')
+        assert dict.__getitem__(universe, 'dmx_channels')[-1] == {'channel': 1, 'value': 2}
+        universe.buffer[2] = 3
+        assert dict(universe)['dmx_channels'][-1] == {'channel': 2, 'value': 3}
+        universe.buffer[3] = 4
+        assert universe.get('dmx_channels')[-1] == {'channel': 3, 'value': 4}
+
+    @pytest.mark.parametrize('copier', [copy.copy, copy.deepcopy, DmxUniverse.copy])
+    def test_copies_own_their_buffer(self, copier):
+        universe = DmxUniverse({'universe_num': 3, 'dmx_channels': [{'channel': 0, 'value': 1}]})
+        clone = copier(universe)
+        assert type(clone) is DmxUniverse
+        assert clone == universe and clone.buffer is not universe.buffer
+        clone.buffer[0] = 9
+        assert universe.frame()[0] == 1
+        assert universe.dmx_channels[0].value == 1
+        assert clone.dmx_channels[0].value == 9
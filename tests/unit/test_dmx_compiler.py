@@ -0,0 +1,93 @@
+"""Tests for DmxCue output precompilation."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuemsutils.cues.CueOutput import DmxCueOutput
+from cuemsutils.cues.DmxCue import DmxCue, DmxUniverse
+from cuemsutils.tools.DmxCompiler import DmxFrame, compile_dmx_cue
+from cuemsutils.tools.FadeCurves import get_fade_curve
+
+NODE = '0367f391-ebf4-48b2-9f26-000000000001'
+OTHER = '0367f391-ebf4-48b2-9f26-000000000002'
+
+
+def _cue(channels: dict[int, int], fadein=0.1, fadeout=0.0, outputs=(NODE,), num=1) -> DmxCue:
+    universe = DmxUniverse({'universe_num': num})
+    universe.buffer.update(channels.items())
+    return DmxCue({
+        'fadein_time': fadein,
+        'fadeout_time': fadeout,
+        'outputs': [DmxCueOutput({'output_name': name}) for name in outputs],
+        'DmxScene': {'id': 0, 'DmxUniverse': universe},
+    })
+
+
+class TestCompile:
+    def test_fade_in_timeline(self):
+        compiled = compile_dmx_cue(_cue({0: 200, 3: 100}), NODE, refresh_rate=40)
+        assert compiled.local and compiled.outputs == (NODE,)
+        assert [f.timestamp for f in compiled.fade_in] == [0, 25, 50, 75, 100]
+        assert {f.universe for f in compiled.fade_in} == {1}
+        assert [f.data[0] for f in compiled.fade_in] == [0, 50, 100, 150, 200]
+        assert compiled.fade_in[2].data[:4] == bytes([100, 0, 0, 50])
+        assert compiled.fade_out == (DmxFrame(0.0, 1, bytes(512)),)
+
+    def test_from_frames_and_curve(self):
+        base = bytes([10] * 512)
+        compiled = compile_dmx_cue(
+            _cue({0: 210}, fadein=1.0, fadeout=1.0), NODE, refresh_rate=4, curve='sigmoid', from_frames={1: base}
+        )
+        shaped = get_fade_curve('sigmoid')(0.25)
+        assert compiled.fade_in[1].data[:2] == bytes([round(10 + 200 * shaped), 10])
+        assert compiled.fade_in[-1].data[0] == 210
+        assert compiled.fade_out[0].data[0] == 210
+        assert compiled.fade_out[-1].data == base
+
+    def test_only_local_outputs(self):
+        cue = _cue({0: 1}, outputs=(OTHER,))
+        compiled = compile_dmx_cue(cue, NODE)
+        assert not compiled.local and compiled.fade_in == ()
+        assert compile_dmx_cue(cue, OTHER).local
+        cue.localize_cue(NODE)
+        assert not cue._local
+        cue.localize_cue(OTHER)
+        assert cue._local
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            compile_dmx_cue(_cue({}), NODE, refresh_rate=0)
+        with pytest.raises(ValueError):
+            compile_dmx_cue(_cue({}, fadein=-1), NODE)
+        with pytest.raises(ValueError):
+            compile_dmx_cue(_cue({}), NODE, from_frames={1: b'\x00'})
+
+
+class TestCache:
+    def test_precompile_is_cached_until_edited(self):
+        cue = _cue({0: 100})
+        assert cue.compiled_output is None
+        compiled = cue.precompile(NODE)
+        assert cue.compiled_output is compiled
+        cue.DmxScene.DmxUniverse.buffer[0] = 50
+        assert cue.compiled_output is None
+        cue.precompile(NODE)
+        cue.fadeout_time = 1.0
+        assert cue.compiled_output is None
+        cue.precompile(NODE)
+        cue.outputs = [DmxCueOutput({'output_name': OTHER})]
+        assert cue.compiled_output is None
+        cue.precompile(NODE)
+        cue.DmxScene = {'id': 1, 'DmxUniverse': DmxUniverse()}
+        assert cue.compiled_output is None
+
+    def test_new_universe_with_same_levels_invalidates(self):
+        cue = _cue({0: 100})
+        cue.precompile(NODE)
+        universe = cue.DmxScene.DmxUniverse
+        twin = DmxUniverse({'universe_num': 1})
+        twin.buffer.update([(0, 100)])
+        assert twin.buffer.version == universe.buffer.version
+        cue.DmxScene.DmxUniverse = twin
+        assert cue.compiled_output is None
@@ -0,0 +1,105 @@
+"""Tests for DmxFadeEngine — vectorized DMX crossfades."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuemsutils.cues.DmxCue import DmxCue, DmxUniverse
+from cuemsutils.tools.DmxFadeEngine import DmxFadeEngine, Merge
+from cuemsutils.tools.FadeCurves import get_fade_curve
+
+
+def _universe(channels: dict[int, int], num: int = 0) -> DmxUniverse:
+    universe = DmxUniverse({'universe_num': num})
+    universe.buffer.update(channels.items())
+    return universe
+
+
+@pytest.fixture
+def engine():
+    return DmxFadeEngine(refresh_rate=40)
+
+
+class TestCrossfade:
+    def test_fade_in_and_out(self, engine):
+        engine.add_scene('a', _universe({0: 200, 5: 100}), fade_ms=1000, start_ms=0)
+        first = engine.tick(0)
+        assert set(first) == {0}
+        assert first[0] == bytes(512)
+        frame = engine.tick(500)[0]
+        assert (frame[0], frame[5]) == (100, 50)
+        assert engine.tick(1000)[0][:6] == bytes([200, 0, 0, 0, 0, 100])
+        assert engine.tick(1500) == {}
+        assert not engine.fading()
+        assert engine.release('a', fade_ms=100)
+        assert engine.tick(1550)[0][0] == 100
+        assert engine.tick(1600)[0] == bytes(512)
+        assert not engine.release('a')
+
+    def test_crossfade_from_current_level(self, engine):
+        engine.add_scene('a', _universe({0: 100}), start_ms=0)
+        engine.tick(0)
+        engine.add_scene('b', _universe({0: 200}), fade_ms=100)
+        assert engine.tick(50)[0][0] == 150
+        # Interrupt halfway: the next fade starts from 150
+        engine.add_scene('c', _universe({0: 50}), fade_ms=100)
+        assert engine.tick(100)[0][0] == 100
+
+    def test_curve(self, engine):
+        engine.add_scene('a', _universe({0: 255}), 1000, 'sigmoid', start_ms=0)
+        assert engine.tick(250)[0][0] == round(255 * get_fade_curve('sigmoid')(0.25))
+
+    def test_universes(self, engine):
+        engine.add_scene('a', [_universe({0: 10}, 1), _universe({0: 20}, 3)], start_ms=0)
+        assert sorted(engine.tick(0)) == [1, 3]
+        assert engine.frame(3)[0] == 20
+        assert engine.frame(7) == bytes(512)
+        assert engine.universes() == [1, 3]
+
+    def test_validation(self, engine):
+        with pytest.raises(ValueError):
+            engine.add_scene('a', _universe({}), fade_ms=-1)
+        with pytest.raises(ValueError):
+            engine.add_scene('a', _universe({}), merge='xtp')
+        with pytest.raises(ValueError):
+            DmxFadeEngine(refresh_rate=0)
+
+
+class TestMerge:
+    def test_ltp_latest_wins_and_falls_back(self, engine):
+        engine.add_scene('a', _universe({0: 200, 1: 200}), start_ms=0)
+        engine.add_scene('b', _universe({0: 50}), start_ms=0)
+        assert engine.tick(0)[0][:2] == bytes([50, 200])
+        engine.release('b')
+        assert engine.tick(10)[0][:2] == bytes([200, 200])
+
+    def test_htp_highest_wins(self, engine):
+        engine.add_scene('base', _universe({0: 100, 1: 100}), start_ms=0)
+        engine.add_scene('h1', _universe({0: 150, 1: 20}), merge=Merge.HTP, start_ms=0)
+        engine.add_scene('h2', _universe({0: 120}), merge='htp', start_ms=0)
+        assert engine.tick(0)[0][:2] == bytes([150, 100])
+        engine.release('h1')
+        assert engine.tick(10)[0][:2] == bytes([120, 100])
+        assert engine.active_keys() == ['base', 'h2']
+
+
+class TestFrames:
+    def test_refresh_rate(self, engine):
+        engine.add_scene('a', _universe({0: 100}), fade_ms=100, start_ms=0)
+        frames = list(engine.frames(0, 100))
+        assert [t for t, _ in frames] == [0, 25, 50, 75, 100]
+        assert [changes[0][0] for _, changes in frames] == [0, 25, 50, 75, 100]
+        assert list(engine.frames(125, 150)) == [(125, {}), (150, {})]
+
+    def test_dmx_cue(self, engine):
+        cue = DmxCue({
+            'fadein_time': 1.0,
+            'fadeout_time': 0.5,
+            'DmxScene': {'id': 0, 'DmxUniverse': _universe({2: 80}, 4)},
+        })
+        engine.add_cue(cue, start_ms=0)
+        assert engine.tick(500)[4][2] == 40
+        engine.tick(1000)
+        engine.release_cue(cue)
+        assert engine.tick(1250)[4][2] == 40
+        assert len(engine) == 0
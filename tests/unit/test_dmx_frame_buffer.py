@@ -0,0 +1,108 @@
+"""Tests for DmxFrameBuffer — dirty ranges, deltas and published frames."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from cuemsutils.cues.DmxCue import DmxUniverse
+from cuemsutils.tools.DmxFrameBuffer import DmxDelta, DmxFrameBuffer
+
+
+@pytest.fixture
+def fb():
+    fb = DmxFrameBuffer(merge_gap=2)
+    fb.write(0, 0, bytes(512))
+    fb.flush()
+    return fb
+
+
+class TestDirtyRanges:
+    def test_merge(self, fb):
+        fb.write(0, 10, b'\x01\x01')
+        fb.write(0, 20, b'\x02')
+        fb.write(0, 11, b'\x03\x03')
+        assert fb.dirty_ranges(0) == [(10, 13), (20, 21)]
+        fb.write(0, 5, bytes([9] * 20))
+        assert fb.dirty_ranges(0) == [(5, 25)]
+
+    def test_full_frame_marks_only_changes(self, fb):
+        frame = bytearray(512)
+        frame[300] = frame[302] = 1
+        fb.set_frame(0, frame)
+        assert fb.dirty_ranges(0) == [(300, 303)]
+
+    def test_unchanged_write_is_not_dirty(self, fb):
+        assert not fb.write(0, 0, b'\x00\x00')
+        assert not fb.is_dirty()
+        assert fb.flush() == []
+
+    def test_bounds(self, fb):
+        with pytest.raises(IndexError):
+            fb.write(0, 510, b'\x01\x01\x01')
+        with pytest.raises(ValueError):
+            fb.set_frame(0, b'\x01')
+
+
+class TestFlush:
+    def test_first_flush_is_full(self):
+        fb = DmxFrameBuffer()
+        fb.write(3, 7, b'\x05')
+        [delta] = fb.flush()
+        assert delta.universe == 3 and delta.start == 0 and len(delta.data) == 512
+        assert delta.data[7] == 5
+
+    def test_change_only_deltas(self, fb):
+        fb.write(0, 10, b'\x01\x00\x00\x01')  # 11 and 12 stay 0, within the gap
+        fb.write(0, 100, b'\x07')
+        fb.write(0, 200, b'\x08')
+        fb.write(0, 200, b'\x00')  # back to the published level
+        assert fb.flush() == [DmxDelta(0, 10, b'\x01\x00\x00\x01'), DmxDelta(0, 100, b'\x07')]
+        assert fb.dirty_ranges(0) == []
+        assert fb.flush() == []
+        assert fb.flush(full=True)[0].stop == 512
+
+    def test_multiple_universes(self, fb):
+        universe = DmxUniverse({'universe_num': 2})
+        universe.set_slice(0, b'\x10\x20')
+        fb.set_universe(universe)
+        fb.update({0: bytes([1]) + bytes(511)})
+        assert [(d.universe, d.start) for d in fb.flush()] == [(0, 0), (2, 0)]
+        assert fb.universes() == [0, 2]
+
+
+class TestReaders:
+    def test_snapshot_is_published_state(self, fb):
+        fb.write(0, 0, b'\xff')
+        before = fb.snapshot()
+        assert fb.frame(0)[0] == 0
+        fb.flush()
+        after = fb.snapshot()
+        assert after.sequence == before.sequence + 1
+        assert before.frames[0][0] == 0 and after.frames[0][0] == 255
+        assert fb.frame(9) == bytes(512)
+        with pytest.raises(TypeError):
+            after.frames[1] = b''
+
+    def test_readers_see_whole_flushes(self):
+        fb = DmxFrameBuffer()
+        torn = []
+        stop = threading.Event()
+
+        def read():
+            while not stop.is_set():
+                frames = fb.snapshot().frames
+                values = {frame[0] for frame in frames.values()}
+                if len(values) > 1:
+                    torn.append(values)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        for level in range(200):
+            for universe in range(4):
+                fb.write(universe, 0, bytes([level]))
+            fb.flush()
+        stop.set()
+        reader.join()
+        assert torn == []
@@ -0,0 +1,122 @@
+"""Tests for DmxSceneStore — delta-encoded DMX scenes."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from cuemsutils.cues.CueList import CueList
+from cuemsutils.cues.DmxCue import DmxCue, DmxUniverse
+from cuemsutils.tools.DmxBuffer import DmxBuffer
+from cuemsutils.tools.DmxSceneStore import DmxSceneStore, iter_dmx_cues
+
+
+def _universe(channels: dict[int, int], num: int = 0) -> DmxUniverse:
+    universe = DmxUniverse({'universe_num': num})
+    universe.buffer.update(channels.items())
+    return universe
+
+
+def _cue(channels: dict[int, int]) -> DmxCue:
+    return DmxCue({'DmxScene': {'id': 0, 'DmxUniverse': _universe(channels)}})
+
+
+class TestDeltas:
+    def test_stores_only_changes(self):
+        store = DmxSceneStore()
+        store.append('a', _universe({i: 100 for i in range(512)}))
+        store.append('b', _universe({**{i: 100 for i in range(512)}, 7: 0}))
+        assert store.reference('a') is None
+        assert store.reference('b') == 'a'
+        assert store.delta('b') == {0: [(7, 0)]}
+        assert store.stored_channels() == 513
+        assert store.frames('b')[0][6:8] == b'\x64\x00'
+
+    def test_unset_channels_and_universes(self):
+        store = DmxSceneStore()
+        store.append('a', [_universe({1: 10, 2: 20}), _universe({0: 1}, 5)])
+        store.append('b', _universe({1: 10}))
+        assert store.delta('b') == {5: None, 0: [(2, None)]}
+        scene = store.scene('b')
+        assert list(scene) == [0]
+        assert list(scene[0].items()) == [(1, 10)]
+
+    def test_explicit_base(self):
+        store = DmxSceneStore()
+        store.append('base', _universe({0: 255}))
+        store.append('x', _universe({1: 255}))
+        store.append('y', _universe({0: 255, 2: 1}), base='base')
+        assert store.reference('y') == 'base'
+        assert store.delta('y') == {0: [(2, 1)]}
+        with pytest.raises(KeyError):
+            store.append('z', _universe({}), base='nope')
+        with pytest.raises(ValueError):
+            store.append('y', _universe({}), base='y')
+
+    def test_keyframes_bound_chains(self):
+        store = DmxSceneStore(keyframe_interval=4)
+        for i in range(10):
+            store.append(i, _universe({i: i}))
+        assert [store.reference(i) for i in range(10)] == [None, 0, 1, 2, None, 4, 5, 6, None, 8]
+
+
+class TestMaterialize:
+    def test_random_access_matches_scenes(self):
+        rng = random.Random(4)
+        store = DmxSceneStore(keyframe_interval=5)
+        scenes = []
+        levels = {}
+        for i in range(40):
+            for _ in range(rng.randint(0, 6)):
+                levels[rng.randrange(512)] = rng.randrange(256)
+            if levels and rng.random() < 0.2:
+                del levels[rng.choice(list(levels))]
+            scenes.append(dict(levels))
+            store.append(i, _universe(levels))
+        for i in rng.sample(range(40), 40) + list(range(40)):
+            assert dict(store.scene(i)[0].items()) == scenes[i]
+
+    def test_scene_is_a_copy(self):
+        store = DmxSceneStore()
+        store.append('a', _universe({0: 1}))
+        store.scene('a')[0][0] = 99
+        assert store.frames('a')[0][0] == 1
+        assert isinstance(store.scene('a')[0], DmxBuffer)
+
+
+class TestEditing:
+    def test_replace_and_remove_keep_dependents(self):
+        store = DmxSceneStore()
+        store.append('a', _universe({0: 1}))
+        store.append('b', _universe({0: 1, 1: 2}))
+        store.append('c', _universe({0: 1, 1: 2, 2: 3}))
+        store.append('b', _universe({5: 5}))
+        assert list(store) == ['a', 'b', 'c']
+        assert dict(store.scene('c')[0].items()) == {0: 1, 1: 2, 2: 3}
+        store.remove('b')
+        assert store.reference('c') == 'a'
+        assert dict(store.scene('c')[0].items()) == {0: 1, 1: 2, 2: 3}
+        assert 'b' not in store and len(store) == 2
+
+    def test_cycle_is_refused(self):
+        store = DmxSceneStore()
+        store.append('a', _universe({0: 1}))
+        store.append('b', _universe({0: 2}))
+        with pytest.raises(ValueError):
+            store.append('a', _universe({0: 3}), base='b')
+
+
+class TestCues:
+    def test_from_cues_and_apply(self):
+        cues = [_cue({0: 10}), _cue({0: 10, 1: 20})]
+        cuelist = CueList({'contents': [cues[0], CueList({'contents': [cues[1]]})]})
+        assert list(iter_dmx_cues([cuelist])) == cues
+        store = DmxSceneStore.from_cues([cuelist])
+        assert store.delta(cues[1].id) == {0: [(1, 20)]}
+        cues[1].DmxScene.DmxUniverse.buffer.clear()
+        store.apply_to_cue(cues[1])
+        assert cues[1].DmxScene.DmxUniverse == _universe({0: 10, 1: 20})
+        store.append('two', [_universe({}), _universe({}, 1)])
+        with pytest.raises(ValueError):
+            store.apply_to_cue(cues[0], 'two')
@@ -0,0 +1,111 @@
+"""Tests for arm-time compilation of MediaCue fade profiles."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuemsutils.cues.AudioCue import AudioCue
+from cuemsutils.cues.FadeProfile import FadeProfile
+from cuemsutils.cues.MediaCue import Media, Region
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.FadeCompiler import compile_media_fades, playback_window
+from cuemsutils.tools.FadeCurves import get_fade_curve
+from cuemsutils.tools.FadeEnvelopeCache import fade_envelope
+
+FADE_IN = {'type': 'in', 'mode': 'preset', 'function_id': 'linear_in_out'}
+FADE_OUT = {
+    'type': 'out',
+    'mode': 'parametric',
+    'function_id': 'bezier',
+    'parameters': [
+        {'parameter_name': 'p1', 'parameter_value': 0.25},
+        {'parameter_name': 'p2', 'parameter_value': 0.75},
+    ],
+}
+
+
+def _cue(in_time=None, out_time=None, duration='00:00:10.000', profiles=(FADE_IN, FADE_OUT)):
+    cue = AudioCue({
+        'Media': Media({
+            'file_name': 'f.wav',
+            'id': '',
+            'duration': duration,
+            'regions': [Region({'id': 0, 'loop': 1, 'in_time': in_time, 'out_time': out_time})],
+        }),
+    })
+    cue.fade_profiles = [FadeProfile(p) for p in profiles] or None
+    return cue
+
+
+class TestPlaybackWindow:
+    def test_media_duration(self):
+        assert playback_window(_cue()) == (0, 10_000)
+
+    def test_region(self):
+        assert playback_window(_cue('00:00:01.000', '00:00:04.000')) == (1000, 4000)
+
+    def test_unknown_duration(self):
+        assert playback_window(_cue(duration=None)) == (0, None)
+
+
+class TestCompile:
+    def test_fades_placed_on_region(self):
+        fades = compile_media_fades(_cue('00:00:01.000', '00:00:05.000'), 1000, 2000)
+        assert (fades.fade_in.start, fades.fade_in.end) == (1000, 2000)
+        assert (fades.fade_out.start, fades.fade_out.end) == (3000, 5000)
+        assert fades.fade_in.envelope is fade_envelope('linear_in_out', 1000)
+        assert fades.fade_out.envelope is fade_envelope('bezier', 2000, p1=0.25, p2=0.75)
+
+    def test_gain(self):
+        fades = compile_media_fades(_cue(), 1000, CTimecode(start_timecode='00:00:02.000'))
+        assert fades.gain(0) == 0.0
+        assert fades.gain(500) == pytest.approx(0.5)
+        assert fades.gain(5000) == 1.0
+        bezier = get_fade_curve('bezier', p1=0.25, p2=0.75)
+        assert fades.gain(9000) == pytest.approx(1.0 - bezier(0.5))
+        assert fades.gain(10_000) == 0.0
+
+    def test_missing_profiles(self):
+        fades = compile_media_fades(_cue(profiles=()), 1000, 1000)
+        assert fades.fade_in is None and fades.fade_out is None
+        assert fades.gain(0) == 1.0
+
+    @pytest.mark.parametrize("kwargs,match", [
+        (dict(fade_in=None, fade_out=1000), "needs a length"),
+        (dict(fade_in=0, fade_out=1000), "must be > 0"),
+        (dict(fade_in=6000, fade_out=6000), "exceed"),
+        (dict(fade_in=11_000, fade_out=None), "needs a length"),
+    ])
+    def test_errors(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            compile_media_fades(_cue(), **kwargs)
+
+    def test_fade_longer_than_window(self):
+        with pytest.raises(ValueError, match="exceeds"):
+            compile_media_fades(_cue(profiles=(FADE_IN,)), 11_000)
+
+    def test_unknown_duration(self):
+        with pytest.raises(ValueError, match="unknown"):
+            compile_media_fades(_cue(duration=None), 1000, 1000)
+
+    def test_fade_in_only_with_unknown_duration(self):
+        fades = compile_media_fades(_cue(duration=None, profiles=(FADE_IN,)), 1000)
+        assert (fades.fade_in.start, fades.fade_in.end) == (0, 1000)
+        assert fades.fade_out is None and fades.play_end is None
+        assert fades.gain(500) == pytest.approx(0.5)
+
+
+class TestArm:
+    def test_arm_and_invalidate(self):
+        cue = _cue()
+        assert cue.compiled_fades is None
+        fades = cue.arm_fades(1000, 1000)
+        assert cue.compiled_fades is fades
+        cue.fade_profiles = [FadeProfile(FADE_IN)]
+        assert cue.compiled_fades is None
+        assert cue.arm_fades(1000).fade_out is None
+        cue.media['duration'] = None
+        assert cue.arm_fades(1000).fade_in.end == 1000
+        cue.media = Media({'file_name': 'g.wav', 'id': '', 'duration': '00:00:03.000'})
+        assert cue.compiled_fades is None
+        assert cue.arm_fades(1000).play_end == 3000
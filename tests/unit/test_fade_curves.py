@@ -0,0 +1,172 @@
+"""Tests for FadeCurves — fade curve registry and lookup tables."""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from cuemsutils.cues.FadeCue import FadeCurveType
+from cuemsutils.cues.FadeProfile import FadeFunctionParameter, FadeProfile
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.FadeCalculator import FadeCalculator
+from cuemsutils.tools.FadeCurves import (
+    FADE_CURVES,
+    LUT_SIZE,
+    FadeCurve,
+    curve_for_profile,
+    get_fade_curve,
+    get_fade_shape,
+    parameters_to_dict,
+    register_fade_curve,
+)
+
+PARAMS = {'bezier': {'p1': 0.25, 'p2': 0.75}}
+
+
+class TestRegistry:
+    @pytest.mark.parametrize("curve_type", list(FadeCurveType))
+    def test_every_curve_type_registered(self, curve_type):
+        assert get_fade_shape(curve_type).name == curve_type.value
+
+    @pytest.mark.parametrize("function_id", ['linear_in_out', 'bezier'])
+    def test_profile_function_ids_registered(self, function_id):
+        assert function_id in FADE_CURVES
+
+    @pytest.mark.parametrize("name", sorted(FADE_CURVES))
+    def test_normalized_and_monotonic(self, name):
+        curve = get_fade_curve(name, **PARAMS.get(name, {}))
+        assert len(curve.table) == LUT_SIZE + 1
+        assert curve(0.0) == 0.0
+        assert curve(1.0) == 1.0
+        assert all(a <= b for a, b in zip(curve.table, curve.table[1:]))
+
+    def test_unknown_curve(self):
+        with pytest.raises(ValueError, match="Unknown fade curve"):
+            get_fade_curve('nope')
+
+    def test_bind_is_cached(self):
+        assert get_fade_curve('exponential') is get_fade_curve('exponential', growth=5.0)
+        assert get_fade_curve('exponential', growth=2.0) is not get_fade_curve('exponential')
+
+    def test_parameter_validation(self):
+        with pytest.raises(ValueError, match="requires parameter 'p2'"):
+            get_fade_curve('bezier', p1=0.1)
+        with pytest.raises(ValueError, match="Unknown parameters"):
+            get_fade_curve('linear', growth=1.0)
+        with pytest.raises(ValueError, match="finite"):
+            get_fade_curve('exponential', growth=math.inf)
+
+    @pytest.mark.parametrize('params, name', [
+        ({'growth': -2.0}, 'growth'),
+        ({'growth': 0.0}, 'growth'),
+        ({'inflec': 0.0}, 'inflec'),
+    ])
+    def test_sigmoid_parameter_domain(self, params, name):
+        with pytest.raises(ValueError, match=f"Parameter '{name}' of fade curve 'sigmoid' must be > 0"):
+            get_fade_curve('sigmoid', **params)
+
+    def test_exponential_accepts_zero_and_negative_growth(self):
+        assert get_fade_curve('exponential', growth=0.0)(0.25) == pytest.approx(0.25)
+        curve = get_fade_curve('logarithmic', growth=-3.0)
+        assert curve(0.0) == 0.0 and curve(1.0) == pytest.approx(1.0)
+
+    def test_register(self):
+        shape = register_fade_curve('_test_square', lambda x, k: x ** k, {'k': 2.0})
+        try:
+            assert register_fade_curve('_test_square', lambda x: x, replace=False) is shape
+            assert get_fade_curve('_test_square')(0.5) == pytest.approx(0.25, abs=1e-6)
+        finally:
+            del FADE_CURVES['_test_square']
+
+
+class TestLookupTable:
+    @pytest.mark.parametrize("name,exact", [
+        ('exponential', lambda x: math.expm1(5 * x) / math.expm1(5)),
+        ('logarithmic', lambda x: math.log1p(math.expm1(5) * x) / 5),
+        ('bezier', lambda x: 3 * (1 - x) ** 2 * x * 0.25 + 3 * (1 - x) * x * x * 0.75 + x ** 3),
+    ])
+    def test_interpolation_matches_shape(self, name, exact):
+        curve = get_fade_curve(name, **PARAMS.get(name, {}))
+        for i in range(1000):
+            x = i / 999
+            assert curve(x) == pytest.approx(exact(x), abs=1e-4)
+
+    def test_clamps(self):
+        curve = get_fade_curve('linear')
+        assert curve(-1.0) == 0.0
+        assert curve(2.0) == 1.0
+
+    def test_sigmoid_matches_fade_calculator(self):
+        expected = FadeCalculator.sigmoid(101, 0.0, 1.0, inflec=50.0, growth=4.0)
+        got = get_fade_curve('sigmoid').values(101, 0.0, 1.0)
+        # FadeCalculator's sigmoid never quite reaches end_value; the curve is scaled to land on it
+        scale = expected[-1]
+        assert [v * scale for v in got] == pytest.approx(expected, abs=1e-5)
+
+    def test_values(self):
+        assert get_fade_curve('linear').values(5, 1.0, 0.0) == pytest.approx(
+            [1.0, 0.75, 0.5, 0.25, 0.0]
+        )
+        with pytest.raises(ValueError):
+            get_fade_curve('linear').values(1, 0.0, 1.0)
+
+    def test_custom_size(self):
+        curve = FadeCurve('square', lambda x: x * x, size=2)
+        assert curve.table.tolist() == [0.0, 0.25, 1.0]
+        assert curve(0.75) == pytest.approx(0.625)
+
+
+class TestProfiles:
+    def test_preset(self):
+        profile = FadeProfile({'type': 'in', 'mode': 'preset', 'function_id': 'linear_in_out'})
+        assert curve_for_profile(profile)(0.3) == pytest.approx(0.3)
+
+    def test_parametric(self):
+        profile = FadeProfile({
+            'type': 'out',
+            'mode': 'parametric',
+            'function_id': 'bezier',
+            'parameters': [
+                FadeFunctionParameter({'parameter_name': 'p1', 'parameter_value': 0.0}),
+                FadeFunctionParameter({'parameter_name': 'p2', 'parameter_value': 1.0}),
+            ],
+        })
+        curve = curve_for_profile(profile)
+        assert curve.params == {'p1': 0.0, 'p2': 1.0}
+        assert curve(0.5) == pytest.approx(0.5)
+
+    def test_parametric_missing_parameter(self):
+        profile = FadeProfile({
+            'type': 'out',
+            'mode': 'parametric',
+            'function_id': 'bezier',
+            'parameters': [{'parameter_name': 'p1', 'parameter_value': 0.25}],
+        })
+        with pytest.raises(ValueError, match="requires parameter 'p2'"):
+            curve_for_profile(profile)
+
+    def test_preset_needing_parameters(self):
+        profile = FadeProfile({'type': 'in', 'mode': 'preset', 'function_id': 'bezier'})
+        with pytest.raises(ValueError, match="cannot be used as a preset"):
+            curve_for_profile(profile)
+
+    def test_unknown_function_id(self):
+        profile = FadeProfile({'type': 'in', 'mode': 'preset', 'function_id': 'wobble'})
+        with pytest.raises(ValueError, match="Unknown fade curve"):
+            curve_for_profile(profile)
+
+    def test_parameters_to_dict(self):
+        assert parameters_to_dict(None) == {}
+        assert parameters_to_dict([{'parameter_name': 'a', 'parameter_value': 1}]) == {'a': 1.0}
+
+
+def test_fade_calculator_resolves_registered_curves():
+    start = CTimecode(start_timecode="00:00:00.000", framerate="ms")
+    end = CTimecode(start_timecode="00:00:00.100", framerate="ms")
+    out = list(FadeCalculator.calculate(
+        'exponential', start_time=start, end_time=end, framerate='ms',
+        length=5, start_value=0.0, end_value=1.0, growth=2.0,
+    ))
+    assert [v for _, v in out] == get_fade_curve('exponential', growth=2.0).values(5, 0.0, 1.0)
+    assert out[-1][1] == 1.0
@@ -0,0 +1,115 @@
+"""Tests for the memoized fade envelope cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuemsutils.cues.FadeCue import FadeCurveType
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.FadeCalculator import FadeCalculator
+from cuemsutils.tools.FadeCurves import get_fade_curve
+from cuemsutils.tools.FadeEnvelopeCache import (
+    FadeEnvelope,
+    FadeEnvelopeCache,
+    cache_clear,
+    cache_info,
+    fade_envelope,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cache_clear()
+    yield
+    cache_clear()
+
+
+class TestEnvelope:
+    def test_offsets_follow_fade_calculator_timeline(self):
+        start = CTimecode(start_timecode="00:00:00.000", framerate="ms")
+        end = CTimecode(start_timecode="00:00:00.250", framerate="ms")
+        for framerate in ("ms", 25):
+            envelope = fade_envelope('linear', 250, framerate)
+            timeline = FadeCalculator.calculate_timeline(start, end, framerate=framerate)
+            assert len(envelope) == len(timeline)
+            expected = [
+                CTimecode(start_timecode=tc, framerate=framerate).milliseconds_rounded
+                - start.milliseconds_rounded
+                for tc in timeline[:-1]
+            ]
+            assert envelope.offsets.tolist()[:-1] == expected
+            assert envelope.offsets[-1] == 250
+
+    def test_values_follow_time(self):
+        envelope = fade_envelope('exponential', 100, growth=3.0)
+        curve = get_fade_curve('exponential', growth=3.0)
+        assert envelope.offsets.tolist() == [0, 20, 40, 60, 100]
+        assert envelope.values.tolist() == [curve(o / 100) for o in envelope.offsets]
+
+    def test_short_fade_has_two_points(self):
+        envelope = fade_envelope('linear', 5)
+        assert envelope.offsets.tolist() == [0, 5]
+        assert envelope.values.tolist() == [0.0, 1.0]
+
+    def test_read_only(self):
+        envelope = fade_envelope('linear', 100)
+        with pytest.raises(TypeError):
+            envelope.values[0] = 0.5
+        with pytest.raises(TypeError):
+            envelope.offsets[0] = 1
+
+    def test_levels(self):
+        assert fade_envelope('linear', 100).levels(1.0, 0.0) == pytest.approx(
+            [1.0, 0.8, 0.6, 0.4, 0.0]
+        )
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            fade_envelope('linear', 0)
+        with pytest.raises(ValueError):
+            fade_envelope('linear', 100, step=0)
+        with pytest.raises(ValueError, match="Unknown fade curve"):
+            fade_envelope('nope', 100)
+
+
+class TestCache:
+    def test_shared_instance_and_stats(self):
+        a = fade_envelope(FadeCurveType.sigmoid, 2000)
+        b = fade_envelope('sigmoid', 2000, 'ms', 20, inflec=0.5, growth=4.0)
+        assert a is b
+        info = cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert info.hit_rate == 0.5
+
+    def test_key_includes_timing_and_params(self):
+        base = fade_envelope('linear', 2000)
+        assert fade_envelope('linear', 2000, 25) is not base
+        assert fade_envelope('linear', 2000, step=40) is not base
+        assert fade_envelope('linear', 1000) is not base
+        assert fade_envelope('exponential', 2000, growth=2.0) is not fade_envelope('exponential', 2000)
+        assert cache_info().hits == 0
+
+    def test_timecode_duration(self):
+        duration = CTimecode(start_timecode="00:00:02.000", framerate="ms")
+        assert fade_envelope('linear', duration) is fade_envelope('linear', 2000)
+
+    def test_lru_eviction(self):
+        cache = FadeEnvelopeCache(maxsize=2)
+        first = cache.get('linear', 100)
+        cache.get('linear', 200)
+        cache.get('linear', 100)  # refresh 100
+        cache.get('linear', 300)  # evicts 200
+        assert len(cache) == 2
+        assert cache.get('linear', 100) is first
+        info = cache.info()
+        assert info.evictions == 1
+        assert cache.get('linear', 200) is not None
+        assert cache.info().misses == 4
+        cache.clear()
+        assert cache.info() == (0, 0, 0, 2, 0)
+
+    def test_direct_envelope(self):
+        envelope = FadeEnvelope(get_fade_curve('linear'), 40, step=10)
+        assert envelope.offsets.tolist() == [0, 10, 20, 40]
+        with pytest.raises(ValueError):
+            FadeEnvelopeCache(maxsize=0)
@@ -0,0 +1,139 @@
+"""Tests for FadeMixer — vectorized multi-target fades."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuemsutils.cues.FadeCue import FadeCue
+from cuemsutils.cues.FadeProfile import FadeFunctionParameter, FadeProfile
+from cuemsutils.tools.FadeCurves import get_fade_curve
+from cuemsutils.tools.FadeMixer import FadeMixer
+
+
+@pytest.fixture
+def mixer():
+    return FadeMixer(capacity=2)
+
+
+class TestTick:
+    def test_linear_fade(self, mixer):
+        mixer.add('a', 100.0, 1000, start_value=0.0)
+        assert mixer.tick(0) == {'a': 0.0}
+        assert mixer.tick(250) == pytest.approx({'a': 25.0})
+        assert mixer.tick(1000) == {'a': 100.0}
+        assert len(mixer) == 0
+        assert mixer.tick(2000) == {}
+        assert mixer.value('a') == 100.0
+
+    def test_only_changed_targets(self, mixer):
+        mixer.add('a', 100.0, 1000, start_value=0.0)
+        mixer.add('b', 50.0, 1000, start_value=50.0)
+        assert set(mixer.tick(0)) == {'a', 'b'}
+        assert set(mixer.tick(500)) == {'a'}
+        assert mixer.tick(500) == {}
+
+    def test_curves_evaluated_together(self, mixer):
+        targets = {f'cue{i}': name for i, name in enumerate(
+            ['linear', 'exponential', 'logarithmic', 'sigmoid'] * 10
+        )}
+        for target, name in targets.items():
+            mixer.add(target, 1.0, 400, name, start_value=0.0)
+        out = mixer.tick(100)
+        for target, name in targets.items():
+            assert out[target] == pytest.approx(get_fade_curve(name)(0.25))
+
+    def test_many_fades_grow(self, mixer):
+        for i in range(100):
+            mixer.add(i, 1.0, 100 + i, start_value=0.0, start_ms=0)
+        assert len(mixer) == 100
+        out = mixer.tick(100)
+        assert out[0] == 1.0
+        assert out[99] == pytest.approx(100 / 199)
+        assert len(mixer) == 99
+
+    def test_finished_fades_give_rows_back(self, mixer):
+        for i in range(200):
+            curve = get_fade_curve('exponential', growth=1.0 + i)
+            mixer.add(i, 1.0, 100, curve, start_value=0.0, start_ms=i * 100)
+            assert mixer.tick(i * 100 + 100) == {i: 1.0}
+        assert len(mixer._tables) == 2
+        assert len(mixer._values) == 2
+        assert mixer.value(0) == 1.0
+        mixer.add(0, 0.0, 100, start_ms=20_000)
+        assert mixer.tick(20_050) == pytest.approx({0: 0.5})
+
+    def test_start_in_future(self, mixer):
+        mixer.add('a', 1.0, 100, start_value=0.5, start_ms=1000)
+        assert mixer.tick(0) == {'a': 0.5}
+        assert mixer.tick(1050) == pytest.approx({'a': 0.75})
+
+
+class TestPrecedence:
+    def test_latest_replaces_and_continues_from_current(self, mixer):
+        mixer.add('a', 100.0, 1000, start_value=0.0, start_ms=0)
+        mixer.tick(500)
+        mixer.add('a', 0.0, 500)  # starts at 500 from 50
+        assert len(mixer) == 1
+        assert mixer.tick(750) == pytest.approx({'a': 25.0})
+
+    def test_higher_priority_holds_then_releases(self, mixer):
+        mixer.add('a', 0.0, 200, start_value=100.0, start_ms=0, priority=1)
+        mixer.add('a', 100.0, 1000, start_value=0.0, start_ms=0)
+        assert len(mixer) == 2
+        assert mixer.tick(100) == pytest.approx({'a': 50.0})
+        assert mixer.tick(200) == {'a': 0.0}
+        # The priority fade finished; the other one takes over
+        assert mixer.tick(500) == pytest.approx({'a': 50.0})
+
+    def test_cancel(self, mixer):
+        fade = mixer.add('a', 100.0, 1000, start_value=0.0, start_ms=0)
+        mixer.tick(500)
+        assert mixer.cancel(fade)
+        assert not mixer.cancel(fade)
+        assert mixer.tick(1000) == {}
+        assert mixer.value('a') == 50.0
+        mixer.add('a', 0.0, 100)
+        assert mixer.cancel_target('a') == 1
+        assert mixer.cancel_target('nope') == 0
+
+    def test_new_target_needs_start_value(self, mixer):
+        with pytest.raises(ValueError, match="start_value is required"):
+            mixer.add('a', 1.0, 100)
+        mixer.set_value('a', 0.2)
+        mixer.add('a', 1.0, 100)
+        assert mixer.active_targets() == {'a'}
+        with pytest.raises(ValueError):
+            mixer.add('a', 1.0, 0)
+
+
+class TestCues:
+    def test_fade_cue(self, mixer):
+        cue = FadeCue({
+            'action_target': 'target-id',
+            'curve_type': 'sigmoid',
+            'duration': '00:00:02.000',
+            'target_value': 0,
+        })
+        mixer.set_value('target-id', 100.0)
+        mixer.add_fade_cue(cue, start_ms=0)
+        assert mixer.tick(1000)['target-id'] == pytest.approx(100.0 * (1 - get_fade_curve('sigmoid')(0.5)))
+        assert mixer.tick(2000) == {'target-id': 0.0}
+
+    def test_fade_profiles(self, mixer):
+        fade_in = FadeProfile({'type': 'in', 'mode': 'preset', 'function_id': 'linear_in_out'})
+        fade_out = FadeProfile({
+            'type': 'out',
+            'mode': 'parametric',
+            'function_id': 'bezier',
+            'parameters': [
+                FadeFunctionParameter({'parameter_name': 'p1', 'parameter_value': 1 / 3}),
+                FadeFunctionParameter({'parameter_name': 'p2', 'parameter_value': 2 / 3}),
+            ],
+        })
+        mixer.add_fade_profile('m', fade_in, 100, level=80.0, start_ms=0)
+        assert mixer.tick(50) == pytest.approx({'m': 40.0})
+        mixer.tick(100)
+        mixer.add_fade_profile('m', fade_out, 100, level=80.0)
+        assert mixer.tick(150) == pytest.approx({'m': 40.0})
+        mixer.add_fade_profile('n', fade_out, 100, level=60.0, start_ms=150)
+        assert mixer.tick(200) == pytest.approx({'m': 0.0, 'n': 30.0})
@@ -0,0 +1,75 @@
+"""Tests for FadeQuantizer — change-point fades at output resolution."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuemsutils.tools.FadeCurves import get_fade_curve
+from cuemsutils.tools.FadeQuantizer import change_points, quantize, suppress_duplicates
+from cuemsutils.tools.FadeStream import stream_fade
+
+
+def _quantized_at(curve, duration, start, end, offset, resolution=1.0):
+    return quantize(start + (end - start) * curve(offset / duration), resolution)
+
+
+class TestChangePoints:
+    def test_slow_linear_fade(self):
+        points = change_points('linear', 30 * 60 * 1000, 0.0, 100.0)
+        assert len(points) == 101
+        assert points[0] == (0.0, 0.0)
+        assert points[1] == pytest.approx((9000.0, 1.0))
+        assert points[-1][1] == 100.0
+        assert [v for _, v in points] == [float(i) for i in range(101)]
+
+    @pytest.mark.parametrize("name", ['linear', 'exponential', 'logarithmic', 'sigmoid'])
+    @pytest.mark.parametrize("start,end,resolution", [(0.0, 100.0, 1.0), (255.0, 0.0, 1.0), (0.0, 1.0, 0.1)])
+    def test_points_match_sampled_fade(self, name, start, end, resolution):
+        curve = get_fade_curve(name)
+        duration = 2000.0
+        points = change_points(curve, duration, start, end, resolution)
+        offsets = [o for o, _ in points]
+        assert offsets == sorted(offsets)
+        # Just after each point the sampled, quantized fade has the point's value
+        for (offset, value), nxt in zip(points, points[1:] + [(duration + 1, None)]):
+            probe = min(offset + 1e-6, duration)
+            if probe < nxt[0]:
+                assert _quantized_at(curve, duration, start, end, probe, resolution) == pytest.approx(value)
+        assert points[-1][1] == pytest.approx(quantize(end, resolution))
+
+    def test_non_monotonic_curve(self):
+        # p1 > 1 overshoots: the value rises past the end, then comes back
+        points = change_points('bezier', 1000, 0.0, 10.0, p1=2.0, p2=1.0)
+        values = [v for _, v in points]
+        assert max(values) > 10.0
+        assert values[-1] == 10.0
+
+    def test_constant_fade(self):
+        assert change_points('linear', 1000, 50.0, 50.0) == [(0.0, 50.0)]
+        assert change_points('linear', 1000, 50.0, 50.2) == [(0.0, 50.0)]
+
+    def test_min_interval(self):
+        points = change_points('linear', 100, 0.0, 255.0, min_interval=25)
+        assert points == [(0.0, 0.0), (25.0, 64.0), (50.0, 127.0), (75.0, 191.0), (100.0, 255.0)]
+        offsets = [o for o, _ in points]
+        assert all(b - a >= 25 for a, b in zip(offsets, offsets[1:]))
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            change_points('linear', 0, 0.0, 1.0)
+        with pytest.raises(ValueError):
+            change_points('linear', 10, 0.0, 1.0, resolution=0)
+        with pytest.raises(ValueError):
+            change_points('linear', 10, 0.0, 1.0, min_interval=-1)
+
+
+def test_quantize():
+    assert quantize(0.5, 1.0) == 1.0
+    assert quantize(0.49, 1.0) == 0.0
+    assert quantize(0.26, 0.25) == 0.25
+
+
+def test_suppress_duplicates():
+    pairs = list(suppress_duplicates(stream_fade('linear', 60_000, 0.0, 10.0)))
+    assert [v for _, v in pairs] == [float(i) for i in range(11)]
+    assert pairs[1] == (3000, 1.0)
@@ -0,0 +1,99 @@
+"""Tests for lazy fade evaluation (stream_fade, FadeParams)."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.CTimecodeTimer import CTimecodeTimer, _State
+from cuemsutils.tools.FadeCurves import get_fade_curve
+from cuemsutils.tools.FadeStream import FadeParams, stream_fade
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.TimecodeClock import TimecodeClock
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.0005)
+
+
+class TestStreamFade:
+    def test_pairs(self):
+        assert list(stream_fade('linear', 100, 0.0, 1.0)) == pytest.approx(
+            [(0, 0.0), (20, 0.2), (40, 0.4), (60, 0.6), (80, 0.8), (100, 1.0)]
+        )
+
+    def test_lazy(self):
+        gen = stream_fade('sigmoid', 30 * 60 * 1000, 1.0, 0.0)
+        assert next(gen) == (0, 1.0)
+        assert next(gen)[0] == 20
+
+    def test_start_offset(self):
+        assert [o for o, _ in stream_fade('linear', 100, 0.0, 1.0, start_offset=50)] == [50, 60, 80, 100]
+        assert list(stream_fade('linear', 100, 0.0, 1.0, start_offset=100)) == [(100, 1.0)]
+        curve = get_fade_curve('exponential')
+        offset, value = next(stream_fade(curve, 1000, 0.0, 10.0, start_offset=333))
+        assert value == pytest.approx(10.0 * curve(0.333))
+
+    def test_validation_is_eager(self):
+        with pytest.raises(ValueError):
+            stream_fade('linear', 100, 0.0, 1.0, start_offset=101)
+        with pytest.raises(ValueError):
+            stream_fade('linear', 0, 0.0, 1.0)
+        with pytest.raises(ValueError):
+            stream_fade('linear', 100, 0.0, 1.0, step=0)
+        with pytest.raises(ValueError, match="already bound"):
+            stream_fade(get_fade_curve('exponential'), 100, 0.0, 1.0, growth=1.0)
+
+
+class TestFadeParams:
+    def test_items(self):
+        params = FadeParams('linear', 100, 0.0, 1.0, interval=30)
+        assert len(params) == 5
+        assert [params[i] for i in range(5)] == pytest.approx(
+            [(0, 0.0), (30, 0.3), (60, 0.6), (90, 0.9), (100, 1.0)]
+        )
+        assert params.exhausted(5)
+        with pytest.raises(IndexError):
+            params[5]
+        with pytest.raises(IndexError):
+            params[-1]
+
+    def test_quarter_frames(self):
+        params = FadeParams.quarter_frames('linear', 1000, 0.0, 1.0, framerate=25)
+        assert params.interval == 10.0
+        assert len(params) == 101
+        late = FadeParams.quarter_frames('linear', 1000, 0.0, 1.0, framerate=25, start_offset=500)
+        assert late[0] == params[50]
+        assert len(late) == 51
+
+    def test_drives_timer(self):
+        calls: list[tuple[float, float]] = []
+        timer = CTimecodeTimer(
+            CTimecode(framerate=25),
+            params=FadeParams.quarter_frames('linear', 100, 0.0, 1.0, framerate=25),
+        )
+        timer._qf_interval = 0.001
+        timer.callback = lambda offset, value: calls.append((offset, value))
+        timer.start()
+        _wait_for(lambda: timer._state == _State.EXHAUSTED)
+        assert calls == pytest.approx([(i * 10.0, i / 10) for i in range(11)])
+
+    def test_timecode_indexed_seek(self):
+        clock = TimecodeClock(25)
+        calls: list[float] = []
+        timer = CTimecodeTimer(
+            clock,
+            params=FadeParams.quarter_frames('linear', 60_000, 0.0, 1.0, framerate=25),
+            start_timecode=FastTimecode(0, 25),
+        )
+        timer._qf_interval = 0.001
+        timer.callback = lambda offset, value: calls.append(offset)
+        clock.seek(250)  # 10 s into the fade
+        timer.start()
+        _wait_for(lambda: calls)
+        timer.stop()
+        assert calls[0] == 10_000.0
@@ -0,0 +1,116 @@
+"""Tests for FastTimecode — parity with CTimecode playhead/DF semantics."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from cuemsutils.tools.CTimecode import CTimecode, CTimecodeError, framerate_info
+from cuemsutils.tools.FastTimecode import FastTimecode
+
+FRAMERATES = ['ms', 24, 25, 30, 23.976, 29.97, 59.94]
+FRAME_NUMBERS = [0, 1, 17, 1799, 1800, 1801, 17982, 17983, 107892, 2_160_001]
+SECONDS = [0, 0.04, 1, 59.99, 60, 61.5, 600, 3599.96, 86401.2]
+
+
+class TestFramerateInfo:
+    def test_shared_instance(self):
+        assert framerate_info(25) is framerate_info(25)
+
+    def test_matches_upstream(self):
+        for fr in FRAMERATES:
+            tc = CTimecode(framerate=fr)
+            info = framerate_info(fr)
+            assert info.int_framerate == tc._int_framerate
+            assert info.drop_frame == tc.drop_frame
+            assert info.framerate == tc.framerate
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError):
+            framerate_info(25).int_framerate = 30
+
+
+@pytest.mark.parametrize("fr", FRAMERATES)
+class TestParity:
+    def test_from_ctimecode_round_trip(self, fr):
+        for n in FRAME_NUMBERS:
+            tc = CTimecode(framerate=fr, frames=n + 1)
+            fast = FastTimecode.from_ctimecode(tc)
+            assert fast.frame_number == tc.frame_number
+            assert fast.frames == tc.frames
+            assert fast.milliseconds_exact == tc.milliseconds_exact
+            assert fast.milliseconds_rounded == tc.milliseconds_rounded
+            assert str(fast) == str(tc)
+            assert fast.to_ctimecode().frames == tc.frames
+
+    def test_from_seconds(self, fr):
+        for s in SECONDS:
+            tc = CTimecode(start_seconds=s, framerate=fr)
+            assert FastTimecode.from_seconds(s, fr).frame_number == tc.frame_number
+
+    def test_from_string(self, fr):
+        tc = CTimecode(framerate=fr, frames=12346)
+        assert FastTimecode.from_string(str(tc), fr).frame_number == 12345
+
+    def test_arithmetic(self, fr):
+        a = CTimecode(start_seconds=70, framerate=fr)
+        b = CTimecode(start_seconds=12, framerate=fr)
+        fa, fb = FastTimecode.from_ctimecode(a), FastTimecode.from_ctimecode(b)
+        assert (fa + fb).frames == (a + b).frames
+        assert (fa - fb).frames == (a - b).frames
+        assert (fa + 1).frames == (a + 1).frames
+        assert (fa - 3).frames == (a - 3).frames
+        assert (fa + b).frames == (a + b).frames
+
+    def test_other_framerate(self, fr):
+        tc = CTimecode(start_seconds=42.5, framerate=fr)
+        fast = FastTimecode.from_ctimecode(tc)
+        for target in (25, 'ms', 29.97):
+            assert (
+                fast.return_in_other_framerate(target).frames
+                == tc.return_in_other_framerate(target).frames
+            )
+
+
+class TestValueSemantics:
+    def test_immutable_and_slotted(self):
+        fast = FastTimecode(10, 25)
+        with pytest.raises(AttributeError):
+            fast._frame_number = 3
+        assert not hasattr(fast, '__dict__')
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            FastTimecode(-1, 25)
+        with pytest.raises(TypeError):
+            FastTimecode(1.5, 25)
+        with pytest.raises(ValueError):
+            FastTimecode(0, 25) - 1
+
+    def test_cross_framerate_arithmetic_raises(self):
+        with pytest.raises(CTimecodeError):
+            FastTimecode(1, 25) + FastTimecode(1, 30)
+        with pytest.raises(CTimecodeError):
+            FastTimecode(1, 25) + 1.5
+
+    def test_comparisons(self):
+        a, b = FastTimecode(10, 25), FastTimecode(11, 25)
+        assert a < b <= b and b > a >= a
+        assert a != b
+        assert FastTimecode(25, 25) == FastTimecode(1000, 'ms')
+        assert FastTimecode(25, 25) == CTimecode(start_seconds=1, framerate=25)
+        assert CTimecode(start_seconds=1, framerate=25) == FastTimecode(25, 25)
+        assert CTimecode(start_seconds=2, framerate=25) > FastTimecode(25, 25)
+        assert FastTimecode(25, 25) < 1001
+        assert FastTimecode(25, 25) == FastTimecode(25, 25)
+
+    def test_hash_matches_ctimecode(self):
+        tc = CTimecode(start_seconds=3, framerate=25)
+        fast = FastTimecode.from_ctimecode(tc)
+        assert hash(fast) == hash(tc)
+        assert {tc: 'x'}[fast] == 'x'
+
+    def test_pickle(self):
+        fast = FastTimecode(1234, 29.97)
+        assert pickle.loads(pickle.dumps(fast)) == fast
@@ -0,0 +1,192 @@
+"""Tests for lazy quarter-frame parameter sources."""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+
+from cuemsutils.log import Logger
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.CTimecodeTimer import CTimecodeTimer, _State
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.ParamSource import (
+    ArrayParams,
+    CallableParams,
+    GeneratorParams,
+    NotBufferedError,
+    as_param_source,
+)
+from cuemsutils.tools.TimecodeClock import TimecodeClock
+
+
+def _run(timer: CTimecodeTimer, timeout: float = 2.0) -> None:
+    timer._qf_interval = 0.001
+    timer.start()
+    deadline = time.monotonic() + timeout
+    while timer._state != _State.EXHAUSTED and time.monotonic() < deadline:
+        time.sleep(0.0005)
+
+
+class TestSources:
+    def test_callable(self):
+        src = CallableParams(lambda i: i * 2, length=3)
+        assert [src[i] for i in range(3)] == [(0,), (2,), (4,)]
+        assert len(src) == 3
+        assert src.exhausted(3) and not src.exhausted(2)
+        with pytest.raises(IndexError):
+            src[3]
+        with pytest.raises(IndexError):
+            src[-1]
+
+    def test_callable_signals_end_with_index_error(self):
+        def fn(i):
+            if i >= 2:
+                raise IndexError(i)
+            return (i, "x")
+
+        src = CallableParams(fn)
+        assert src[1] == (1, "x")
+        assert src.exhausted(2)
+
+    def test_callable_runs_once_per_index(self):
+        seen: list[int] = []
+
+        def fn(i):
+            seen.append(i)
+            if i == 1:
+                raise RuntimeError("bad item")
+            return i
+
+        src = CallableParams(fn)
+        assert not src.exhausted(0)
+        assert src[0] == (0,)
+        assert not src.exhausted(1)
+        with pytest.raises(RuntimeError):
+            src[1]
+        assert seen == [0, 1]
+
+    def test_array_1d_and_2d(self):
+        one = ArrayParams(np.linspace(0, 1, 5))
+        assert one[4] == (1.0,)
+        assert type(one[0][0]) is float
+        two = ArrayParams(np.arange(6).reshape(3, 2))
+        assert two[1] == (2, 3)
+        assert two.exhausted(3)
+        with pytest.raises(ValueError):
+            ArrayParams(np.zeros((2, 2, 2)))
+
+    def test_generator_forward_and_window(self):
+        src = GeneratorParams(iter(range(100)), window=4)
+        assert src[0] == (0,)
+        assert src[10] == (10,)  # forward seek consumes
+        assert src[8] == (8,)  # still in the window
+        with pytest.raises(NotBufferedError):
+            src[5]
+        assert not src.exhausted(5)
+        assert not src.exhausted(99)
+        assert src.exhausted(100)
+        with pytest.raises(IndexError):
+            src[150]
+
+    def test_generator_memory_is_bounded(self):
+        src = GeneratorParams((i for i in range(10_000)), window=8)
+        for i in range(10_000):
+            src[i]
+        assert len(src._buffer) == 8
+
+    def test_as_param_source(self):
+        assert as_param_source(None) is None
+        assert as_param_source([]) is None
+        assert as_param_source([[1, 2]]) == ((1, 2),)
+        assert as_param_source(np.array([])) is None
+        assert isinstance(as_param_source(np.ones(3)), ArrayParams)
+        assert isinstance(as_param_source(lambda i: i), CallableParams)
+        assert isinstance(as_param_source(x for x in ()), GeneratorParams)
+        src = CallableParams(str, 1)
+        assert as_param_source(src) is src
+
+
+class TestTimerWithSources:
+    def test_generator_params(self):
+        calls: list[int] = []
+        timer = CTimecodeTimer(CTimecode(framerate=25), params=(i for i in range(5)))
+        timer.callback = calls.append
+        _run(timer)
+        assert calls == [0, 1, 2, 3, 4]
+        assert timer._state == _State.EXHAUSTED
+
+    def test_callable_params(self):
+        calls: list[tuple] = []
+        timer = CTimecodeTimer(
+            CTimecode(framerate=25), params=CallableParams(lambda i: (i, i * i), 4)
+        )
+        timer.callback = lambda *a: calls.append(a)
+        _run(timer)
+        assert calls == [(0, 0), (1, 1), (2, 4), (3, 9)]
+
+    def test_array_params(self):
+        calls: list[float] = []
+        timer = CTimecodeTimer(CTimecode(framerate=25), params=np.linspace(0, 1, 3))
+        timer.callback = calls.append
+        _run(timer)
+        assert calls == [0.0, 0.5, 1.0]
+
+    def test_long_callable_seeks_without_materializing(self):
+        # A ten-minute fade at 'ms' is 2.4 million quarter-frames
+        clock = TimecodeClock('ms')
+        qfs = 4 * 1000 * 600
+        calls: list[int] = []
+        timer = CTimecodeTimer(
+            clock, params=CallableParams(lambda i: i, qfs),
+            start_timecode=FastTimecode(0, 'ms'),
+        )
+        timer._qf_interval = 0.001
+        timer.callback = calls.append
+        clock.seek(300_000)  # 5 minutes in
+        timer.start()
+        deadline = time.monotonic() + 2.0
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.0005)
+        clock.seek(600_000)
+        deadline = time.monotonic() + 2.0
+        while timer._state != _State.EXHAUSTED and time.monotonic() < deadline:
+            time.sleep(0.0005)
+        assert calls[0] == 1_200_000
+        assert timer._state == _State.EXHAUSTED
+
+    def test_generator_survives_seek_back_past_window(self, monkeypatch):
+        warnings: list[str] = []
+        exceptions: list[str] = []
+        monkeypatch.setattr(Logger, "warning", lambda message, **kw: warnings.append(message))
+        monkeypatch.setattr(Logger, "exception", lambda message, **kw: exceptions.append(message))
+        clock = TimecodeClock(25, frame_number=25)
+        calls: list[int] = []
+        timer = CTimecodeTimer(clock, params=GeneratorParams(iter(range(1000)), window=4))
+        timer._qf_interval = 0.001
+        timer.callback = calls.append
+        timer.start()
+        deadline = time.monotonic() + 2.0
+        while len(calls) < 10 and time.monotonic() < deadline:
+            time.sleep(0.0005)
+        # A burst longer than the window may already miss before the seek
+        before = len(warnings)
+        clock.seek(0)  # back to items that left the window
+        served = len(calls)
+        deadline = time.monotonic() + 2.0
+        while len(calls) < served + 10 and time.monotonic() < deadline:
+            time.sleep(0.0005)
+        try:
+            assert timer._thread.is_alive()
+            assert timer._state == _State.RUNNING
+            assert len(calls) >= served + 10
+            snap = timer.stats.snapshot()
+            assert snap.errors == 0
+            assert snap.skipped > 1
+            # One warning for the seek, not one per missed quarter-frame
+            assert len(warnings) == before + 1
+            assert "index 0 is no longer buffered" in warnings[-1]
+            assert exceptions == []
+        finally:
+            timer.stop()
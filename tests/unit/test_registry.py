@@ -0,0 +1,145 @@
+"""Tests for the tag/type registries used by the xml parsers and builders."""
+
+from __future__ import annotations
+
+from xml.etree.ElementTree import Element
+
+import pytest
+
+from cuemsutils.cues import AudioCue, FadeCue
+from cuemsutils.cues.Cue import Cue
+from cuemsutils.cues.MediaCue import Media
+from cuemsutils.registry import (
+    BUILDER_REGISTRY,
+    CLASS_REGISTRY,
+    PARSER_REGISTRY,
+    TypeRegistry,
+    register_cue_type,
+)
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.xml.Parsers import (
+    CuemsParser,
+    GenericDict,
+    GenericParser,
+    NoneTypeParser,
+    mediaParser,
+)
+from cuemsutils.xml.XmlBuilder import (
+    AudioCueXmlBuilder,
+    CTimecodeXmlBuilder,
+    GenericCueXmlBuilder,
+    XmlBuilder,
+)
+
+
+@pytest.fixture
+def parser():
+    return CuemsParser({'CuemsScript': {}})
+
+
+class TestTypeRegistry:
+    def test_auto_registration_does_not_override(self):
+        reg = TypeRegistry('test')
+        reg.register('A', int)
+        reg.register('A', str, replace=False)
+        assert reg.get('A') is int
+        reg.register('A', str)
+        assert reg.get('A') is str
+
+    def test_decorator_and_unregister(self):
+        reg = TypeRegistry('test')
+
+        @reg.register('B')
+        class B:
+            pass
+
+        assert 'B' in reg
+        reg.unregister('B')
+        assert reg.get('B') is None
+
+    def test_resolve_walks_mro(self):
+        reg = TypeRegistry('test')
+
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        reg.register('Base', str)
+        assert reg.resolve(Child) is str
+        assert reg.resolve(int, float) is float
+
+
+class TestBuiltinDispatch:
+    def test_classes_registered(self, parser):
+        assert parser.get_class('AudioCue') is AudioCue
+        assert parser.get_class('Media') is Media
+        assert parser.get_class('CTimecode') is CTimecode
+        assert parser.get_class('unknown_tag') is GenericDict
+
+    def test_parsers_registered(self, parser):
+        assert parser.get_parser_class('media') == (mediaParser, 'media')
+        assert parser.get_parser_class('NoneType') == (NoneTypeParser, 'NoneType')
+        assert parser.get_parser_class('unknown_tag') == (GenericParser, 'unknown_tag')
+
+    def test_builders_registered(self):
+        builder = XmlBuilder.__new__(XmlBuilder)
+        assert builder.get_builder_class(AudioCue()) is AudioCueXmlBuilder
+        assert builder.get_builder_class(CTimecode()) is CTimecodeXmlBuilder
+        assert builder.get_builder_class(FadeCue()) is GenericCueXmlBuilder
+        assert builder.get_builder_class({}) is GenericCueXmlBuilder
+
+
+class TestPluginHook:
+    def test_cue_subclass_is_parsed_without_registration(self):
+        class PluginCue(Cue):
+            pass
+
+        try:
+            obj = CuemsParser({'PluginCue': {'name': 'plugged', 'loop': '2'}}).parse()
+            assert isinstance(obj, PluginCue)
+            assert obj['name'] == 'plugged'
+            assert obj['loop'] == 2
+        finally:
+            CLASS_REGISTRY.unregister('PluginCue')
+
+    def test_register_cue_type_with_parser_and_builder(self):
+        class SpecialCue(AudioCue):
+            pass
+
+        class SpecialParser(GenericParser):
+            def parse(self):
+                return SpecialCue({'name': 'from-parser'})
+
+        class SpecialXmlBuilder(GenericCueXmlBuilder):
+            pass
+
+        register_cue_type(
+            SpecialCue, name='special', parser=SpecialParser, builder=SpecialXmlBuilder
+        )
+        try:
+            obj = CuemsParser({'special': {'x': '1'}}).parse()
+            assert isinstance(obj, SpecialCue)
+            builder = XmlBuilder.__new__(XmlBuilder)
+            assert builder.get_builder_class(obj) is SpecialXmlBuilder
+        finally:
+            for name in ('SpecialCue', 'special'):
+                CLASS_REGISTRY.unregister(name)
+            PARSER_REGISTRY.unregister('Special')
+            PARSER_REGISTRY.unregister('special')
+            BUILDER_REGISTRY.unregister('Special')
+            BUILDER_REGISTRY.unregister('SpecialCue')
+
+    def test_unregistered_subclass_uses_ancestor_builder(self):
+        class LoudAudioCue(AudioCue):
+            pass
+
+        try:
+            builder = XmlBuilder.__new__(XmlBuilder)
+            assert builder.get_builder_class(LoudAudioCue()) is AudioCueXmlBuilder
+            root = Element('root')
+            AudioCueXmlBuilder(LoudAudioCue(), xml_tree=root).build()
+            assert root[0].tag == 'LoudAudioCue'
+        finally:
+            CLASS_REGISTRY.unregister('LoudAudioCue')
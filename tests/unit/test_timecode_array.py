@@ -0,0 +1,77 @@
+"""Tests for TimecodeArray — vectorized parity with CTimecode."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cuemsutils.tools.CTimecode import CTimecode, CTimecodeError
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.TimecodeArray import TimecodeArray
+
+FRAMERATES = ['ms', 24, 25, 30, 23.976, 29.97, 59.94]
+FRAME_NUMBERS = [0, 1, 17, 1799, 1800, 1801, 17982, 17983, 107892, 2_160_001]
+SECONDS = [0, 0.02, 0.5, 1, 59.99, 60, 61.5, 600, 3599.96, 86401.2]
+
+
+@pytest.mark.parametrize("fr", FRAMERATES)
+class TestParity:
+    def test_conversions(self, fr):
+        arr = TimecodeArray(FRAME_NUMBERS, fr)
+        tcs = [CTimecode(framerate=fr, frames=n + 1) for n in FRAME_NUMBERS]
+        assert arr.milliseconds_exact().tolist() == [t.milliseconds_exact for t in tcs]
+        assert arr.milliseconds_rounded().tolist() == [t.milliseconds_rounded for t in tcs]
+        assert arr.to_strings() == [str(t) for t in tcs]
+        assert arr.hmsf().tolist() == [list(t.frames_to_tc(t.frames, skip_rollover=True)) for t in tcs]
+        assert arr.seconds() == pytest.approx([t.milliseconds_exact / 1000 for t in tcs])
+
+    def test_from_seconds(self, fr):
+        arr = TimecodeArray.from_seconds(SECONDS, fr)
+        expected = [CTimecode(start_seconds=s, framerate=fr).frame_number for s in SECONDS]
+        assert arr.frame_numbers.tolist() == expected
+
+    def test_from_milliseconds(self, fr):
+        arr = TimecodeArray.from_milliseconds([0, 20, 1500], fr)
+        assert arr == TimecodeArray.from_seconds([0, 0.02, 1.5], fr)
+
+    def test_other_framerate(self, fr):
+        arr = TimecodeArray.from_seconds(SECONDS, fr)
+        for target in (25, 'ms', 29.97):
+            expected = [
+                CTimecode(framerate=fr, frames=n + 1).return_in_other_framerate(target).frame_number
+                for n in arr.frame_numbers.tolist()
+            ]
+            assert arr.return_in_other_framerate(target).frame_numbers.tolist() == expected
+
+
+class TestContainer:
+    def test_read_only(self):
+        arr = TimecodeArray([1, 2, 3], 25)
+        with pytest.raises(ValueError):
+            arr.frame_numbers[0] = 5
+
+    def test_indexing_and_iteration(self):
+        arr = TimecodeArray([1, 2, 3], 25)
+        assert len(arr) == 3
+        assert arr[1] == FastTimecode(2, 25)
+        assert isinstance(arr[1:], TimecodeArray)
+        assert arr[1:].frame_numbers.tolist() == [2, 3]
+        assert [t.frame_number for t in arr] == [1, 2, 3]
+
+    def test_from_timecodes(self):
+        tcs = [CTimecode(start_seconds=s, framerate=25) for s in (1, 2, 3)]
+        arr = TimecodeArray.from_timecodes(tcs)
+        assert arr.frame_numbers.tolist() == [25, 50, 75]
+        assert [t.frames for t in arr.to_ctimecodes()] == [t.frames for t in tcs]
+
+    def test_from_timecodes_rejects_mixed_framerates(self):
+        with pytest.raises(CTimecodeError):
+            TimecodeArray.from_timecodes([CTimecode(framerate=25), CTimecode(framerate=30)])
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            TimecodeArray([-1], 25)
+        with pytest.raises(ValueError):
+            TimecodeArray(np.zeros((2, 2)), 25)
+        with pytest.raises(ValueError):
+            TimecodeArray.from_seconds([-0.5], 25)
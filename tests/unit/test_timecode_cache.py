@@ -0,0 +1,97 @@
+"""Tests for the CTimecode string-parsing flyweight cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from cuemsutils.cues import FadeCue
+from cuemsutils.cues.MediaCue import Region
+from cuemsutils.helpers import format_timecode
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.TimecodeCache import (
+    TIMECODE_CACHE_SIZE,
+    cache_clear,
+    cache_info,
+    parse_timecode,
+    parsed_timecode,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cache_clear()
+    yield
+    cache_clear()
+
+
+class TestParseTimecode:
+    @pytest.mark.parametrize("value, fr", [
+        ("00:00:00.000", "ms"),
+        ("00:01:02.345", "ms"),
+        ("01:02:03:04", 25),
+        ("00:00:01.500", 25),
+        ("00:10:00;00", 29.97),
+    ])
+    def test_equivalent_to_constructor(self, value, fr):
+        expected = CTimecode(value, framerate=fr)
+        got = parse_timecode(value, fr)
+        assert type(got) is CTimecode
+        assert vars(got) == vars(expected)
+        assert str(got) == str(expected)
+
+    def test_returns_independent_objects(self):
+        a = parse_timecode("00:00:05.000")
+        b = parse_timecode("00:00:05.000")
+        assert a is not b
+        a.frames = 1
+        assert b.milliseconds_rounded == 5000
+        assert parse_timecode("00:00:05.000").milliseconds_rounded == 5000
+
+    def test_parsed_value_is_shared_and_immutable(self):
+        v = parsed_timecode("00:00:05.000")
+        assert isinstance(v, FastTimecode)
+        assert parsed_timecode("00:00:05.000") is v
+        assert v.milliseconds_rounded == 5000
+
+    def test_invalid_string_is_not_cached(self):
+        with pytest.raises(Exception):
+            parse_timecode("garbage")
+        assert cache_info().currsize == 0
+
+    def test_framerate_types_are_distinct_keys(self):
+        parse_timecode("00:00:01:00", 25)
+        parse_timecode("00:00:01:00", 25.0)
+        assert cache_info().currsize == 2
+
+
+class TestCounters:
+    def test_hits_and_misses(self):
+        for _ in range(3):
+            parse_timecode("00:00:02.000")
+        parse_timecode("00:00:03.000")
+        info = cache_info()
+        assert info.hits == 2
+        assert info.misses == 2
+        assert info.maxsize == TIMECODE_CACHE_SIZE
+
+    def test_lru_bound(self):
+        for i in range(TIMECODE_CACHE_SIZE + 10):
+            parse_timecode(f"00:00:{i // 1000:02d}.{i % 1000:03d}")
+        assert cache_info().currsize == TIMECODE_CACHE_SIZE
+
+
+class TestCallSites:
+    def test_format_timecode_uses_cache(self):
+        format_timecode("00:00:07.000")
+        format_timecode({"CTimecode": "00:00:07.000"})
+        assert cache_info().hits == 1
+
+    def test_region_and_fade_setters_use_cache(self):
+        r = Region({"id": 0, "in_time": "00:00:01.000", "out_time": "00:00:01.000"})
+        assert r.in_time == r.out_time
+        assert r.in_time is not r.out_time
+        fade = FadeCue()
+        fade.duration = "00:00:01.000"
+        assert fade.duration == r.in_time
+        assert cache_info().hits >= 2
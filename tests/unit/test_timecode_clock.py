@@ -0,0 +1,112 @@
+"""Tests for TimecodeClock — shared running timecode position."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.CTimecodeTimer import CTimecodeTimer
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.TimecodeClock import ClockSnapshot, TimecodeClock
+
+
+class TestAdvance:
+    def test_advance_in_place_matches_ctimecode_add(self):
+        clock = TimecodeClock(25)
+        tc = CTimecode(framerate=25)
+        for _ in range(30):
+            clock.advance()
+            tc = tc + 1
+        assert clock.frames == tc.frames
+        assert clock.milliseconds_exact == tc.milliseconds_exact
+        assert str(clock) == str(tc)
+
+    def test_advance_returns_new_position(self):
+        clock = TimecodeClock(25, 10)
+        assert clock.advance(5) == 15
+        assert clock.advance(-3) == 12
+
+    def test_advance_before_zero_raises(self):
+        clock = TimecodeClock(25, 1)
+        with pytest.raises(ValueError):
+            clock.advance(-2)
+        assert clock.frame_number == 1
+
+    def test_concurrent_advances_are_not_lost(self):
+        clock = TimecodeClock('ms')
+
+        def work():
+            for _ in range(2000):
+                clock.advance()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert clock.frame_number == 8000
+
+
+class TestSeek:
+    def test_seek_accepts_frames_and_timecodes(self):
+        clock = TimecodeClock(25)
+        clock.seek(50)
+        assert clock.milliseconds_rounded == 2000
+        clock.seek(CTimecode(start_seconds=4, framerate=25))
+        assert clock.frame_number == 100
+        clock.seek(FastTimecode(1000, 'ms'))
+        assert clock.frame_number == 25
+        with pytest.raises(TypeError):
+            clock.seek('00:00:01:00')
+
+    def test_seek_notifies_listeners(self):
+        clock = TimecodeClock(25, 10)
+        seen = []
+
+        def listener(before, after):
+            seen.append((before, after))
+
+        clock.add_seek_listener(listener)
+        clock.seek(100)
+        clock.advance()
+        assert seen == [(ClockSnapshot(10, 400.0, 0), ClockSnapshot(100, 4000.0, 1))]
+        clock.remove_seek_listener(listener)
+        clock.seek(0)
+        assert len(seen) == 1
+
+    def test_failing_listener_does_not_break_seek(self):
+        clock = TimecodeClock(25)
+
+        def bad(before, after):
+            raise RuntimeError("boom")
+
+        clock.add_seek_listener(bad)
+        clock.seek(5)
+        assert clock.frame_number == 5
+
+    def test_snapshot_is_consistent(self):
+        clock = TimecodeClock(25, 3)
+        clock.seek(7)
+        snap = clock.snapshot()
+        assert snap.frame_number == 7
+        assert snap.milliseconds_exact == 280.0
+        assert snap.seek_count == 1
+        assert clock.timecode() == FastTimecode(7, 25)
+
+
+class TestTimerBinding:
+    def test_timer_reads_clock(self):
+        clock = TimecodeClock(25)
+        timer = CTimecodeTimer(clock, params=[(i,) for i in range(5)])
+        timer._qf_interval = 0.001
+        calls = []
+        timer.callback = calls.append
+        timer.start()
+        deadline = time.monotonic() + 2
+        while len(calls) < 5 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        timer.stop()
+        assert calls == [0, 1, 2, 3, 4]
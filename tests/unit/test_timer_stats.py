@@ -0,0 +1,166 @@
+"""Tests for TimerStats — timer lateness/duration instrumentation."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.CTimecodeTimer import CatchUp, CTimecodeTimer, _State
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.TimecodeClock import TimecodeClock
+from cuemsutils.tools.TimerStats import (
+    LATENCY_BUCKETS,
+    LatencyHistogram,
+    TimerStats,
+    TimerStatsSnapshot,
+)
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.0005)
+
+
+class TestHistogram:
+    def test_buckets(self):
+        h = LatencyHistogram()
+        for v in (0.0, 40e-6, 50e-6, 0.003, 2.0, -1.0):
+            h.record(v)
+        snap = h.snapshot()
+        assert snap.count == 6
+        assert snap.counts[0] == 4  # <= 50 µs, negatives clamp to 0
+        assert snap.counts[LATENCY_BUCKETS.index(5e-3)] == 1
+        assert snap.counts[-1] == 1
+        assert snap.max == 2.0
+        assert snap.mean == pytest.approx(2.00309 / 6)
+
+    def test_quantile(self):
+        h = LatencyHistogram()
+        for _ in range(99):
+            h.record(0.0008)
+        h.record(3.0)
+        snap = h.snapshot()
+        assert snap.quantile(0.5) == 1e-3
+        assert snap.quantile(0.99) == 1e-3
+        assert snap.quantile(1.0) == 3.0
+        with pytest.raises(ValueError):
+            snap.quantile(2)
+
+    def test_empty(self):
+        snap = LatencyHistogram().snapshot()
+        assert snap.mean == 0.0
+        assert snap.quantile(0.9) == 0.0
+
+    def test_snapshot_is_a_copy(self):
+        stats = TimerStats()
+        stats.record_dispatch(0.001, 0.0001)
+        snap = stats.snapshot()
+        stats.record_dispatch(0.001, 0.0001)
+        stats.record_skipped(3)
+        assert isinstance(snap, TimerStatsSnapshot)
+        assert snap.dispatched == 1
+        assert snap.lateness.count == 1
+        assert snap.skipped == 0
+        stats.reset()
+        assert stats.snapshot().dispatched == 0
+
+
+class TestTimerInstrumentation:
+    def test_dispatch_and_duration_recorded(self):
+        timer = CTimecodeTimer(CTimecode(framerate=25), params=[(i,) for i in range(4)])
+        timer._qf_interval = 0.002
+        timer.callback = lambda i: time.sleep(0.001)
+        timer.start()
+        _wait_for(lambda: timer._state == _State.EXHAUSTED)
+        snap = timer.stats.snapshot()
+        assert snap.dispatched == 4
+        assert snap.callback_duration.count == 4
+        assert snap.callback_duration.mean >= 0.001
+        assert snap.lateness.max == pytest.approx(timer.max_lateness)
+        assert snap.errors == 0
+
+    def test_errors_counted(self):
+        timer = CTimecodeTimer(CTimecode(framerate=25), params=[(i,) for i in range(3)])
+        timer._qf_interval = 0.001
+        timer.callback = lambda i: 1 / 0
+        timer.start()
+        _wait_for(lambda: timer._state == _State.EXHAUSTED)
+        snap = timer.stats.snapshot()
+        assert snap.errors == 3
+        assert snap.dispatched == 3
+
+    def test_seek_skips_counted(self):
+        clock = TimecodeClock(25)
+        calls: list[int] = []
+
+        def cb(i):
+            calls.append(i)
+            if i == 0:
+                clock.seek(10)  # before the next tick, so nothing is late
+
+        timer = CTimecodeTimer(
+            clock, params=[(i,) for i in range(100)],
+            start_timecode=FastTimecode(0, 25), catch_up=CatchUp.STRICT,
+        )
+        timer._qf_interval = 0.001
+        timer.callback = cb
+        timer.start()
+        _wait_for(lambda: 40 in calls)
+        timer.stop()
+        assert calls[:2] == [0, 40]
+        assert timer.stats.snapshot().skipped == 39
+
+    @staticmethod
+    def _late_seek(catch_up: CatchUp, callback) -> CTimecodeTimer:
+        """Seek 40 QFs ahead with the next tick 3.5 QFs late, stepped by hand."""
+        clock = TimecodeClock(25)
+        timer = CTimecodeTimer(
+            clock, params=[(i,) for i in range(100)],
+            start_timecode=FastTimecode(0, 25), catch_up=catch_up,
+        )
+        timer.callback = callback
+        timer._state = _State.RUNNING
+        timer._begin(0.0)
+        timer._step(0.001)
+        clock.seek(10)
+        timer._step(0.0365)
+        return timer
+
+    def test_late_seek_strict_replays_late_ticks(self):
+        calls: list[int] = []
+        timer = self._late_seek(CatchUp.STRICT, calls.append)
+        assert calls == [0, 38, 39, 40]
+        snap = timer.stats.snapshot()
+        assert snap.skipped == 37
+        assert snap.coalesced == 0
+
+    def test_late_seek_latest_coalesces_late_ticks(self):
+        calls: list[int] = []
+        timer = self._late_seek(CatchUp.LATEST, calls.append)
+        assert calls == [0, 40]
+        snap = timer.stats.snapshot()
+        assert snap.skipped == 37
+        assert snap.coalesced == 2
+
+    def test_late_seek_batch_passes_late_ticks_together(self):
+        batches: list[list[tuple]] = []
+        timer = self._late_seek(CatchUp.BATCH, batches.append)
+        assert batches == [[(0,)], [(38,), (39,), (40,)]]
+        snap = timer.stats.snapshot()
+        assert snap.skipped == 37
+        assert snap.coalesced == 2
+
+    def test_stats_survive_restart(self):
+        timer = CTimecodeTimer(CTimecode(framerate=25))
+        timer._qf_interval = 0.001
+        timer.start()
+        _wait_for(lambda: timer.stats.dispatched >= 2)
+        timer.stop()
+        count = timer.stats.dispatched
+        timer.start()
+        _wait_for(lambda: timer.stats.dispatched >= count + 2)
+        timer.stop()
+        assert timer.stats.dispatched >= count + 2
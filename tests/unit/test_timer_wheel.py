@@ -0,0 +1,207 @@
+"""Tests for TimerWheel — many quarter-frame timers on one thread."""
+
+from __future__ import annotations
+
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.CTimecodeTimer import _State
+from cuemsutils.tools.FastTimecode import FastTimecode
+from cuemsutils.tools.TimecodeClock import TimecodeClock
+from cuemsutils.tools.TimerWheel import TimerWheel, WheelTimer
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.0005)
+
+
+def _fast(timer: WheelTimer) -> WheelTimer:
+    timer._qf_interval = 0.001
+    return timer
+
+
+@pytest.fixture
+def wheel():
+    return TimerWheel(CTimecode(framerate=25))
+
+
+class TestMultiplexing:
+    def test_many_timers_one_thread(self, wheel):
+        calls: dict[int, list[int]] = {}
+        threads: set[int] = set()
+        timers = []
+        before = threading.active_count()
+        for n in range(20):
+            calls[n] = []
+            timer = _fast(wheel.timer(params=[(i,) for i in range(4)]))
+
+            def cb(i, n=n):
+                calls[n].append(i)
+                threads.add(threading.get_ident())
+
+            timer.callback = cb
+            timers.append(timer)
+        for timer in timers:
+            timer.start()
+        assert threading.active_count() <= before + 1
+        _wait_for(lambda: all(t._state == _State.EXHAUSTED for t in timers))
+        assert all(c == [0, 1, 2, 3] for c in calls.values())
+        assert len(threads) == 1
+        _wait_for(lambda w=wheel: w._thread is None)
+        assert wheel._thread is None
+        assert len(wheel) == 0
+
+    def test_len_counts_running(self, wheel):
+        a = _fast(wheel.timer())
+        b = _fast(wheel.timer())
+        a.start()
+        b.start()
+        assert len(wheel) == 2
+        a.stop()
+        assert len(wheel) == 1
+        b.stop()
+        assert len(wheel) == 0
+
+    def test_is_a_ctimecode_timer(self, wheel):
+        timer = wheel.timer(params=[[1, 2]])
+        assert timer._params == ((1, 2),)
+        assert timer._qf_interval == pytest.approx(0.01)
+        assert timer._state == _State.IDLE
+
+
+class TestLifecycle:
+    def test_stop_halts_and_restart_resumes(self, wheel):
+        calls: list[bool] = []
+        timer = _fast(wheel.timer())
+        timer.callback = lambda: calls.append(True)
+        timer.start()
+        _wait_for(lambda: len(calls) >= 3)
+        timer.stop()
+        assert timer._state == _State.STOPPED
+        count = len(calls)
+        time.sleep(0.010)
+        assert len(calls) == count
+        timer.start()
+        _wait_for(lambda: len(calls) >= count + 3)
+        timer.stop()
+        assert len(calls) >= count + 3
+
+    def test_double_start_schedules_once(self, wheel):
+        timer = _fast(wheel.timer())
+        timer.start()
+        timer.start()
+        assert len(wheel) == 1
+        timer.stop()
+
+    def test_start_on_exhausted_is_noop(self, wheel):
+        timer = _fast(wheel.timer(params=[(1,)]))
+        timer.start()
+        _wait_for(lambda: timer._state == _State.EXHAUSTED)
+        timer.start()
+        assert timer._state == _State.EXHAUSTED
+        assert len(wheel) == 0
+
+    def test_restart_during_step_begins_on_wheel_thread(self, wheel):
+        in_step = threading.Event()
+        release = threading.Event()
+        calls: list[bool] = []
+        begun_on: list[str] = []
+        timer = _fast(wheel.timer())
+        begin = timer._begin
+
+        def record_begin(now):
+            begun_on.append(threading.current_thread().name)
+            begin(now)
+
+        def cb():
+            calls.append(True)
+            in_step.set()
+            release.wait(1.0)
+
+        timer._begin = record_begin
+        timer.callback = cb
+        timer.start()
+        assert in_step.wait(1.0)
+        # The wheel thread is inside the timer's _step
+        timer.stop()
+        timer.start()
+        assert len(begun_on) == 1
+        release.set()
+        _wait_for(lambda: len(calls) >= 3)
+        timer.stop()
+        assert begun_on == ['TimerWheel', 'TimerWheel']
+
+    def test_callback_can_stop_its_own_timer(self, wheel):
+        calls: list[bool] = []
+        timer = _fast(wheel.timer())
+
+        def cb():
+            calls.append(True)
+            timer.stop()
+
+        timer.callback = cb
+        timer.start()
+        _wait_for(lambda: timer._state == _State.STOPPED)
+        time.sleep(0.005)
+        assert calls == [True]
+
+    def test_callback_exception_does_not_halt_others(self, wheel):
+        good: list[int] = []
+        bad = _fast(wheel.timer(params=[(i,) for i in range(4)]))
+        bad.callback = lambda i: 1 / 0
+        ok = _fast(wheel.timer(params=[(i,) for i in range(4)]))
+        ok.callback = good.append
+        bad.start()
+        ok.start()
+        _wait_for(lambda: ok._state == bad._state == _State.EXHAUSTED)
+        assert good == [0, 1, 2, 3]
+        assert bad._state == _State.EXHAUSTED
+
+
+class TestShared:
+    def test_one_wheel_per_clock(self):
+        clock_a = TimecodeClock(25)
+        clock_b = TimecodeClock(25)
+        assert TimerWheel.shared(clock_a) is TimerWheel.shared(clock_a)
+        assert TimerWheel.shared(clock_a) is not TimerWheel.shared(clock_b)
+
+    def test_shared_wheel_does_not_keep_clock_alive(self):
+        clock = TimecodeClock(25)
+        wheel = TimerWheel.shared(clock)
+        timer = _fast(wheel.timer())
+        stats = timer.stats
+        timer.start()
+        _wait_for(lambda: stats.dispatched >= 2)
+        timer.stop()
+        # The stopped entry leaves the heap when the wheel thread drains it
+        _wait_for(lambda w=wheel: w._thread is None)
+        ref = weakref.ref(clock)
+        shared = len(TimerWheel._shared)
+        del clock, timer, wheel
+        gc.collect()
+        assert ref() is None
+        assert len(TimerWheel._shared) == shared - 1
+
+    def test_timecode_indexed_subscription(self):
+        clock = TimecodeClock(25)
+        calls: list[int] = []
+        timer = _fast(TimerWheel.shared(clock).timer(
+            params=[(i,) for i in range(400)],
+            start_timecode=FastTimecode(0, 25),
+        ))
+        timer.callback = calls.append
+        clock.seek(50)
+        timer.start()
+        _wait_for(lambda: calls)
+        clock.seek(10)
+        _wait_for(lambda: any(c < 200 for c in calls))
+        timer.stop()
+        assert calls[0] == 200
+        assert [c for c in calls if c < 200][0] == 40
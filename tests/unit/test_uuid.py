@@ -0,0 +1,79 @@
+"""Tests for Uuid interning, validity check and compact bytes form."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from uuid import UUID, uuid4
+
+import pytest
+
+from cuemsutils.tools.Uuid import Uuid, is_valid_uuid
+
+VALID = '2d1f8a3e-9b7c-4e5d-8a6f-1c2b3d4e5f60'
+
+
+class TestInterning:
+    def test_equal_strings_share_instance(self):
+        assert Uuid(VALID) is Uuid(VALID)
+
+    def test_wrapping_uuid_returns_same_instance(self):
+        u = Uuid(VALID)
+        assert Uuid(u) is u
+
+    def test_new_uuids_are_distinct(self):
+        assert Uuid() is not Uuid()
+        assert Uuid() != Uuid()
+
+    def test_invalid_is_not_pooled(self):
+        with pytest.raises(ValueError, match='is not valid'):
+            Uuid('not-a-uuid')
+        with pytest.raises(ValueError):
+            Uuid('not-a-uuid')
+
+    def test_copy_and_pickle_keep_identity(self):
+        u = Uuid(VALID)
+        assert copy.copy(u) is u
+        assert copy.deepcopy({'id': u})['id'] is u
+        assert pickle.loads(pickle.dumps(u)) is u
+
+
+class TestSemantics:
+    def test_slots(self):
+        u = Uuid(VALID)
+        assert not hasattr(u, '__dict__')
+        with pytest.raises(AttributeError):
+            u.other = 1
+
+    def test_equality_and_hash_against_str(self):
+        u = Uuid(VALID)
+        assert u == VALID
+        assert hash(u) == hash(VALID)
+        assert {VALID: 1}[u] == 1
+        assert u != 'something else'
+        assert u != 42
+
+    def test_is_valid_uuid(self):
+        assert is_valid_uuid(VALID)
+        assert is_valid_uuid(str(uuid4()))
+        assert not is_valid_uuid(VALID.upper())
+        assert not is_valid_uuid('1.5')
+        assert not is_valid_uuid(None)
+
+
+class TestCompactForm:
+    def test_round_trip(self):
+        u = Uuid(VALID)
+        b = u.to_bytes()
+        assert isinstance(b, bytes)
+        assert len(b) == 16
+        assert b == UUID(VALID).bytes
+        assert Uuid.from_bytes(b) is u
+
+    def test_from_bytes_rejects_wrong_length(self):
+        with pytest.raises(ValueError, match='16'):
+            Uuid.from_bytes(b'\x00' * 15)
+
+    def test_from_bytes_rejects_non_uuid4(self):
+        with pytest.raises(ValueError):
+            Uuid.from_bytes(b'\x00' * 16)
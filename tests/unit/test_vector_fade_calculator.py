@@ -0,0 +1,99 @@
+"""Parity tests: VectorFadeCalculator against FadeCalculator."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cuemsutils.tools.CTimecode import CTimecode
+from cuemsutils.tools.FadeCalculator import FadeCalculator
+from cuemsutils.tools.VectorFadeCalculator import VectorFadeCalculator
+from tests.unit.test_fade_calculator import CURVE_REGISTRY, CurveSpec
+
+EXTRA_CASES = [
+    ("linear", dict(length=5, start_value=0.0, end_value=1.0)),
+    ("linear", dict(length=51, start_value=10.0, end_value=20.0)),
+    ("linear", dict(length=2, start_value=0.0, end_value=1.0)),
+    ("linear", dict(length=10_000, start_value=0.0, end_value=1.0)),
+    ("linear", dict(length=20, start_value=0.5, end_value=0.5)),
+    ("sigmoid", dict(length=101, start_value=0.0, end_value=1.0, inflec=50.0, growth=2.0)),
+    ("sigmoid", dict(length=101, start_value=0.0, end_value=1.0, inflec=50.0, growth=8.0)),
+    ("sigmoid", dict(length=101, start_value=0.5, end_value=0.5, inflec=50.0, growth=4.0)),
+    ("sigmoid", dict(length=1, start_value=0.25, end_value=1.0, inflec=1.0, growth=4.0)),
+]
+
+
+@pytest.mark.parametrize("spec", CURVE_REGISTRY, ids=lambda s: s.id)
+def test_registry_parity(spec: CurveSpec):
+    expected = getattr(FadeCalculator, spec.method)(**spec.kwargs)
+    got = getattr(VectorFadeCalculator, spec.method)(**spec.kwargs)
+    assert isinstance(got, np.ndarray)
+    assert got.tolist() == pytest.approx(expected, rel=1e-15, abs=1e-15)
+
+
+@pytest.mark.parametrize("method,kwargs", EXTRA_CASES)
+def test_case_parity(method, kwargs):
+    expected = getattr(FadeCalculator, method)(**kwargs)
+    got = getattr(VectorFadeCalculator, method)(**kwargs)
+    assert got.tolist() == pytest.approx(expected, rel=1e-15, abs=1e-15)
+
+
+def test_length_1_is_rejected():
+    with pytest.raises(ZeroDivisionError):
+        VectorFadeCalculator.linear(length=1, start_value=0.0, end_value=1.0)
+
+
+def test_helpers_parity():
+    assert VectorFadeCalculator._rescale([0, 50, 100], 0, 100, 0.0, 1.0).tolist() == (
+        FadeCalculator._rescale([0, 50, 100], 0, 100, 0.0, 1.0)
+    )
+    x = list(range(100))
+    for n in (0, 1, 2, 5, 7, 100, 250):
+        assert VectorFadeCalculator._sample_values(x, n).tolist() == FadeCalculator._sample_values(x, n)
+    with pytest.raises(ValueError):
+        VectorFadeCalculator._sample_values(x, -1)
+
+
+@pytest.mark.parametrize("framerate", ["ms", 25, 29.97])
+@pytest.mark.parametrize("start,end", [
+    ("00:00:00.000", "00:00:00.100"),
+    ("00:00:01.230", "00:00:05.000"),
+    ("00:59:58.000", "01:00:02.010"),
+])
+def test_timeline_parity(framerate, start, end):
+    s = CTimecode(start_timecode=start, framerate="ms")
+    e = CTimecode(start_timecode=end, framerate="ms")
+    expected = FadeCalculator.calculate_timeline(s, e, framerate=framerate)
+    assert VectorFadeCalculator.calculate_timeline(s, e, framerate=framerate) == expected
+    offsets = VectorFadeCalculator.timeline_offsets(s, e)
+    assert len(offsets) == len(expected)
+    assert offsets[0] == 0
+    assert offsets[-1] == e.milliseconds_rounded - s.milliseconds_rounded
+
+
+def test_timeline_validation():
+    t = CTimecode(start_timecode="00:00:00.100", framerate="ms")
+    with pytest.raises(ValueError):
+        VectorFadeCalculator.timeline_offsets(t, t)
+    with pytest.raises(ValueError):
+        VectorFadeCalculator.timeline_offsets("00:00:00.000", t)
+
+
+def test_calculate():
+    start = CTimecode(start_timecode="00:00:01.000", framerate="ms")
+    end = CTimecode(start_timecode="00:00:01.100", framerate="ms")
+    ms, values = VectorFadeCalculator.calculate(
+        "linear", start_time=start, end_time=end, length=5, start_value=0.0, end_value=1.0
+    )
+    expected = list(FadeCalculator.calculate(
+        "linear", start_time=start, end_time=end, framerate="ms",
+        length=5, start_value=0.0, end_value=1.0,
+    ))
+    assert ms.tolist() == [1000, 1020, 1040, 1060, 1100]
+    assert values.tolist() == [v for _, v in expected]
+    with pytest.raises(ValueError, match="Invalid fade function name"):
+        VectorFadeCalculator.calculate("_range", start_time=start, end_time=end)
+    with pytest.raises(ValueError, match="returned 3 values"):
+        VectorFadeCalculator.calculate(
+            "linear", start_time=start, end_time=end, length=3, start_value=0.0, end_value=1.0
+        )